@@ -0,0 +1,648 @@
+"""
+Synthetic DataGolf payloads with the same shape, field names and value ranges as recorded
+API responses. Every builder is deterministic for a given size so runs are comparable.
+"""
+import random
+
+BOOKS = [
+    "bet365",
+    "betcris",
+    "betmgm",
+    "betonline",
+    "bovada",
+    "caesars",
+    "draftkings",
+    "fanduel",
+    "pinnacle",
+    "pointsbet",
+    "skybet",
+    "unibet",
+]
+MARKETS = ["win", "top_5", "top_10", "top_20", "make_cut"]
+SG_FIELDS = ["sg_putt", "sg_arg", "sg_app", "sg_ott", "sg_t2g", "sg_total"]
+LAST_UPDATED = "2024-04-11 18:05:00 UTC"
+
+
+def _players(rng, size):
+    return [
+        {"dg_id": 10000 + index, "player_name": f"Player{index}, Test"}
+        for index in range(size)
+    ]
+
+
+def _probabilities(rng, size):
+    weights = sorted((rng.paretovariate(1.5) for _ in range(size)), reverse=True)
+    total = sum(weights)
+    return [weight / total for weight in weights]
+
+
+def _predictions(rng, size):
+    rows = []
+    for player, win in zip(_players(rng, size), _probabilities(rng, size)):
+        rows.append(
+            dict(
+                player,
+                am=0,
+                country="USA",
+                sample_size=rng.randint(20, 400),
+                win=round(win, 4),
+                top_5=round(min(1.0, win * 4.2), 4),
+                top_10=round(min(1.0, win * 7.5), 4),
+                top_20=round(min(1.0, win * 13), 4),
+                make_cut=round(min(0.99, 0.3 + win * 20), 4),
+            )
+        )
+    return rows
+
+
+def player_list(rng, size):
+    return [
+        dict(player, amateur=0, country="United States", country_code="USA")
+        for player in _players(rng, size)
+    ]
+
+
+def schedule(rng, size):
+    return {
+        "tour": "pga",
+        "current_season": 2024,
+        "schedule": [
+            {
+                "event_id": index,
+                "event_name": f"Event {index}",
+                "course": f"Course {index}",
+                "course_key": str(index),
+                "location": "Somewhere, USA",
+                "start_date": f"2024-{1 + index % 12:02d}-{1 + index % 28:02d}",
+                "latitude": rng.uniform(25, 45),
+                "longitude": rng.uniform(-120, -70),
+                "winner": "TBD",
+            }
+            for index in range(min(size, 50))
+        ],
+    }
+
+
+def field_updates(rng, size):
+    return {
+        "event_name": "The Masters",
+        "current_round": 1,
+        "last_updated": LAST_UPDATED,
+        "field": [
+            dict(
+                player,
+                am=0,
+                country="USA",
+                course="Augusta National",
+                dk_salary=rng.randrange(6000, 12000, 100),
+                fd_salary=rng.randrange(7000, 13000, 100),
+                yh_salary=rng.randint(10, 60),
+                early_late=rng.randint(0, 1),
+                r1_teetime="8:30am",
+                start_hole=1,
+                unofficial=0,
+            )
+            for player in _players(rng, size)
+        ],
+    }
+
+
+def dg_rankings(rng, size):
+    return {
+        "last_updated": LAST_UPDATED,
+        "notes": "",
+        "rankings": [
+            dict(
+                player,
+                am=0,
+                country="USA",
+                datagolf_rank=index + 1,
+                dg_skill_estimate=round(3 - index * 0.01, 3),
+                owgr_rank=index + rng.randint(1, 20),
+                primary_tour="PGA",
+            )
+            for index, player in enumerate(_players(rng, size))
+        ],
+    }
+
+
+def pre_tournament(rng, size):
+    return {
+        "event_name": "The Masters",
+        "last_updated": LAST_UPDATED,
+        "dead_heats": "yes",
+        "models_available": ["baseline", "baseline_history_fit"],
+        "baseline": _predictions(rng, size),
+        "baseline_history_fit": _predictions(rng, size),
+    }
+
+
+def pre_tournament_archive(rng, size):
+    return dict(pre_tournament(rng, size), event_id=14, year=2023)
+
+
+def decompositions(rng, size):
+    players = []
+    for index, player in enumerate(_players(rng, size)):
+        baseline = 2.5 - index * 0.03 + rng.gauss(0, 0.2)
+        adjustments = {
+            "age": rng.randint(20, 50),
+            "am": 0,
+            "country": "USA",
+            "driving_accuracy_adjustment": round(rng.gauss(0, 0.05), 3),
+            "driving_distance_adjustment": round(rng.gauss(0, 0.05), 3),
+            "strokes_gained_category_adjustment": round(rng.gauss(0, 0.05), 3),
+            "timing_adjustment": round(rng.gauss(0, 0.1), 3),
+            "total_course_history_adjustment": round(rng.gauss(0, 0.1), 3),
+            "total_fit_adjustment": round(rng.gauss(0, 0.1), 3),
+            "sample_size": rng.randint(20, 400),
+        }
+        players.append(
+            dict(
+                player,
+                baseline_pred=round(baseline, 3),
+                final_pred=round(baseline + rng.gauss(0, 0.15), 3),
+                **adjustments,
+            )
+        )
+    return {
+        "event_name": "The Masters",
+        "course_name": "Augusta National",
+        "last_updated": LAST_UPDATED,
+        "players": players,
+    }
+
+
+def skill_ratings(rng, size):
+    return {
+        "last_updated": LAST_UPDATED,
+        "players": [
+            dict(
+                player,
+                driving_acc=round(rng.gauss(0, 0.05), 3),
+                driving_dist=round(rng.gauss(0, 10), 1),
+                **{
+                    field: round(rng.gauss(0, 0.5), 3)
+                    for field in SG_FIELDS
+                    if field != "sg_t2g"
+                },
+            )
+            for player in _players(rng, size)
+        ],
+    }
+
+
+def approach_skill(rng, size):
+    buckets = [
+        "50_100_fw",
+        "100_150_fw",
+        "150_200_fw",
+        "over_200_fw",
+        "under_150_rgh",
+        "over_150_rgh",
+    ]
+    stats = [
+        "gir_rate",
+        "good_shot_rate",
+        "poor_shot_avoid_rate",
+        "proximity_per_shot",
+        "sg_per_shot",
+        "shot_count",
+    ]
+    return {
+        "time_period": "l24",
+        "last_updated": LAST_UPDATED,
+        "data": [
+            dict(
+                player,
+                **{
+                    f"{bucket}_{stat}": round(rng.uniform(0, 1), 3)
+                    for bucket in buckets
+                    for stat in stats
+                },
+            )
+            for player in _players(rng, size)
+        ],
+    }
+
+
+def fantasy_projections(rng, size):
+    projections = []
+    for player in _players(rng, size):
+        salary = rng.randrange(6000, 12000, 100)
+        points = round(salary / 140 + rng.gauss(0, 8), 2)
+        projections.append(
+            dict(
+                player,
+                salary=salary,
+                proj_points_total=points,
+                proj_points_finish=round(points * 0.3, 2),
+                proj_points_scoring=round(points * 0.7, 2),
+                proj_ownership=round(rng.uniform(0, 30), 2),
+                std_dev=round(rng.uniform(15, 30), 2),
+                value=round(points / salary * 1000, 2),
+                site_name_id=f"{player['player_name']} ({player['dg_id']})",
+                r1_teetime="8:30am",
+                early_late_wave=rng.randint(0, 1),
+            )
+        )
+    return {
+        "event_name": "The Masters",
+        "tour": "pga",
+        "site": "draftkings",
+        "slate": "main",
+        "last_updated": LAST_UPDATED,
+        "projections": projections,
+    }
+
+
+def in_play(rng, size):
+    data = []
+    for index, row in enumerate(_predictions(rng, size)):
+        data.append(
+            dict(
+                row,
+                current_pos=f"T{index + 1}",
+                current_score=-10 + index // 5,
+                thru=rng.randint(0, 18),
+                today=rng.randint(-6, 4),
+                round=2,
+                R1=rng.randint(64, 76),
+                R2=None,
+                R3=None,
+                R4=None,
+                end_hole=18,
+            )
+        )
+    return {
+        "info": {
+            "event_name": "The Masters",
+            "current_round": 2,
+            "last_update": LAST_UPDATED,
+            "dead_heat_rules": "no",
+        },
+        "data": data,
+    }
+
+
+def live_strokes_gained(rng, size):
+    return {
+        "event_name": "The Masters",
+        "last_update": LAST_UPDATED,
+        "data": [
+            dict(player, **{field: round(rng.gauss(0, 1), 2) for field in SG_FIELDS})
+            for player in _players(rng, size)
+        ],
+    }
+
+
+def live_tournament_stats(rng, size):
+    return {
+        "event_name": "The Masters",
+        "last_updated": LAST_UPDATED,
+        "stat_display": "value",
+        "stat_round": "event_cumulative",
+        "live_stats": [
+            dict(
+                player,
+                position=f"T{index + 1}",
+                thru=rng.randint(0, 18),
+                total=-10 + index // 5,
+                round=rng.randint(-6, 4),
+                **{field: round(rng.gauss(0, 1), 2) for field in SG_FIELDS},
+            )
+            for index, player in enumerate(_players(rng, size))
+        ],
+    }
+
+
+def live_hole_stats(rng, size):
+    def wave():
+        return {
+            "avg_score": round(rng.uniform(3.7, 4.4), 3),
+            "players_thru": rng.randint(20, 80),
+            "eagles_or_better": rng.randint(0, 2),
+            "birdies": rng.randint(0, 20),
+            "pars": rng.randint(20, 60),
+            "bogeys": rng.randint(0, 20),
+            "doubles_or_worse": rng.randint(0, 5),
+        }
+
+    return {
+        "event_name": "The Masters",
+        "last_update": LAST_UPDATED,
+        "current_round": 2,
+        "courses": [
+            {
+                "course_code": "AUG",
+                "rounds": [
+                    {
+                        "round_num": round_num,
+                        "holes": [
+                            {
+                                "hole": hole,
+                                "par": 4,
+                                "yardage": 450,
+                                "total": wave(),
+                                "morning_wave": wave(),
+                                "afternoon_wave": wave(),
+                            }
+                            for hole in range(1, 19)
+                        ],
+                    }
+                    for round_num in (1, 2)
+                ],
+            }
+        ],
+    }
+
+
+def outrights(rng, size):
+    odds = []
+    for player, win in zip(_players(rng, size), _probabilities(rng, size)):
+        decimal = round(1 / max(win, 0.0005), 2)
+        row = dict(
+            player,
+            datagolf={
+                "baseline": decimal,
+                "baseline_history_fit": round(decimal * 1.02, 2),
+            },
+        )
+        for book in BOOKS:
+            row[book] = round(decimal * rng.uniform(0.75, 1.05), 2)
+        odds.append(row)
+    return {
+        "event_name": "The Masters",
+        "last_updated": LAST_UPDATED,
+        "market": "win",
+        "books_offering": BOOKS,
+        "odds": odds,
+    }
+
+
+def _pair_odds(rng, players):
+    return {f"p{index + 1}": round(rng.uniform(1.6, 3.5), 2) for index in range(players)}
+
+
+def matchups(rng, size):
+    players = _players(rng, size)
+    match_list = []
+    for index in range(0, len(players) - 1, 2):
+        p1, p2 = players[index], players[index + 1]
+        match_list.append(
+            {
+                "p1_dg_id": p1["dg_id"],
+                "p1_player_name": p1["player_name"],
+                "p2_dg_id": p2["dg_id"],
+                "p2_player_name": p2["player_name"],
+                "ties": "void",
+                "odds": {book: _pair_odds(rng, 2) for book in ["datagolf"] + BOOKS[:6]},
+            }
+        )
+    return {
+        "event_name": "The Masters",
+        "last_updated": LAST_UPDATED,
+        "market": "tournament_matchups",
+        "match_list": match_list,
+    }
+
+
+def all_pairings(rng, size):
+    players = _players(rng, size)
+    pairings = []
+    for group, index in enumerate(range(0, len(players) - 2, 3)):
+        pairing = {
+            "group": group + 1,
+            "course": "Augusta National",
+            "start_hole": 1,
+            "teetime": "8:30am",
+            "odds": {"datagolf": _pair_odds(rng, 3)},
+        }
+        for offset in range(3):
+            pairing[f"p{offset + 1}"] = players[index + offset]
+        pairings.append(pairing)
+    return {
+        "event_name": "The Masters",
+        "last_update": LAST_UPDATED,
+        "round": 2,
+        "pairings": pairings,
+    }
+
+
+def raw_event_list(rng, size):
+    return [
+        {
+            "calendar_year": year,
+            "date": f"{year}-{1 + event % 12:02d}-{1 + event % 28:02d}",
+            "event_id": event,
+            "event_name": f"Event {event}",
+            "sg_categories": "yes",
+            "traditional_stats": "yes",
+            "tour": tour,
+        }
+        for tour in ("pga", "euro")
+        for year in range(2017, 2025)
+        for event in range(1, 1 + min(size, 45))
+    ]
+
+
+def rounds(rng, size):
+    scores = []
+    for player in _players(rng, size):
+        row = dict(player, fin_text=f"T{rng.randint(1, 70)}")
+        for round_num in range(1, 5):
+            sg = {field: round(rng.gauss(0, 1.2), 3) for field in SG_FIELDS}
+            row[f"round_{round_num}"] = dict(
+                sg,
+                course_name="Augusta National",
+                course_num=14,
+                course_par=72,
+                start_hole=1,
+                teetime="8:30am",
+                score=72 - round(sg["sg_total"]),
+                driving_dist=round(rng.uniform(270, 320), 1),
+                driving_acc=round(rng.uniform(0.4, 0.8), 3),
+                gir=round(rng.uniform(0.5, 0.8), 3),
+                scrambling=round(rng.uniform(0.4, 0.7), 3),
+                prox_rgh=round(rng.uniform(30, 60), 1),
+                prox_fw=round(rng.uniform(20, 45), 1),
+                great_shots=rng.randint(0, 6),
+                poor_shots=rng.randint(0, 6),
+                eagles_or_better=rng.randint(0, 1),
+                birdies=rng.randint(0, 8),
+                pars=rng.randint(8, 14),
+                bogies=rng.randint(0, 5),
+                doubles_or_worse=rng.randint(0, 2),
+            )
+        scores.append(row)
+    return {
+        "event_completed": "2023-04-09",
+        "event_id": 14,
+        "event_name": "The Masters",
+        "season": 2023,
+        "tour": "pga",
+        "year": 2023,
+        "scores": scores,
+    }
+
+
+def odds_event_list(rng, size):
+    return [
+        {
+            "calendar_year": year,
+            "event_id": event,
+            "event_name": f"Event {event}",
+            "archived_preds": "yes",
+            "matchups": "yes",
+            "outrights": "yes",
+        }
+        for year in range(2019, 2025)
+        for event in range(1, 1 + min(size, 45))
+    ]
+
+
+def historical_outrights(rng, size):
+    odds = []
+    field = zip(_players(rng, size), _probabilities(rng, size))
+    for index, (player, win) in enumerate(field):
+        opening = round(1 / max(win, 0.0005), 2)
+        odds.append(
+            dict(
+                player,
+                open_odds=opening,
+                close_odds=round(opening * rng.uniform(0.7, 1.3), 2),
+                open_time="2023-04-03 12:00:00",
+                close_time="2023-04-06 08:00:00",
+                bet_outcome_numeric=1 if index == 0 else 0,
+                bet_outcome_text="win" if index == 0 else "loss",
+                outcome=str(index + 1),
+            )
+        )
+    return {
+        "book": "draftkings",
+        "event_completed": "2023-04-09",
+        "event_id": 14,
+        "event_name": "The Masters",
+        "market": "win",
+        "odds": odds,
+    }
+
+
+def historical_matchups(rng, size):
+    players = _players(rng, size)
+    odds = []
+    for index in range(0, len(players) - 2, 3):
+        row = {
+            "bet_type": "3-Ball",
+            "round_num": 1,
+            "tie_rule": "dead-heat",
+            "open_time": "2023-04-05 12:00:00",
+            "close_time": "2023-04-06 08:00:00",
+        }
+        winner = rng.randint(1, 3)
+        for offset in range(3):
+            p = f"p{offset + 1}"
+            player = players[index + offset]
+            row.update(
+                {
+                    f"{p}_dg_id": player["dg_id"],
+                    f"{p}_player_name": player["player_name"],
+                    f"{p}_open": round(rng.uniform(2.0, 4.0), 2),
+                    f"{p}_close": round(rng.uniform(2.0, 4.0), 2),
+                    f"{p}_outcome": 1 if offset + 1 == winner else 0,
+                }
+            )
+        odds.append(row)
+    return {
+        "book": "draftkings",
+        "event_completed": "2023-04-09",
+        "event_id": 14,
+        "event_name": "The Masters",
+        "odds": odds,
+    }
+
+
+def dfs_event_list(rng, size):
+    return [
+        dict(
+            event,
+            dk_ownerships="yes",
+            dk_salaries="yes",
+            fd_ownerships="no",
+            fd_salaries="yes",
+        )
+        for event in raw_event_list(rng, size)
+    ]
+
+
+def dfs_points(rng, size):
+    points = []
+    for player in _players(rng, size):
+        finish = round(rng.uniform(0, 30), 1)
+        hole = round(rng.uniform(20, 90), 1)
+        points.append(
+            dict(
+                player,
+                fin_text=f"T{rng.randint(1, 70)}",
+                salary=rng.randrange(6000, 12000, 100),
+                ownership=round(rng.uniform(0, 30), 2),
+                finish_pts=finish,
+                hole_pts=hole,
+                bonus_pts=round(rng.uniform(0, 8), 1),
+                streak_pts=round(rng.uniform(0, 6), 1),
+                hole_in_one_pts=0,
+                total_pts=round(finish + hole, 1),
+            )
+        )
+    return {
+        "event_name": "The Masters",
+        "event_id": 14,
+        "tour": "pga",
+        "year": 2023,
+        "site": "draftkings",
+        "ownerships_from": "draftkings",
+        "dfs_points": points,
+    }
+
+
+BUILDERS = {
+    "get-player-list": player_list,
+    "get-schedule": schedule,
+    "field-updates": field_updates,
+    "preds/get-dg-rankings": dg_rankings,
+    "preds/pre-tournament": pre_tournament,
+    "preds/pre-tournament-archive": pre_tournament_archive,
+    "preds/player-decompositions": decompositions,
+    "preds/skill-ratings": skill_ratings,
+    "preds/approach-skill": approach_skill,
+    "preds/fantasy-projection-defaults": fantasy_projections,
+    "preds/in-play": in_play,
+    "preds/live-strokes-gained": live_strokes_gained,
+    "preds/live-tournament-stats": live_tournament_stats,
+    "preds/live-hole-stats": live_hole_stats,
+    "betting-tools/outrights": outrights,
+    "betting-tools/matchups": matchups,
+    "betting-tools/matchups-all-pairings": all_pairings,
+    "historical-raw-data/event-list": raw_event_list,
+    "historical-raw-data/rounds": rounds,
+    "historical-odds/event-list": odds_event_list,
+    "historical-odds/outrights": historical_outrights,
+    "historical-odds/matchups": historical_matchups,
+    "historical-dfs-data/event-list": dfs_event_list,
+    "historical-dfs-data/points": dfs_points,
+}
+
+
+def build(endpoint, size=156, seed=0):
+    """
+    Build the payload of an endpoint.
+
+    Args:
+        endpoint (str): The API endpoint.
+        size (int, optional): Number of players (records) in the payload. Defaults to 156, a full field.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        dict or list: The payload.
+    """
+    return BUILDERS[endpoint](random.Random(seed), size)
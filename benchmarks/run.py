@@ -0,0 +1,269 @@
+"""
+Offline benchmarks of the SDK against the local stub server.
+
+    python -m benchmarks.run --latency 20 --output bench.json
+    python -m benchmarks.run --compare bench.json
+
+Measures calls/sec, p50/p99 latency, peak memory and parse time for the unpooled and
+pooled sync clients, concurrent fan-out with the async client, and large historical
+downloads (fully parsed and streamed). Results are written as JSON so runs of different
+versions can be compared.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+import requests
+
+from benchmarks.stub_server import StubServer
+from sdk import AsyncDataGolfSDK, DataGolfSDK, RetryPolicy
+
+API_KEY = "benchmark"
+
+DASHBOARD_CALLS = [
+    ("get_pre_tournament_predictions", (), {"tour": "pga"}),
+    ("get_outright_odds", ("pga", "win"), {}),
+    ("get_outright_odds", ("pga", "top_5"), {}),
+    ("get_outright_odds", ("pga", "top_10"), {}),
+    ("get_outright_odds", ("pga", "top_20"), {}),
+    ("get_outright_odds", ("pga", "make_cut"), {}),
+    ("get_outright_odds", ("pga", "frl"), {}),
+    ("get_matchup_odds", ("pga", "tournament_matchups"), {}),
+    ("get_matchup_odds", ("pga", "round_matchups"), {}),
+    ("get_matchup_odds", ("pga", "3_balls"), {}),
+    ("get_matchup_odds_all_pairings", ("pga",), {}),
+    ("get_live_model_predictions", ("pga", "no"), {}),
+    ("get_live_hole_scoring_distribution", ("pga",), {}),
+]
+
+
+class UnpooledTransport:
+    """
+    Baseline transport opening a new connection for every call, like requests.get.
+    """
+
+    def get(self, url, params=None, stream=False):
+        return requests.get(url, params=params, stream=stream, timeout=30)
+
+    def close(self):
+        pass
+
+
+def _client(base_url, **options):
+    return DataGolfSDK(
+        API_KEY, base_url=base_url, retry=RetryPolicy(max_retries=0), **options
+    )
+
+
+def _latency_summary(durations):
+    ordered = sorted(durations)
+    total = sum(ordered)
+
+    def percentile(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {
+        "calls": len(ordered),
+        "seconds": total,
+        "calls_per_sec": len(ordered) / total if total else None,
+        "p50_ms": percentile(0.5) * 1000,
+        "p99_ms": percentile(0.99) * 1000,
+        "mean_ms": statistics.mean(ordered) * 1000,
+    }
+
+
+def _parse_ms(dg, endpoint):
+    parse_time = dg.metrics.snapshot().get(endpoint, {}).get("parse_time", {})
+    return (parse_time.get("mean") or 0) * 1000
+
+
+def _peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_sync(base_url, calls, pooled):
+    transport = None if pooled else UnpooledTransport()
+    with _client(base_url, transport=transport) as dg:
+        dg.get_field_updates("pga")
+        durations = []
+        for _ in range(calls):
+            started = time.perf_counter()
+            dg.get_field_updates("pga")
+            durations.append(time.perf_counter() - started)
+        result = _latency_summary(durations)
+        result["parse_ms"] = _parse_ms(dg, "field-updates")
+        result["peak_memory_bytes"] = _peak_memory(lambda: dg.get_field_updates("pga"))
+    return result
+
+
+def bench_fanout(base_url, rounds, concurrency):
+    async def refresh(dg):
+        return await dg.gather(
+            *(
+                getattr(dg, name)(*args, **kwargs)
+                for name, args, kwargs in DASHBOARD_CALLS
+            )
+        )
+
+    async def run():
+        async with AsyncDataGolfSDK(
+            API_KEY,
+            max_concurrency=concurrency,
+            base_url=base_url,
+            retry=RetryPolicy(max_retries=0),
+        ) as dg:
+            await refresh(dg)
+            durations = []
+            for _ in range(rounds):
+                started = time.perf_counter()
+                await refresh(dg)
+                durations.append(time.perf_counter() - started)
+            return durations
+
+    with _client(base_url) as dg:
+        started = time.perf_counter()
+        for name, args, kwargs in DASHBOARD_CALLS:
+            getattr(dg, name)(*args, **kwargs)
+        sequential = time.perf_counter() - started
+
+    durations = asyncio.run(run())
+    result = _latency_summary(durations)
+    result["endpoints_per_refresh"] = len(DASHBOARD_CALLS)
+    result["sequential_refresh_ms"] = sequential * 1000
+    result["speedup"] = sequential / statistics.mean(durations)
+    return result
+
+
+def bench_large_historical(base_url, size):
+    endpoint = "historical-raw-data/rounds"
+    params = {"tour": "pga", "event_id": "all", "year": 2023, "size": size}
+    results = {}
+    with _client(base_url) as dg:
+        started = time.perf_counter()
+        payload = dg.make_request(endpoint, dict(params, file_format="json"))
+        elapsed = time.perf_counter() - started
+        records = len(payload["scores"])
+        del payload
+        snapshot = dg.metrics.snapshot()[endpoint]
+        results["parsed"] = {
+            "records": records,
+            "seconds": elapsed,
+            "bytes": snapshot["bytes"]["max"],
+            "parse_ms": _parse_ms(dg, endpoint),
+            "peak_memory_bytes": _peak_memory(
+                lambda: dg.make_request(endpoint, dict(params, file_format="json"))
+            ),
+        }
+
+        def stream():
+            records = dg.stream_request(endpoint, dict(params, file_format="json"))
+            return sum(1 for _ in records)
+
+        started = time.perf_counter()
+        records = stream()
+        results["streamed"] = {
+            "records": records,
+            "seconds": time.perf_counter() - started,
+            "peak_memory_bytes": _peak_memory(stream),
+        }
+    return results
+
+
+def _git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    with StubServer(size=args.size, latency=args.latency / 1000) as server:
+        base_url = server.base_url
+        results = {
+            "sync_unpooled": bench_sync(base_url, args.calls, pooled=False),
+            "sync_pooled": bench_sync(base_url, args.calls, pooled=True),
+            "fanout": bench_fanout(base_url, args.rounds, args.concurrency),
+            "large_historical": bench_large_historical(base_url, args.large_size),
+        }
+    return {
+        "meta": {
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "config": vars(args),
+        },
+        "results": results,
+    }
+
+
+def _numbers(results, prefix=""):
+    for name, value in results.items():
+        if isinstance(value, dict):
+            yield from _numbers(value, f"{prefix}{name}.")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield f"{prefix}{name}", value
+
+
+def compare(baseline, current):
+    """
+    Print the relative change of every metric between two result files.
+    """
+    old = dict(_numbers(baseline["results"]))
+    for name, value in _numbers(current["results"]):
+        if old.get(name):
+            change = (value - old[name]) / old[name] * 100
+            print(f"{name:55} {old[name]:>14.3f} {value:>14.3f} {change:>+8.1f}%")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline DataGolf SDK benchmarks.")
+    parser.add_argument("--size", type=int, default=156, help="Records per payload.")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Server latency in ms."
+    )
+    parser.add_argument(
+        "--calls", type=int, default=200, help="Sequential calls per sync run."
+    )
+    parser.add_argument("--rounds", type=int, default=10, help="Fan-out refreshes.")
+    parser.add_argument(
+        "--concurrency", type=int, default=16, help="Async concurrency."
+    )
+    parser.add_argument(
+        "--large-size",
+        type=int,
+        default=20000,
+        help="Players in the large historical payload.",
+    )
+    parser.add_argument("--output", help="Write results to this JSON file.")
+    parser.add_argument("--compare", help="Compare against a previous results file.")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
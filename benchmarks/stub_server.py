@@ -0,0 +1,203 @@
+"""
+Local stand-in for feeds.datagolf.com serving synthetic payloads for every endpoint.
+
+    python -m benchmarks.stub_server --port 8765 --size 156 --latency 20
+
+Query parameters are accepted and ignored, except file_format (json or csv) and the
+benchmark-only size parameter, which overrides the number of records per payload.
+"""
+import argparse
+import csv
+import gzip
+import io
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks import payloads
+
+
+def _flatten(record, prefix=""):
+    row = {}
+    for name, value in record.items():
+        if isinstance(value, dict):
+            row.update(_flatten(value, f"{prefix}{name}_"))
+        else:
+            row[f"{prefix}{name}"] = value
+    return row
+
+
+def _records(payload):
+    if isinstance(payload, list):
+        return payload
+    for value in payload.values():
+        if isinstance(value, list) and value and isinstance(value[0], dict):
+            return value
+    return [payload]
+
+
+def _round_rows(payload):
+    event = {key: value for key, value in payload.items() if key != "scores"}
+    for player in payload["scores"]:
+        base = {k: v for k, v in player.items() if not k.startswith("round_")}
+        for name, stats in player.items():
+            if name.startswith("round_"):
+                yield dict(event, **base, round_num=int(name[len("round_") :]), **stats)
+
+
+def to_csv(payload):
+    """
+    Render a payload's record list as CSV, flattening nested objects into prefixed
+    columns. Round data is written one row per player round, like the API does.
+    """
+    if isinstance(payload, dict) and "scores" in payload:
+        rows = list(_round_rows(payload))
+    else:
+        rows = [_flatten(record) for record in _records(payload)]
+    columns = list(dict.fromkeys(column for row in rows for column in row))
+    out = io.StringIO()
+    writer = csv.DictWriter(out, columns)
+    writer.writeheader()
+    writer.writerows(rows)
+    return out.getvalue()
+
+
+class StubServer:
+    def __init__(
+        self, host="127.0.0.1", port=0, size=156, latency=0.0, compress=True
+    ):
+        """
+        Initialize the stub server.
+
+        Args:
+            host (str, optional): Interface to bind. Defaults to 127.0.0.1.
+            port (int, optional): Port to bind, 0 for any free port. Defaults to 0.
+            size (int, optional): Default number of records per payload. Defaults to 156.
+            latency (float, optional): Seconds to wait before answering each request. Defaults to 0.
+            compress (bool, optional): Gzip responses when the client accepts it. Defaults to True.
+        """
+        self.size = size
+        self.latency = latency
+        self.compress = compress
+        self.requests = 0
+        self._bodies = {}
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def body(self, endpoint, file_format, size, gzipped):
+        key = (endpoint, file_format, size, gzipped)
+        with self._lock:
+            body = self._bodies.get(key)
+        if body is None:
+            payload = payloads.build(endpoint, size)
+            text = to_csv(payload) if file_format == "csv" else json.dumps(payload)
+            body = text.encode("utf-8")
+            if gzipped:
+                body = gzip.compress(body, compresslevel=6)
+            with self._lock:
+                self._bodies[key] = body
+        return body
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Buffer the headers and body into one write per response; flushed after
+            # each request by handle_one_request.
+            wbufsize = -1
+
+            def setup(self):
+                super().setup()
+                # Without this, keep-alive responses stall on Nagle and delayed ACKs.
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                endpoint = url.path.strip("/")
+                query = parse_qs(url.query)
+                server.requests += 1
+                if endpoint not in payloads.BUILDERS:
+                    self._send(404, b"Not found", "text/plain", False)
+                    return
+                if server.latency:
+                    time.sleep(server.latency)
+                file_format = query.get("file_format", ["json"])[0]
+                size = int(query.get("size", [server.size])[0])
+                gzipped = server.compress and "gzip" in self.headers.get(
+                    "Accept-Encoding", ""
+                )
+                body = server.body(endpoint, file_format, size, gzipped)
+                content_type = "text/csv" if file_format == "csv" else "application/json"
+                self._send(200, body, content_type, gzipped)
+
+            def _send(self, status, body, content_type, gzipped):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                if gzipped:
+                    self.send_header("Content-Encoding", "gzip")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """
+        Serve requests on a background thread.
+
+        Returns:
+            StubServer: self.
+        """
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--size", type=int, default=156, help="Records per payload.")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Milliseconds per request."
+    )
+    parser.add_argument(
+        "--no-gzip", action="store_true", help="Never compress responses."
+    )
+    args = parser.parse_args(argv)
+    server = StubServer(
+        args.host, args.port, args.size, args.latency / 1000, not args.no_gzip
+    )
+    print(f"Serving DataGolf stub on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,60 @@
-from sdk.datagolf_sdk import DataGolfSDK
+import importlib
+
+# Public name to the module defining it. Modules are imported on first attribute
+# access, so "import sdk" stays cheap and requests, asyncio, numpy and friends are
+# only loaded by the features that use them.
+_EXPORTS = {
+    "DataGolfSDK": "sdk.datagolf_sdk",
+    "AsyncDataGolfSDK": "sdk.async_sdk",
+    "ResponseCache": "sdk.cache",
+    "SingleFlight": "sdk.coalesce",
+    "Backfill": "sdk.backfill",
+    "APIError": "sdk.exceptions",
+    "AuthenticationError": "sdk.exceptions",
+    "ClientError": "sdk.exceptions",
+    "DataGolfError": "sdk.exceptions",
+    "RateLimitError": "sdk.exceptions",
+    "ServerError": "sdk.exceptions",
+    "TransportError": "sdk.exceptions",
+    "FileTokenBucket": "sdk.ratelimit",
+    "TokenBucket": "sdk.ratelimit",
+    "RetryPolicy": "sdk.retry",
+    "ChangeEvent": "sdk.live",
+    "LiveFeed": "sdk.live",
+    "Metrics": "sdk.metrics",
+    "RecordingTransport": "sdk.replay",
+    "ReplayMissError": "sdk.replay",
+    "ReplayTransport": "sdk.replay",
+    "PlayerStore": "sdk.players",
+    "Record": "sdk.records",
+    "RecordArray": "sdk.records",
+    "BULK": "sdk.batch",
+    "LIVE": "sdk.batch",
+    "NORMAL": "sdk.batch",
+    "Batch": "sdk.batch",
+    "BatchResult": "sdk.batch",
+    "Refresher": "sdk.refresher",
+    "WarmValue": "sdk.refresher",
+    "get_decoder": "sdk.decoders",
+    "Backtest": "sdk.backtest",
+    "BacktestResult": "sdk.backtest",
+    "DFSPool": "sdk.dfs",
+    "Lineups": "sdk.dfs",
+    "SimulationResult": "sdk.simulate",
+    "TournamentSimulator": "sdk.simulate",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,122 @@
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+from sdk.datagolf_sdk import DataGolfSDK
+
+
+class AsyncDataGolfSDK:
+    def __init__(
+        self, api_token, max_concurrency=10, transport=None, timeout=30.0, **options
+    ):
+        """
+        Initialize the AsyncDataGolfSDK.
+
+        Every get_* endpoint method of DataGolfSDK is available as a coroutine. Calls run
+        on a worker pool sharing a single pooled transport, so at most max_concurrency
+        requests are in flight at once and connections are reused between calls.
+
+        Args:
+            api_token (str): Your DataGolf API token.
+            max_concurrency (int, optional): Maximum number of concurrent requests. Also sizes the connection pool. Defaults to 10.
+            transport (object, optional): Transport used to send requests. Defaults to a pooled HTTPTransport.
+            timeout (float or tuple, optional): Request timeout of the default transport in seconds. Defaults to 30.
+            **options: Other DataGolfSDK options (cache, rate_limit, retry, metrics, base_url, decoder).
+        """
+        self.max_concurrency = max_concurrency
+        self.sdk = DataGolfSDK(
+            api_token,
+            transport=transport,
+            pool_size=max_concurrency,
+            timeout=timeout,
+            **options,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="datagolf"
+        )
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Run a blocking callable on the client's worker pool.
+
+        Args:
+            func (callable): The callable to run, usually a bound DataGolfSDK method.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            object: The return value of func.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def make_request(self, endpoint, params=None, raw=False):
+        """
+        Make a request to the DataGolf API without blocking the event loop.
+
+        Args:
+            endpoint (str): The API endpoint.
+            params (dict, optional): Query parameters. Defaults to None.
+            raw (bool or str, optional): Return the undecoded body as bytes, or "memoryview". Defaults to False.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self.run(self.sdk.make_request, endpoint, params, raw)
+
+    async def gather(self, *calls, return_exceptions=False):
+        """
+        Run many endpoint calls concurrently and return their results in order.
+
+        Args:
+            *calls: Coroutines returned by the client's get_* methods.
+            return_exceptions (bool, optional): Return exceptions as results instead of raising the first one. Defaults to False.
+
+        Returns:
+            list: The results, in the same order as calls.
+        """
+        return list(
+            await asyncio.gather(*calls, return_exceptions=return_exceptions)
+        )
+
+    def close(self):
+        """
+        Shut down the worker pool and close the underlying transport. Blocks until
+        running calls finish; use aclose() from a coroutine.
+        """
+        self._executor.shutdown(wait=True)
+        self.sdk.close()
+
+    async def aclose(self):
+        """
+        Close the client without blocking the event loop.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+
+def _make_async(name):
+    method = getattr(DataGolfSDK, name)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        return await self.run(getattr(self.sdk, name), *args, **kwargs)
+
+    return wrapper
+
+
+# Endpoint methods are the get_* methods taking a file_format; local helpers such as
+# get_warm are not wrapped.
+for _name in dir(DataGolfSDK):
+    if _name.startswith("get_") and "file_format" in inspect.signature(
+        getattr(DataGolfSDK, _name)
+    ).parameters:
+        setattr(AsyncDataGolfSDK, _name, _make_async(_name))
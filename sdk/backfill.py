@@ -0,0 +1,305 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+
+from sdk.payloads import iter_rounds
+
+CHECKPOINT_FILE = "_checkpoint.json"
+
+# Completed jobs between checkpoint writes; the checkpoint is also written at the end
+# of every run.
+CHECKPOINT_EVERY = 50
+
+# Checkpoint entries kept as sets in memory and as sorted lists on disk.
+_ID_SETS = ("completed", "partitions", "pending")
+
+
+def flatten_rounds(payload):
+    """
+    Flatten a Round Scoring, Stats & Strokes Gained payload into one row per player round.
+
+    Args:
+        payload (dict): Response of get_round_scoring_stats_strokes_gained for a single event.
+
+    Returns:
+        list: Row dicts holding the event fields, the player fields and the round stats.
+    """
+    return list(iter_rounds(payload))
+
+
+def write_parquet(rows, path):
+    """
+    Atomically write rows to a Parquet file.
+
+    The columns are the union of the fields of every row, in first-seen order; rows
+    missing a field get nulls.
+
+    Args:
+        rows (list): Row dicts.
+        path (str): Destination file. Parent directories are created if missing.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError(
+            "pyarrow is required to write Parquet files: pip install pyarrow"
+        ) from error
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    columns = dict.fromkeys(name for row in rows for name in row)
+    table = pa.table({name: [row.get(name) for row in rows] for name in columns})
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+
+
+class Backfill:
+    def __init__(self, dg, root, tours=None, years=None, max_workers=4):
+        """
+        Initialize a resumable backfill of historical round data.
+
+        Jobs are planned from the historical raw data event list and written to
+        root/tour=<tour>/year=<year>/event_id=<event_id>.parquet as they complete.
+        Completed jobs and partitions are checkpointed, so reruns skip them.
+
+        Args:
+            dg (DataGolfSDK): The client used to fetch data.
+            root (str): Output directory of the Parquet store.
+            tours (list, optional): Tours to backfill. Defaults to None (every tour in the event list).
+            years (list, optional): Calendar years to backfill. Defaults to None (every year in the event list).
+            max_workers (int, optional): Number of concurrent fetches. Defaults to 4.
+        """
+        self.dg = dg
+        self.root = root
+        self.tours = set(tours) if tours else None
+        self.years = {int(year) for year in years} if years else None
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self.checkpoint = self._load_checkpoint()
+
+    @property
+    def checkpoint_path(self):
+        return os.path.join(self.root, CHECKPOINT_FILE)
+
+    def _load_checkpoint(self):
+        try:
+            with open(self.checkpoint_path) as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            checkpoint = {}
+        # "pending" holds jobs planned but not completed yet: failed, still in progress
+        # or interrupted.
+        for name in _ID_SETS:
+            checkpoint[name] = set(checkpoint.get(name) or ())
+        # Incremental cut-offs are kept per tour/year partition, since tours and years
+        # change between runs. The single cut-off of older checkpoints is dropped, so
+        # their next incremental run plans every event not completed yet.
+        checkpoint.pop("last_event_date", None)
+        checkpoint.setdefault("last_event_dates", {})
+        return checkpoint
+
+    def _save_checkpoint(self):
+        checkpoint = dict(self.checkpoint)
+        for name in _ID_SETS:
+            checkpoint[name] = sorted(checkpoint[name])
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoint, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    @staticmethod
+    def job_id(job):
+        return f"{job['tour']}/{job['year']}/{job['event_id']}"
+
+    @staticmethod
+    def partition_id(job):
+        return f"{job['tour']}/{job['year']}"
+
+    def partition_path(self, job):
+        return os.path.join(
+            self.root,
+            f"tour={job['tour']}",
+            f"year={job['year']}",
+            f"event_id={job['event_id']}.parquet",
+        )
+
+    def plan(self, incremental=False):
+        """
+        Plan the (tour, event, year) jobs still to be fetched.
+
+        Args:
+            incremental (bool, optional): Only plan events newer than the last completed event of their tour and year in a previous run, plus the pending jobs of previous runs. Defaults to False.
+
+        Returns:
+            list: Job dicts with tour, event_id, year, event_name and date.
+        """
+        events = self.dg.get_historical_raw_data_event_ids()
+
+        completed = self.checkpoint["completed"]
+        partitions = self.checkpoint["partitions"]
+        pending = self.checkpoint["pending"]
+        last_event_dates = self.checkpoint["last_event_dates"] if incremental else {}
+        jobs = []
+        for event in events:
+            job = {
+                "tour": event["tour"],
+                "event_id": event["event_id"],
+                "year": int(event["calendar_year"]),
+                "event_name": event.get("event_name"),
+                "date": event.get("date"),
+            }
+            if self.tours is not None and job["tour"] not in self.tours:
+                continue
+            if self.years is not None and job["year"] not in self.years:
+                continue
+            since = last_event_dates.get(self.partition_id(job))
+            if (
+                since is not None
+                and (job["date"] or "") <= since
+                and self.job_id(job) not in pending
+            ):
+                continue
+            if self.partition_id(job) in partitions or self.job_id(job) in completed:
+                continue
+            jobs.append(job)
+        return sorted(jobs, key=lambda job: (job["date"] or "", job["tour"]))
+
+    def _run_job(self, job):
+        payload = self.dg.get_round_scoring_stats_strokes_gained(
+            job["tour"], job["event_id"], job["year"]
+        )
+        rows = flatten_rounds(payload)
+        if rows:
+            write_parquet(rows, self.partition_path(job))
+        return bool(payload.get("event_completed", True)), len(rows)
+
+    def _complete(self, job, partition_jobs):
+        with self._lock:
+            checkpoint = self.checkpoint
+            job_id = self.job_id(job)
+            checkpoint["completed"].add(job_id)
+            checkpoint["pending"].discard(job_id)
+            partition = self.partition_id(job)
+            last_event_dates = checkpoint["last_event_dates"]
+            if job["date"] and job["date"] > last_event_dates.get(partition, ""):
+                last_event_dates[partition] = job["date"]
+
+            # A partition is final once every planned job in it is done and its year is over.
+            if job["year"] < date.today().year and (
+                partition_jobs[partition] <= checkpoint["completed"]
+            ):
+                checkpoint["partitions"].add(partition)
+                last_event_dates.pop(partition, None)
+                prefix = f"{partition}/"
+                for name in ("completed", "pending"):
+                    checkpoint[name] = {
+                        other
+                        for other in checkpoint[name]
+                        if not other.startswith(prefix)
+                    }
+
+    def run(self, incremental=False):
+        """
+        Fetch and write every planned job on a bounded worker pool.
+
+        Planned jobs are checkpointed as pending until they complete, so failed jobs,
+        events still in progress (written but not completed) and jobs of an interrupted
+        run are planned again by the next run, incremental or not.
+
+        Args:
+            incremental (bool, optional): Only fetch events newer than the last run of their tour and year. Defaults to False.
+
+        Returns:
+            dict: planned, completed, rows and failed ({job id: error message}) counts.
+        """
+        jobs = self.plan(incremental=incremental)
+        partition_jobs = {}
+        for job in jobs:
+            partition = partition_jobs.setdefault(self.partition_id(job), set())
+            partition.add(self.job_id(job))
+        with self._lock:
+            self.checkpoint["pending"].update(map(self.job_id, jobs))
+            self._save_checkpoint()
+        summary = {"planned": len(jobs), "completed": 0, "rows": 0, "failed": {}}
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self._run_job, job): job for job in jobs}
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        event_completed, rows = future.result()
+                    except Exception as error:
+                        summary["failed"][self.job_id(job)] = str(error)
+                        continue
+                    summary["rows"] += rows
+                    if event_completed:
+                        self._complete(job, partition_jobs)
+                        summary["completed"] += 1
+                        if summary["completed"] % CHECKPOINT_EVERY == 0:
+                            with self._lock:
+                                self._save_checkpoint()
+        finally:
+            with self._lock:
+                self._save_checkpoint()
+        return summary
+
+    def sync(self):
+        """
+        Fetch only the events newer than the last completed event of their tour and year
+        in a previous run, and retry its pending jobs.
+
+        Returns:
+            dict: The run summary.
+        """
+        return self.run(incremental=True)
+
+
+def _parse_years(value):
+    if "-" in value:
+        start, end = value.split("-", 1)
+        return list(range(int(start), int(end) + 1))
+    return [int(value)]
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Backfill historical round data into a partitioned Parquet store."
+    )
+    parser.add_argument("root", help="Output directory of the Parquet store.")
+    parser.add_argument("--tours", nargs="*", help="Tours to backfill (default: all).")
+    parser.add_argument(
+        "--years", nargs="*", help="Years or year ranges such as 2017-2024 (default: all)."
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent fetches.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only fetch events newer than the last run.",
+    )
+    parser.add_argument(
+        "--api-key",
+        default=os.environ.get("apikey"),
+        help="DataGolf API key (default: the apikey environment variable).",
+    )
+    args = parser.parse_args(argv)
+    if not args.api_key:
+        parser.error("an API key is required (--api-key or the apikey environment variable)")
+
+    from sdk.datagolf_sdk import DataGolfSDK
+
+    years = [year for value in args.years or [] for year in _parse_years(value)]
+    with DataGolfSDK(args.api_key, pool_size=args.workers) as dg:
+        backfill = Backfill(dg, args.root, args.tours, years, args.workers)
+        summary = backfill.run(incremental=args.incremental)
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
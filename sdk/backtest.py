@@ -0,0 +1,546 @@
+from sdk.batch import BULK
+from sdk.decoders import require_dicts
+from sdk.odds import market_total, to_decimal
+
+OUTRIGHT_MARKETS = ("win", "top_5", "top_10", "top_20", "make_cut", "mc")
+
+# Outright market to the archived prediction field giving its probability. "mc" (missed
+# cut) is the complement of make_cut.
+PREDICTION_FIELDS = {
+    "win": "win",
+    "top_5": "top_5",
+    "top_10": "top_10",
+    "top_20": "top_20",
+    "make_cut": "make_cut",
+    "mc": "make_cut",
+}
+
+# Fields of the aligned bet arrays.
+BET_FIELDS = (
+    "event",
+    "event_id",
+    "year",
+    "book",
+    "market",
+    "dg_id",
+    "open",
+    "close",
+    "outcome",
+    "push",
+    "prob",
+    "fair_close",
+)
+
+# Cap on the elements of the (threshold x bet) blocks evaluated at once.
+_BLOCK_ELEMENTS = 1 << 24
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _market_name(bet_type):
+    return str(bet_type or "matchups").lower().replace("-", "_").replace(" ", "_")
+
+
+def plackett_luce(win):
+    """
+    Matchup probabilities from win probabilities: each player's share of the group's total.
+
+    Args:
+        win (numpy.ndarray): Win probabilities of the players, one row per matchup.
+
+    Returns:
+        numpy.ndarray: Probability that each player beats the others in the row; NaN for the whole row when a player has no prediction.
+    """
+    import numpy as np
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return win / np.sum(win, axis=1, keepdims=True)
+
+
+def prediction_table(payload, model="baseline_history_fit"):
+    """
+    Index an archived predictions payload by player.
+
+    Args:
+        payload (dict): Response of get_pre_tournament_predictions_archive with odds_format="percent".
+        model (str, optional): Model whose predictions to use; falls back to "baseline". Defaults to "baseline_history_fit".
+
+    Returns:
+        dict: dg_id to {prediction field: probability}.
+    """
+    payload = require_dicts(payload, "Backtest")
+    rows = payload.get(model) or payload.get("baseline") or []
+    if isinstance(rows, dict):
+        rows = next((value for value in rows.values() if isinstance(value, list)), [])
+    return {
+        row.get("dg_id"): {
+            field: _float(row.get(field)) for field in set(PREDICTION_FIELDS.values())
+        }
+        for row in rows
+    }
+
+
+class Backtest:
+    def __init__(self, bets, books, markets):
+        """
+        Initialize a backtest over aligned bet arrays.
+
+        Build one with Backtest.from_api or Backtest.from_payloads. Each bet is one side
+        of an archived line: an outright price on a player, or one player of a matchup.
+
+        Args:
+            bets (dict): Field name (BET_FIELDS) to a numpy array, all of the same length. book and market hold indexes into books and markets; event holds the chronological rank of the event.
+            books (list): Book names.
+            markets (list): Market names.
+        """
+        self.bets = bets
+        self.books = list(books)
+        self.markets = list(markets)
+        self.failed = []
+
+    def __len__(self):
+        return len(self.bets["dg_id"])
+
+    def __repr__(self):
+        return (
+            f"Backtest({len(self)} bets, books={self.books!r}, markets={self.markets!r})"
+        )
+
+    @classmethod
+    def from_payloads(
+        cls,
+        outrights=(),
+        matchups=(),
+        predictions=None,
+        odds_format="decimal",
+        model="baseline_history_fit",
+        matchup_model=plackett_luce,
+    ):
+        """
+        Load archived lines and predictions into aligned arrays, joined by event, year and dg_id.
+
+        Args:
+            outrights (iterable, optional): (year, payload) pairs of get_historical_outrights responses. Defaults to none.
+            matchups (iterable, optional): (year, payload) pairs of get_historical_matchups_3balls responses. Defaults to none.
+            predictions (dict, optional): (event_id, year) to a get_pre_tournament_predictions_archive response in percent odds. Bets without a prediction get a NaN probability and are never placed. Defaults to None.
+            odds_format (str, optional): Odds format of the line payloads. Defaults to "decimal".
+            model (str, optional): Prediction model to use. Defaults to "baseline_history_fit".
+            matchup_model (callable, optional): Maps the players' archived win probabilities (a 1-row array per matchup) to their matchup probabilities. Defaults to plackett_luce.
+
+        Returns:
+            Backtest: The backtest.
+        """
+        import numpy as np
+
+        tables = {
+            (int(event_id), int(year)): prediction_table(payload, model)
+            for (event_id, year), payload in (predictions or {}).items()
+        }
+        columns = {name: [] for name in BET_FIELDS}
+        columns["group"] = []
+        books, markets, events = {}, {}, {}
+
+        def add(year, payload, market, record, side, group, prob):
+            event_id = int(payload.get("event_id"))
+            key = (int(year), payload.get("event_completed") or "", event_id)
+            columns["event"].append(events.setdefault(key, len(events)))
+            columns["event_id"].append(event_id)
+            columns["year"].append(int(year))
+            columns["book"].append(books.setdefault(payload.get("book"), len(books)))
+            columns["market"].append(markets.setdefault(market, len(markets)))
+            columns["dg_id"].append(record.get(f"{side}dg_id"))
+            columns["open"].append(record.get(f"{side}open" if side else "open_odds"))
+            columns["close"].append(
+                record.get(f"{side}close" if side else "close_odds")
+            )
+            outcome = record.get(
+                f"{side}outcome" if side else "bet_outcome_numeric"
+            )
+            columns["outcome"].append(_float(outcome))
+            tie_rule = str(record.get("tie_rule") or "").lower()
+            columns["push"].append("void" in tie_rule and 0 < _float(outcome) < 1)
+            columns["prob"].append(prob)
+            columns["group"].append(group)
+
+        groups = 0
+        outright_markets = set()
+        for year, payload in outrights:
+            require_dicts(payload, "Backtest")
+            market = payload.get("market")
+            outright_markets.add(market)
+            table = tables.get((int(payload.get("event_id")), int(year)), {})
+            field = PREDICTION_FIELDS.get(market)
+            for record in payload.get("odds") or []:
+                prob = table.get(record.get("dg_id"), {}).get(field, float("nan"))
+                if market == "mc":
+                    prob = 1 - prob
+                add(year, payload, market, record, "", groups, prob)
+            groups += 1
+
+        for year, payload in matchups:
+            require_dicts(payload, "Backtest")
+            table = tables.get((int(payload.get("event_id")), int(year)), {})
+            for record in payload.get("odds") or []:
+                sides = [
+                    f"p{n}_" for n in (1, 2, 3) if record.get(f"p{n}_dg_id") is not None
+                ]
+                win = [
+                    table.get(record[f"{side}dg_id"], {}).get("win", float("nan"))
+                    for side in sides
+                ]
+                probs = matchup_model(np.array([win]))[0]
+                market = _market_name(record.get("bet_type"))
+                for side, prob in zip(sides, probs):
+                    add(year, payload, market, record, side, groups, prob)
+                groups += 1
+
+        # Rank events chronologically.
+        order = {key: rank for rank, key in enumerate(sorted(events))}
+        rank = np.array([order[key] for key in events], dtype=np.int64)
+        bets = {
+            "event": rank[np.array(columns["event"], dtype=np.int64)],
+            "event_id": np.array(columns["event_id"], dtype=np.int64),
+            "year": np.array(columns["year"], dtype=np.int64),
+            "book": np.array(columns["book"], dtype=np.int64),
+            "market": np.array(columns["market"], dtype=np.int64),
+            "dg_id": np.array(
+                [-1 if dg_id is None else dg_id for dg_id in columns["dg_id"]],
+                dtype=np.int64,
+            ),
+            "open": to_decimal(columns["open"], odds_format),
+            "close": to_decimal(columns["close"], odds_format),
+            "outcome": np.array(columns["outcome"], dtype=np.float64),
+            "push": np.array(columns["push"], dtype=bool),
+            "prob": np.array(columns["prob"], dtype=np.float64),
+        }
+        # What each line's fair probabilities sum to: 1 for matchups, 0 (unknown) for
+        # make_cut and mc.
+        totals = np.array(
+            [
+                (market_total(name) or 0) if name in outright_markets else 1
+                for name in markets
+            ],
+            dtype=np.float64,
+        )
+        bets["fair_close"] = cls._fair_close(
+            bets["close"],
+            np.array(columns["group"], dtype=np.int64),
+            totals[bets["market"]],
+        )
+        return cls(bets, books, markets)
+
+    @staticmethod
+    def _fair_close(close, group, total):
+        """
+        No-vig closing probabilities: closing implied probabilities scaled so each line
+        (an outright field or a matchup) sums to its market total. Markets without a known
+        total (make_cut, mc) keep the implied probability.
+        """
+        import numpy as np
+
+        implied = 1 / close
+        if not len(close):
+            return implied
+        sums = np.bincount(group, np.nan_to_num(implied), minlength=group.max() + 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fair = implied * total / sums[group]
+        return np.where(total > 0, fair, implied)
+
+    @classmethod
+    def from_api(
+        cls,
+        dg,
+        books,
+        events=None,
+        markets=OUTRIGHT_MARKETS,
+        matchups=True,
+        tour="pga",
+        model="baseline_history_fit",
+        matchup_model=plackett_luce,
+        max_workers=8,
+    ):
+        """
+        Fetch archived lines, outcomes and predictions and load them into a backtest.
+
+        Every (event, market, book) call runs once on a batch of BULK calls. Calls that
+        fail, e.g. because a book did not offer a market, are skipped and listed in
+        backtest.failed.
+
+        Args:
+            dg (DataGolfSDK): The client.
+            books (list): Books to load, e.g. ["pinnacle", "draftkings"].
+            events (list, optional): (event_id, year) pairs. Defaults to None (every event of the tour's historical odds event list with archived predictions).
+            markets (list, optional): Outright markets to load. Defaults to OUTRIGHT_MARKETS.
+            matchups (bool, optional): Also load matchups and 3-balls. Defaults to True.
+            tour (str, optional): Tour of the lines. Predictions are archived for the PGA Tour only. Defaults to "pga".
+            model (str, optional): Prediction model to use. Defaults to "baseline_history_fit".
+            matchup_model (callable, optional): See from_payloads. Defaults to plackett_luce.
+            max_workers (int, optional): Concurrent requests. Defaults to 8.
+
+        Returns:
+            Backtest: The backtest.
+        """
+        if events is None:
+            events = [
+                (event["event_id"], int(event["calendar_year"]))
+                for event in dg.get_historical_odds_data_event_ids(tour, "json")
+                if event.get("archived_preds", "yes") == "yes"
+            ]
+        batch = dg.batch(max_workers=max_workers)
+        for event_id, year in events:
+            batch.add(
+                "get_pre_tournament_predictions_archive",
+                event_id,
+                year,
+                "percent",
+                "json",
+                priority=BULK,
+            )
+            for book in books:
+                for market in markets:
+                    batch.add(
+                        "get_historical_outrights",
+                        tour,
+                        event_id,
+                        year,
+                        market,
+                        book,
+                        "decimal",
+                        "json",
+                        priority=BULK,
+                    )
+                if matchups:
+                    batch.add(
+                        "get_historical_matchups_3balls",
+                        tour,
+                        event_id,
+                        year,
+                        book,
+                        "decimal",
+                        "json",
+                        priority=BULK,
+                    )
+
+        predictions, outrights, lines, failed = {}, [], [], []
+        for result in batch.run():
+            item = result.item
+            if not result.ok or not isinstance(result.value, dict):
+                failed.append((item.method, item.args, str(result.error)))
+                continue
+            if item.method == "get_pre_tournament_predictions_archive":
+                event_id, year = item.args[:2]
+                predictions[(event_id, year)] = result.value
+            elif item.method == "get_historical_outrights":
+                outrights.append((item.args[2], result.value))
+            else:
+                lines.append((item.args[2], result.value))
+
+        backtest = cls.from_payloads(
+            outrights, lines, predictions, "decimal", model, matchup_model
+        )
+        backtest.failed = failed
+        return backtest
+
+    def run(self, thresholds, kelly_fractions=(1.0,), price="open", by=("book", "market")):
+        """
+        Evaluate every (edge threshold, Kelly fraction) combination in vectorized passes.
+
+        A bet is placed when its edge, prob * odds - 1, is at least the threshold, with a
+        stake of kelly_fraction times the full Kelly stake. Bets settle at the chosen price;
+        dead heats pay their outcome fraction and pushes return the stake. The bankroll
+        compounds event by event: the stakes of an event's bets are a fraction of the
+        bankroll before it, scaled down if they would exceed it.
+
+        Args:
+            thresholds (array-like): Minimum edges, e.g. numpy.linspace(0, 0.5, 101).
+            kelly_fractions (array-like, optional): Multiples of the full Kelly stake. Defaults to (1.0,).
+            price (str, optional): "open" or "close", the line the bets are placed at. Defaults to "open".
+            by (tuple, optional): Fields to group results by, any of "book" and "market". Defaults to ("book", "market").
+
+        Returns:
+            BacktestResult: ROI, CLV, bankroll growth and drawdown per group and combination.
+        """
+        import numpy as np
+
+        if price not in ("open", "close"):
+            raise ValueError(f"price must be 'open' or 'close', got {price!r}")
+        thresholds = np.atleast_1d(np.asarray(thresholds, dtype=np.float64))
+        fractions = np.atleast_1d(np.asarray(kelly_fractions, dtype=np.float64))
+        bets = self.bets
+        odds = bets[price]
+        prob = bets["prob"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            edge = prob * odds - 1
+            kelly = np.clip(edge / (odds - 1), 0, 1)
+            returns = np.where(bets["push"], 0.0, bets["outcome"] * odds - 1)
+            clv = odds * bets["fair_close"] - 1
+        valid = np.isfinite(edge) & np.isfinite(returns) & (kelly > 0)
+
+        labels = {"book": self.books, "market": self.markets}
+        if by:
+            keys = np.stack([bets[name] for name in by], axis=1)[valid]
+            groups, inverse = np.unique(keys, axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+        else:
+            groups = np.zeros((1, 0), dtype=np.int64)
+            inverse = np.zeros(valid.sum(), dtype=np.int64)
+        index = np.flatnonzero(valid)
+
+        shape = (len(groups), len(thresholds))
+        result = BacktestResult(
+            thresholds,
+            fractions,
+            by,
+            [
+                tuple(labels[name][code] for name, code in zip(by, group))
+                for group in groups
+            ],
+            price,
+        )
+        for name in ("bets", "staked", "roi", "flat_roi", "clv"):
+            setattr(result, name, np.zeros(shape))
+        result.final_bankroll = np.ones(shape + (len(fractions),))
+        result.max_drawdown = np.zeros(shape + (len(fractions),))
+
+        for g in range(len(groups)):
+            members = index[inverse == g]
+            members = members[np.argsort(bets["event"][members], kind="stable")]
+            self._evaluate(
+                result,
+                g,
+                edge[members],
+                kelly[members],
+                returns[members],
+                clv[members],
+                bets["event"][members],
+            )
+        return result
+
+    @staticmethod
+    def _evaluate(result, g, edge, kelly, returns, clv, event):
+        import numpy as np
+
+        thresholds, fractions = result.thresholds, result.fractions
+        starts = np.flatnonzero(np.r_[True, event[1:] != event[:-1]])
+        # Per-bet columns summed over the placed bets of each threshold in one product.
+        values = np.stack([np.ones_like(kelly), kelly, kelly * returns, returns, clv], 1)
+        step = max(1, _BLOCK_ELEMENTS // max(1, len(edge)))
+        for lo in range(0, len(thresholds), step):
+            block = slice(lo, lo + step)
+            placed = (edge[None, :] >= thresholds[block, None]).astype(np.float64)
+            count, staked, profit, flat, clv_sum = (placed @ values).T
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result.bets[g, block] = count
+                result.staked[g, block] = staked
+                result.roi[g, block] = np.where(staked > 0, profit / staked, np.nan)
+                result.flat_roi[g, block] = np.where(count > 0, flat / count, np.nan)
+                result.clv[g, block] = np.where(count > 0, clv_sum / count, np.nan)
+
+            # Per-event Kelly stake and profit of each threshold, then the compounding
+            # bankroll of every fraction: (fractions, thresholds, events).
+            stake = np.add.reduceat(placed * kelly, starts, axis=1)
+            gain = np.add.reduceat(placed * (kelly * returns), starts, axis=1)
+            scaled = fractions[:, None, None] * stake[None]
+            growth = fractions[:, None, None] * gain[None]
+            growth /= np.maximum(scaled, 1)
+            growth += 1
+            log_bankroll = np.log(np.maximum(growth, 1e-300, out=growth), out=growth)
+            np.cumsum(log_bankroll, axis=-1, out=log_bankroll)
+            peak = np.maximum.accumulate(log_bankroll, axis=-1)
+            np.maximum(peak, 0, out=peak)
+            fall = (log_bankroll - peak).min(axis=-1)
+            result.final_bankroll[g, block] = np.exp(log_bankroll[..., -1]).T
+            result.max_drawdown[g, block] = (1 - np.exp(fall)).T
+
+
+class BacktestResult:
+    def __init__(self, thresholds, fractions, by, groups, price):
+        """
+        Metrics of a backtest run, as arrays indexed [group, threshold] or [group, threshold, fraction].
+
+        Attributes:
+            bets: Number of bets placed.
+            staked: Sum of the full Kelly stakes placed, in bankroll units.
+            roi: Kelly-weighted profit per unit staked.
+            flat_roi: Profit per bet at a flat unit stake.
+            clv: Mean closing-line value, price * no-vig closing probability - 1.
+            final_bankroll: Bankroll after the last event, starting from 1.
+            max_drawdown: Largest peak-to-trough fall of the bankroll, as a fraction of the peak.
+
+        Args:
+            thresholds (numpy.ndarray): Edge thresholds.
+            fractions (numpy.ndarray): Kelly fractions.
+            by (tuple): Grouping fields.
+            groups (list): Labels of each group, one value per grouping field.
+            price (str): The line bets were placed at.
+        """
+        self.thresholds = thresholds
+        self.fractions = fractions
+        self.by = tuple(by)
+        self.groups = groups
+        self.price = price
+
+    def rows(self):
+        """
+        One row dict per group, threshold and Kelly fraction.
+        """
+        rows = []
+        for g, group in enumerate(self.groups):
+            for t, threshold in enumerate(self.thresholds):
+                for f, fraction in enumerate(self.fractions):
+                    row = dict(zip(self.by, group))
+                    row.update(
+                        threshold=float(threshold),
+                        kelly_fraction=float(fraction),
+                        bets=int(self.bets[g, t]),
+                        staked=float(self.staked[g, t]),
+                        roi=float(self.roi[g, t]),
+                        flat_roi=float(self.flat_roi[g, t]),
+                        clv=float(self.clv[g, t]),
+                        final_bankroll=float(self.final_bankroll[g, t, f]),
+                        max_drawdown=float(self.max_drawdown[g, t, f]),
+                    )
+                    rows.append(row)
+        return rows
+
+    def to_pandas(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.rows())
+
+    def best(self, metric="final_bankroll", min_bets=1):
+        """
+        The best combination of each group.
+
+        Args:
+            metric (str, optional): Metric to maximize: "final_bankroll", "roi", "flat_roi" or "clv". Defaults to "final_bankroll".
+            min_bets (int, optional): Ignore thresholds placing fewer bets. Defaults to 1.
+
+        Returns:
+            list: Row dicts (see rows), one per group with enough bets.
+        """
+        import numpy as np
+
+        rows = self.rows()
+        per_group = len(self.thresholds) * len(self.fractions)
+        best = []
+        for g in range(len(self.groups)):
+            candidates = [
+                row
+                for row in rows[g * per_group : (g + 1) * per_group]
+                if row["bets"] >= min_bets and not np.isnan(row[metric])
+            ]
+            if candidates:
+                best.append(max(candidates, key=lambda row: row[metric]))
+        return best
+
+    def __repr__(self):
+        return (
+            f"BacktestResult({len(self.groups)} groups x {len(self.thresholds)} "
+            f"thresholds x {len(self.fractions)} fractions)"
+        )
@@ -0,0 +1,262 @@
+import heapq
+import inspect
+import itertools
+import queue
+import threading
+import time
+
+# Priority classes; lower runs first.
+LIVE = 0
+NORMAL = 1
+BULK = 2
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((name, _freeze(item)) for name, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def call_key(func, method, args, kwargs):
+    """
+    Identity of a client call: the method name and its bound arguments, however they are passed.
+
+    Args:
+        func (callable): The bound method.
+        method (str): Its name.
+        args (tuple): Positional arguments.
+        kwargs (dict): Keyword arguments.
+
+    Returns:
+        tuple: A hashable key.
+    """
+    try:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+    except TypeError:
+        return method, _freeze(args), _freeze(kwargs)
+    bound.apply_defaults()
+    return method, _freeze(bound.arguments)
+
+
+class BatchItem:
+    __slots__ = ("key", "method", "args", "kwargs", "priority", "seq", "added")
+
+    def __init__(self, key, method, args, kwargs, priority, seq):
+        """
+        A unique call in a batch.
+
+        Args:
+            key (tuple): Identity of the call: the method name and its bound arguments.
+            method (str): Name of the client method, e.g. "get_historical_outrights".
+            args (tuple): Positional arguments.
+            kwargs (dict): Keyword arguments.
+            priority (int): LIVE, NORMAL or BULK.
+            seq (int): Order in which the call was first added.
+        """
+        self.key = key
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.seq = seq
+        self.added = 1
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+    def __repr__(self):
+        return f"BatchItem({self.method!r}, {self.args!r}, {self.kwargs!r})"
+
+
+class BatchResult:
+    __slots__ = ("item", "value", "error", "seconds")
+
+    def __init__(self, item, value=None, error=None, seconds=0.0):
+        """
+        The outcome of one batch call.
+
+        Args:
+            item (BatchItem): The call.
+            value (object, optional): What the method returned. Defaults to None.
+            error (Exception, optional): What the method raised. Defaults to None.
+            seconds (float, optional): Time the call took. Defaults to 0.
+        """
+        self.item = item
+        self.value = value
+        self.error = error
+        self.seconds = seconds
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def result(self):
+        """
+        The returned value, or raise the call's error.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def __repr__(self):
+        outcome = f"error={self.error!r}" if self.error else "ok"
+        return f"BatchResult({self.item!r}, {outcome})"
+
+
+class Batch:
+    def __init__(self, dg, max_workers=8, reserved=1):
+        """
+        Initialize a batch of client calls run on a worker pool by priority.
+
+        Identical calls (the same method with the same bound arguments, however they are
+        passed) run once. Workers always take the most urgent pending call, and reserved
+        workers never take BULK calls, so LIVE calls added while a backfill is running
+        start without waiting for the bulk queue to drain.
+
+        Args:
+            dg (DataGolfSDK): The client; its transport, cache and rate limiter are shared by all workers.
+            max_workers (int, optional): Number of worker threads. Defaults to 8.
+            reserved (int, optional): Workers kept free of BULK calls. Defaults to 1.
+        """
+        self.dg = dg
+        self.max_workers = max_workers
+        self.bulk_limit = max(1, max_workers - reserved)
+        self.items = {}
+        self.duplicates = 0
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._results = queue.Queue()
+        self._pending = 0
+        self._bulk_running = 0
+        self._started = False
+        self._closed = False
+
+    def add(self, method, *args, priority=NORMAL, **kwargs):
+        """
+        Add a call, e.g. batch.add("get_historical_outrights", "pga", 14, 2023, "win", "pinnacle", priority=BULK).
+
+        Calls can be added while the batch runs, but not once it has finished. Adding a
+        call that is already pending raises its priority to the more urgent of the two.
+
+        Args:
+            method (str): Name of a client method.
+            *args: Positional arguments of the method.
+            priority (int, optional): LIVE, NORMAL or BULK. Defaults to NORMAL.
+            **kwargs: Keyword arguments of the method.
+
+        Returns:
+            BatchItem: The (possibly shared) call.
+
+        Raises:
+            RuntimeError: The batch has finished running.
+        """
+        if not callable(getattr(self.dg, method, None)):
+            raise AttributeError(f"{type(self.dg).__name__} has no method {method!r}")
+        key = call_key(getattr(self.dg, method), method, args, kwargs)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("the batch has finished running")
+            item = self.items.get(key)
+            if item is not None:
+                item.added += 1
+                self.duplicates += 1
+                if priority < item.priority and item in self._heap:
+                    item.priority = priority
+                    heapq.heapify(self._heap)
+                return item
+            item = BatchItem(key, method, args, kwargs, priority, next(self._seq))
+            self.items[key] = item
+            heapq.heappush(self._heap, item)
+            self._pending += 1
+            self._cond.notify()
+        return item
+
+    def __len__(self):
+        return len(self.items)
+
+    def _next(self):
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                if self._heap and (
+                    self._heap[0].priority < BULK
+                    or self._bulk_running < self.bulk_limit
+                ):
+                    item = heapq.heappop(self._heap)
+                    if item.priority >= BULK:
+                        self._bulk_running += 1
+                    return item
+                self._cond.wait()
+
+    def _work(self):
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            started = time.perf_counter()
+            try:
+                value = getattr(self.dg, item.method)(*item.args, **item.kwargs)
+                result = BatchResult(item, value)
+            except Exception as error:
+                result = BatchResult(item, error=error)
+            result.seconds = time.perf_counter() - started
+            with self._cond:
+                if item.priority >= BULK:
+                    self._bulk_running -= 1
+                self._cond.notify_all()
+            self._results.put(result)
+
+    def run(self):
+        """
+        Run the pending calls and yield their results as they complete.
+
+        A failing call yields a result holding its error and does not stop the batch.
+        Stopping the iteration early cancels the calls that have not started and drops
+        the results not yielded yet. A batch runs once; start a new one for more calls.
+
+        Returns:
+            generator: BatchResult objects, in completion order.
+
+        Raises:
+            RuntimeError: The batch was already run.
+        """
+        with self._cond:
+            if self._started:
+                raise RuntimeError("a batch can only be run once")
+            self._started = True
+        workers = [
+            threading.Thread(target=self._work, daemon=True)
+            for _ in range(self.max_workers)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            while True:
+                with self._cond:
+                    if not self._pending:
+                        return
+                result = self._results.get()
+                with self._cond:
+                    self._pending -= 1
+                yield result
+        finally:
+            with self._cond:
+                self._closed = True
+                for item in self._heap:
+                    del self.items[item.key]
+                self._pending -= len(self._heap)
+                self._heap.clear()
+                self._cond.notify_all()
+
+    def results(self):
+        """
+        Run the pending calls and wait for all of them.
+
+        Returns:
+            dict: BatchItem to its BatchResult.
+        """
+        return {result.item: result for result in self.run()}
@@ -0,0 +1,370 @@
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+
+logger = logging.getLogger(__name__)
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+FOREVER = float("inf")
+
+
+def normalize_params(params):
+    """
+    Normalize query parameters into a hashable, order-independent form.
+
+    The API key and parameters without a value are dropped, list values are joined
+    with commas and every value is converted to a string.
+
+    Args:
+        params (dict): Query parameters.
+
+    Returns:
+        tuple: Sorted (name, value) pairs.
+    """
+    items = []
+    for name, value in (params or {}).items():
+        if name == "key" or value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = ",".join(str(v) for v in value)
+        items.append((name, str(value)))
+    return tuple(sorted(items))
+
+
+def cache_key(endpoint, params):
+    """
+    Build the cache key for an endpoint call.
+
+    Args:
+        endpoint (str): The API endpoint.
+        params (dict): Query parameters.
+
+    Returns:
+        str: The endpoint followed by its normalized query string.
+    """
+    query = "&".join(f"{name}={value}" for name, value in normalize_params(params))
+    return f"{endpoint}?{query}"
+
+
+def historical_ttl(endpoint, params):
+    """
+    TTL for historical endpoints: past years never change, the current year and event lists do.
+    """
+    if endpoint.endswith("event-list"):
+        return 6 * HOUR
+    year = (params or {}).get("year")
+    try:
+        if year is not None and int(year) < date.today().year:
+            return FOREVER
+    except (TypeError, ValueError):
+        pass
+    return HOUR
+
+
+# First matching endpoint prefix wins. Values are seconds or callables of (endpoint, params).
+DEFAULT_TTL_POLICIES = [
+    ("historical-", historical_ttl),
+    ("preds/pre-tournament-archive", historical_ttl),
+    ("preds/in-play", 5 * MINUTE),
+    ("preds/live-", 5 * MINUTE),
+    ("betting-tools/", 5 * MINUTE),
+    ("field-updates", 5 * MINUTE),
+    ("preds/", HOUR),
+    ("get-schedule", 6 * HOUR),
+    ("get-player-list", 12 * HOUR),
+]
+
+
+class MemoryCache:
+    def __init__(self, max_entries=1024):
+        """
+        Initialize an in-memory LRU cache.
+
+        Args:
+            max_entries (int, optional): Maximum number of entries kept before the least recently used is evicted. Defaults to 1024.
+        """
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Look up a key.
+
+        Returns:
+            tuple or None: (expires_at, value), or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, value, expires_at):
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskCache:
+    def __init__(self, directory, max_bytes=512 * 1024 * 1024):
+        """
+        Initialize an on-disk cache with least-recently-used eviction.
+
+        Args:
+            directory (str): Directory holding the cache files. Created if missing.
+            max_bytes (int, optional): Maximum total size of the cache files. Defaults to 512 MB.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(entry.stat().st_size for entry in self._scan())
+
+    def _scan(self):
+        return [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.is_file() and entry.name.endswith(".cache")
+        ]
+
+    def _path(self, key):
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.cache")
+
+    def get(self, key):
+        """
+        Look up a key.
+
+        Returns:
+            tuple or None: (expires_at, value), or None on a miss.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                stored_key, expires_at, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if stored_key != key:
+            return None
+        if expires_at < time.time():
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            # Evicted or cleared since it was read; the value is still good.
+            pass
+        return expires_at, value
+
+    def set(self, key, value, expires_at):
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(
+                    (key, expires_at, value), f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        size = os.path.getsize(tmp_path)
+        with self._lock:
+            if os.path.exists(path):
+                self._size -= os.path.getsize(path)
+            os.replace(tmp_path, path)
+            self._size += size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _remove(self, path):
+        with self._lock:
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+            except OSError:
+                return
+            self._size -= size
+
+    def _evict(self):
+        entries = sorted(self._scan(), key=lambda entry: entry.stat().st_mtime)
+        for entry in entries:
+            if self._size <= self.max_bytes:
+                break
+            size = entry.stat().st_size
+            try:
+                os.remove(entry.path)
+            except OSError:
+                continue
+            self._size -= size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            for entry in self._scan():
+                os.remove(entry.path)
+            self._size = 0
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        max_entries=1024,
+        directory=None,
+        max_disk_bytes=512 * 1024 * 1024,
+        ttl_policies=None,
+        default_ttl=5 * MINUTE,
+    ):
+        """
+        Initialize a two-tier response cache.
+
+        Responses are kept in an in-memory LRU tier and, when a directory is given, in an
+        on-disk tier that survives restarts. Entries expire according to per-endpoint TTL
+        policies; the API key is never part of the cache key. Errors of the disk tier (an
+        unpicklable value, a full disk) are logged and otherwise ignored.
+
+        Args:
+            max_entries (int, optional): Maximum number of in-memory entries. Defaults to 1024.
+            directory (str, optional): Directory of the on-disk tier. Defaults to None (memory only).
+            max_disk_bytes (int, optional): Maximum size of the on-disk tier. Defaults to 512 MB.
+            ttl_policies (list, optional): (endpoint prefix, seconds or callable) pairs. Defaults to DEFAULT_TTL_POLICIES.
+            default_ttl (float, optional): TTL in seconds for endpoints matching no policy. Defaults to 5 minutes.
+        """
+        self.memory = MemoryCache(max_entries)
+        self.disk = DiskCache(directory, max_disk_bytes) if directory else None
+        self.ttl_policies = (
+            DEFAULT_TTL_POLICIES if ttl_policies is None else list(ttl_policies)
+        )
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+
+    def ttl(self, endpoint, params):
+        """
+        Resolve the TTL in seconds for an endpoint call.
+
+        Args:
+            endpoint (str): The API endpoint.
+            params (dict): Query parameters.
+
+        Returns:
+            float: Seconds the response stays fresh. 0 disables caching, FOREVER never expires.
+        """
+        for prefix, policy in self.ttl_policies:
+            if endpoint.startswith(prefix):
+                return policy(endpoint, params) if callable(policy) else policy
+        return self.default_ttl
+
+    def get(self, endpoint, params):
+        """
+        Look up a cached response.
+
+        Hits return the cached object itself, not a copy, so it is shared with every other
+        caller and must not be modified.
+
+        Args:
+            endpoint (str): The API endpoint.
+            params (dict): Query parameters.
+
+        Returns:
+            tuple: (hit, value). value is None on a miss.
+        """
+        key = cache_key(endpoint, params)
+        entry = self.memory.get(key)
+        if entry is not None:
+            with self._lock:
+                self.hits += 1
+                self.memory_hits += 1
+            return True, entry[1]
+        if self.disk is not None:
+            try:
+                entry = self.disk.get(key)
+            except Exception as error:
+                logger.warning("Reading %s from the disk cache failed: %s", key, error)
+                entry = None
+            if entry is not None:
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                self.memory.set(key, entry[1], entry[0])
+                return True, entry[1]
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def set(self, endpoint, params, value):
+        """
+        Store a response according to its endpoint's TTL policy.
+
+        Args:
+            endpoint (str): The API endpoint.
+            params (dict): Query parameters.
+            value (object): The parsed response.
+        """
+        ttl = self.ttl(endpoint, params)
+        if ttl <= 0:
+            return
+        key = cache_key(endpoint, params)
+        expires_at = time.time() + ttl
+        self.memory.set(key, value, expires_at)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, value, expires_at)
+            except Exception as error:
+                logger.warning("Writing %s to the disk cache failed: %s", key, error)
+
+    def clear(self):
+        """
+        Remove every entry from both tiers.
+        """
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    @property
+    def stats(self):
+        """
+        Hit/miss counters of the cache.
+
+        Returns:
+            dict: hits, misses, memory_hits, disk_hits, evictions and current in-memory entries.
+        """
+        evictions = self.memory.evictions
+        if self.disk is not None:
+            evictions += self.disk.evictions
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "evictions": evictions,
+            "entries": len(self.memory),
+        }
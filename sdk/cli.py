@@ -0,0 +1,197 @@
+"""
+Export DataGolf endpoints to disk.
+
+    datagolf get-player-list -o players.json
+    datagolf preds/skill-ratings get-schedule -p tour=pga -o exports/ --gzip
+    datagolf historical-raw-data/rounds --sweep -p tour=pga --years 2020-2024 --gzip
+
+Responses are streamed to the output files chunk by chunk. With --sweep, the
+endpoint's event list is fetched and every event is exported to
+<output>/tour=<tour>/year=<year>/event_id=<event_id>.<ext>.
+"""
+import json
+import os
+import sys
+
+# Historical endpoint to the event list that enumerates its events.
+EVENT_LISTS = {
+    "historical-raw-data/rounds": "historical-raw-data/event-list",
+    "historical-odds/outrights": "historical-odds/event-list",
+    "historical-odds/matchups": "historical-odds/event-list",
+    "historical-dfs-data/points": "historical-dfs-data/event-list",
+}
+
+
+def _parse_params(values):
+    params = {}
+    for value in values or []:
+        name, sep, item = value.partition("=")
+        if not sep:
+            raise ValueError(f"Expected name=value, got {value!r}")
+        params[name] = item
+    return params
+
+
+def _file_name(endpoint):
+    return endpoint.strip("/").replace("/", "_")
+
+
+def _extension(file_format, compress):
+    return f".{file_format}.gz" if compress else f".{file_format}"
+
+
+def plan_exports(
+    dg, endpoints, params, output, sweep=False, years=None, compress=False
+):
+    """
+    Plan the (endpoint, params, path) exports of a CLI run.
+
+    Args:
+        dg (DataGolfSDK): The client, used to fetch event lists when sweeping.
+        endpoints (list): API endpoints.
+        params (dict): Query parameters shared by every export, including file_format.
+        output (str): Output file (single export), directory, or "-" for stdout.
+        sweep (bool, optional): Export every event of each endpoint's event list. Defaults to False.
+        years (list, optional): Calendar years to keep when sweeping. Defaults to None (all).
+        compress (bool, optional): Gzip the files. Defaults to False.
+
+    Returns:
+        list: (endpoint, params, path) tuples.
+    """
+    ext = _extension(params["file_format"], compress)
+    single = len(endpoints) == 1 and not sweep
+    if output == "-" and not single:
+        raise ValueError("only a single export can be written to stdout")
+    if single and output and not (output.endswith(os.sep) or os.path.isdir(output)):
+        return [(endpoints[0], params, output)]
+    if not sweep:
+        return [
+            (endpoint, params, os.path.join(output or ".", _file_name(endpoint) + ext))
+            for endpoint in endpoints
+        ]
+
+    exports = []
+    for endpoint in endpoints:
+        if endpoint not in EVENT_LISTS:
+            raise ValueError(f"{endpoint} has no event list to sweep")
+        list_params = {"file_format": "json"}
+        if "tour" in params and EVENT_LISTS[endpoint] == "historical-odds/event-list":
+            list_params["tour"] = params["tour"]
+        root = output or _file_name(endpoint)
+        if len(endpoints) > 1:
+            root = os.path.join(root, _file_name(endpoint))
+        for event in dg.make_request(EVENT_LISTS[endpoint], list_params):
+            year = int(event["calendar_year"])
+            tour = event.get("tour") or params.get("tour", "pga")
+            if years and year not in years:
+                continue
+            if "tour" in params and tour != params["tour"]:
+                continue
+            event_params = dict(
+                params, tour=tour, event_id=event["event_id"], year=year
+            )
+            path = os.path.join(
+                root,
+                f"tour={tour}",
+                f"year={year}",
+                f"event_id={event['event_id']}{ext}",
+            )
+            exports.append((endpoint, event_params, path))
+    return exports
+
+
+def main(argv=None):
+    import argparse
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from sdk.backfill import _parse_years
+
+    parser = argparse.ArgumentParser(
+        prog="datagolf",
+        description=__doc__.strip().splitlines()[0],
+        epilog=__doc__.split("\n\n", 1)[1],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "endpoints", nargs="+", help="API endpoints, e.g. field-updates."
+    )
+    parser.add_argument(
+        "-p",
+        "--param",
+        action="append",
+        metavar="NAME=VALUE",
+        help="Query parameter, repeatable (e.g. -p tour=pga).",
+    )
+    parser.add_argument(
+        "-f",
+        "--file-format",
+        default="json",
+        choices=("json", "csv"),
+        help="Response format.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Output file of a single export, '-' for stdout, or a directory.",
+    )
+    parser.add_argument("--gzip", action="store_true", help="Gzip the output files.")
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Export every event of the endpoint's event list.",
+    )
+    parser.add_argument(
+        "--years", nargs="*", help="Years or ranges such as 2017-2024 to sweep."
+    )
+    parser.add_argument("--jobs", type=int, default=4, help="Concurrent exports.")
+    parser.add_argument(
+        "--api-key",
+        default=os.environ.get("apikey"),
+        help="DataGolf API key (default: the apikey environment variable).",
+    )
+    parser.add_argument("--base-url", default="https://feeds.datagolf.com")
+    args = parser.parse_args(argv)
+    if not args.api_key:
+        parser.error(
+            "an API key is required (--api-key or the apikey environment variable)"
+        )
+    try:
+        params = _parse_params(args.param)
+    except ValueError as error:
+        parser.error(str(error))
+    params["file_format"] = args.file_format
+    years = {year for value in args.years or [] for year in _parse_years(value)}
+
+    from sdk.datagolf_sdk import DataGolfSDK
+    from sdk.exceptions import DataGolfError
+
+    summary = {"exports": 0, "bytes": 0, "failed": []}
+    with DataGolfSDK(args.api_key, pool_size=args.jobs, base_url=args.base_url) as dg:
+        try:
+            exports = plan_exports(
+                dg, args.endpoints, params, args.output, args.sweep, years, args.gzip
+            )
+        except (ValueError, DataGolfError) as error:
+            parser.exit(1, f"datagolf: {error}\n")
+
+        def export(endpoint, export_params, path):
+            target = sys.stdout.buffer if path == "-" else path
+            return dg.download(endpoint, target, export_params, args.gzip)
+
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+            futures = {executor.submit(export, *job): job for job in exports}
+            for future in as_completed(futures):
+                path = futures[future][2]
+                try:
+                    summary["bytes"] += future.result()
+                    summary["exports"] += 1
+                except (DataGolfError, OSError) as error:
+                    summary["failed"].append({"path": path, "error": str(error)})
+
+    report = sys.stderr if args.output == "-" else sys.stdout
+    print(json.dumps(summary, indent=2), file=report)
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
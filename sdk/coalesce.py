@@ -0,0 +1,67 @@
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        """
+        Initialize a single-flight group.
+
+        While a call for a key is in flight, other callers asking for the same key wait
+        for it and receive its result (or exception) instead of starting their own.
+        """
+        self.coalesced = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func):
+        """
+        Run func for key, or wait for the identical call already in flight.
+
+        Args:
+            key (hashable): Identifies identical calls.
+            func (callable): Zero-argument callable performing the call.
+
+        Returns:
+            object: The result of func, shared by every caller of the same flight.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    @property
+    def in_flight(self):
+        """
+        Number of distinct calls currently in flight.
+        """
+        return len(self._calls)
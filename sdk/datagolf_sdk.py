@@ -1,51 +1,460 @@
-import requests
+import gzip
+import logging
+import os
+import threading
+import time
+
+from sdk.cache import ResponseCache, cache_key
+from sdk.coalesce import SingleFlight
+from sdk.decoders import get_decoder
+from sdk.exceptions import TransportError, error_for_response
+from sdk.metrics import Metrics
+from sdk.odds import ALL_ODDS_FORMATS, FETCH_ODDS_FORMAT, all_formats
+from sdk.ratelimit import TokenBucket
+from sdk.records import RECORD_SOURCES, RECORDS_FORMAT, to_records
+from sdk.retry import RetryPolicy, parse_retry_after
+from sdk.snapshot import SNAPSHOT_COLUMNS, SNAPSHOT_MARKETS, odds_snapshot
+from sdk.streaming import (
+    STREAM_CHUNK_SIZE,
+    STREAM_RECORD_KEYS,
+    iter_csv_records,
+    iter_json_records,
+)
+from sdk.tables import TABLE_FORMATS, read_table
+from sdk.transport import HTTPTransport
+
+logger = logging.getLogger(__name__)
 
 
 class DataGolfSDK:
-    def __init__(self, api_token):
+    def __init__(
+        self,
+        api_token,
+        transport=None,
+        pool_size=10,
+        timeout=30.0,
+        cache=None,
+        rate_limit=None,
+        retry=None,
+        metrics=None,
+        base_url="https://feeds.datagolf.com",
+        decoder="auto",
+    ):
         """
         Initialize the DataGolfSDK with the base URL and API token.
 
         Args:
-            base_url (str): The base URL of the DataGolf API.
             api_token (str): Your DataGolf API token.
+            transport (object, optional): Transport used to send requests. Any object with get(url, params, stream) and close() methods. Defaults to a pooled HTTPTransport.
+            pool_size (int, optional): Connection pool size of the default transport. Defaults to 10.
+            timeout (float or tuple, optional): Request timeout of the default transport in seconds. Defaults to 30.
+            cache (ResponseCache or bool, optional): Response cache to use, or True for a default in-memory cache. Cache hits (and concurrent coalesced calls) return the same object to every caller, so treat results as read-only and copy them before modifying. Defaults to None (no caching).
+            rate_limit (float or TokenBucket, optional): Requests per minute, or a limiter (e.g. a FileTokenBucket shared across processes). Defaults to None (no client-side limit).
+            retry (RetryPolicy, optional): Retry and backoff policy for throttled, failed and timed-out requests. Defaults to RetryPolicy().
+            metrics (Metrics, optional): Registry recording per-endpoint latency, payload size, parse time, status codes, retries and cache hits. Pass one to share it between clients. Defaults to a new Metrics().
+            base_url (str, optional): The base URL of the DataGolf API. Defaults to https://feeds.datagolf.com.
+            decoder (str or object, optional): JSON decoder: "orjson", "msgspec", "msgspec-typed" (known endpoints decode into typed Structs), "json", or an object with a decode(content, endpoint) method. Defaults to "auto", the fastest installed.
+
+        Every get_* method accepts file_format 'json', 'csv', 'pandas' or 'arrow'. The last two
+        request CSV and return a typed pandas DataFrame or Arrow table parsed straight from the
+        response bytes; set self.file_format to change the default. The historical rounds,
+        odds and DFS points methods also accept 'records', returning a compact RecordArray.
         """
-        self.base_url = "https://feeds.datagolf.com"
+        self.base_url = base_url.rstrip("/")
         self.api_token = api_token
         self.file_format = "json"
+        self.transport = transport or HTTPTransport(pool_size=pool_size, timeout=timeout)
+        self.cache = ResponseCache() if cache is True else cache or None
+        self.inflight = SingleFlight()
+        if rate_limit is None or isinstance(rate_limit, TokenBucket):
+            self.rate_limiter = rate_limit
+        else:
+            self.rate_limiter = TokenBucket(rate_limit)
+        self.retry = retry or RetryPolicy()
+        self.metrics = metrics or Metrics()
+        self.decoder = get_decoder(decoder)
+        self._refresher = None
+        self._refresher_lock = threading.Lock()
+
+    def close(self):
+        """
+        Stop the background refresher, if any, and close the underlying transport,
+        releasing its pooled connections.
+        """
+        if self._refresher is not None:
+            self._refresher.close()
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def batch(self, max_workers=8, reserved=1):
+        """
+        Start a batch of calls to this client's methods, deduplicated and run on a worker pool by priority.
+
+        Args:
+            max_workers (int, optional): Number of worker threads. Defaults to 8.
+            reserved (int, optional): Workers kept free of BULK calls for LIVE and NORMAL ones. Defaults to 1.
+
+        Returns:
+            Batch: Add calls with batch.add(method, *args, priority=...) and iterate batch.run() for results as they complete.
+        """
+        from sdk.batch import Batch
+
+        return Batch(self, max_workers, reserved)
+
+    @property
+    def refresher(self):
+        """
+        The background refresher behind keep_warm and get_warm, started on first use.
+        """
+        with self._refresher_lock:
+            if self._refresher is None:
+                from sdk.refresher import Refresher
+
+                self._refresher = Refresher(self)
+            return self._refresher
+
+    def keep_warm(self, method, *args, interval=None, **kwargs):
+        """
+        Keep a call's result fresh in the background, e.g. keep_warm("get_field_updates", "pga").
+
+        The call is refreshed until cool() is called for it. At most refresher.MAX_ENTRIES
+        calls are kept warm, so use a fixed set of arguments, not per-request ones.
+
+        Args:
+            method (str): Name of a get_* method.
+            *args: Positional arguments of the method.
+            interval (float, optional): Seconds between refreshes. Defaults to refresher.DEFAULT_INTERVALS, else 5 minutes.
+            **kwargs: Keyword arguments of the method.
+        """
+        self.refresher.register(method, *args, interval=interval, **kwargs)
+
+    def get_warm(self, method, *args, timeout=None, **kwargs):
+        """
+        Read the last good result of a call from memory, keeping it warm from then on.
+
+        Only the first read of a call waits for the API. When a refresh fails, the last good
+        value is still returned, with its age and the error. Like keep_warm, this keeps
+        refreshing the call until cool() is called for it.
+
+        Args:
+            method (str): Name of a get_* method.
+            *args: Positional arguments of the method.
+            timeout (float, optional): Seconds to wait for the first fetch. Defaults to None (no limit).
+            **kwargs: Keyword arguments of the method.
+
+        Returns:
+            WarmValue: The result as .value, with .age in seconds, .stale and .error.
+        """
+        return self.refresher.get(method, *args, timeout=timeout, **kwargs)
 
-    def make_request(self, endpoint, params=None):
+    def cool(self, method, *args, **kwargs):
+        """
+        Stop keeping a call warm, e.g. cool("get_field_updates", "pga").
+
+        Args:
+            method (str): Name of a get_* method.
+            *args: Positional arguments of the method.
+            **kwargs: Keyword arguments of the method.
+
+        Returns:
+            bool: True if the call was kept warm.
+        """
+        if self._refresher is None:
+            return False
+        return self._refresher.unregister(method, *args, **kwargs)
+
+    def make_request(self, endpoint, params=None, raw=False):
         """
         Make a request to the DataGolf API.
 
+        Successful responses are served from and stored in the response cache when one is configured.
+        Concurrent calls with the same endpoint and params share a single in-flight request;
+        self.inflight.coalesced counts the calls that were served this way.
+
+        With odds_format="all", the odds are fetched once in decimal and converted locally
+        to every format.
+
+        With raw=True, the response body is returned undecoded, as the bytes object the
+        transport received, for pipelines that forward payloads without reading them.
+        Raw requests bypass the response cache.
+
         Args:
             endpoint (str): The API endpoint.
             params (dict, optional): Query parameters. Defaults to None.
+            raw (bool or str, optional): Return the body as bytes, or "memoryview" for a zero-copy view of it. Defaults to False.
 
         Returns:
-            dict or None: The JSON response from the API or None if an error occurred.
+            dict: The JSON response from the API, or odds format to response with odds_format="all".
+
+        Raises:
+            APIError: The API answered with an error status after all retries.
+            TransportError: The request could not be sent after all retries.
         """
         params = params or {}
+        if raw:
+            if params.get("odds_format") == ALL_ODDS_FORMATS:
+                raise ValueError('odds_format="all" cannot be combined with raw')
+            content = self.inflight.do(
+                cache_key(endpoint, params) + "#raw",
+                lambda: self._request_raw(endpoint, params),
+            )
+            return memoryview(content) if raw == "memoryview" else content
+        if params.get("odds_format") == ALL_ODDS_FORMATS:
+            if params.get("file_format", "json") != "json":
+                raise ValueError('odds_format="all" requires file_format="json"')
+            payload = self.make_request(
+                endpoint, dict(params, odds_format=FETCH_ODDS_FORMAT)
+            )
+            return all_formats(payload)
+        if self.cache is not None:
+            hit, value = self.cache.get(endpoint, params)
+            if hit:
+                self.metrics.record_cache_hit(endpoint)
+                return value
+
+        return self.inflight.do(
+            cache_key(endpoint, params), lambda: self._fetch(endpoint, params)
+        )
+
+    def _fetch(self, endpoint, params):
+        result = self._request(endpoint, params)
+        if self.cache is not None:
+            self.cache.set(endpoint, params, result)
+        return result
+
+    def _wire_params(self, endpoint, params):
+        """
+        The query sent for params: the API key added, list values joined with commas (as
+        in the cache key) and local formats mapped to the format fetched for them.
+        """
+        file_format = params.get("file_format", "json")
+        params = {
+            name: ",".join(str(v) for v in value)
+            if isinstance(value, (list, tuple))
+            else value
+            for name, value in params.items()
+        }
         params["key"] = self.api_token
+        if file_format in TABLE_FORMATS:
+            params["file_format"] = "csv"
+        elif file_format == RECORDS_FORMAT:
+            if endpoint not in RECORD_SOURCES:
+                raise ValueError(
+                    f"{RECORDS_FORMAT!r} output is not supported for {endpoint}"
+                )
+            params["file_format"] = "json"
+        return params
+
+    def _request_raw(self, endpoint, params):
+        response = self._send(endpoint, self._wire_params(endpoint, params))
+        content = response.content
+        self.metrics.record_bytes(endpoint, len(content))
+        return content
+
+    def _request(self, endpoint, params):
+        file_format = params.get("file_format", "json")
+        params = self._wire_params(endpoint, params)
+
+        response = self._send(endpoint, params)
+        self.metrics.record_bytes(endpoint, len(response.content))
+
+        started = time.perf_counter()
+        if file_format == "json":
+            result = self.decoder.decode(response.content, endpoint)
+        elif file_format == RECORDS_FORMAT:
+            payload = self.decoder.decode(response.content, endpoint)
+            result = to_records(endpoint, payload)
+        elif file_format in TABLE_FORMATS:
+            result = read_table(
+                response.content, endpoint, file_format, params.get("odds_format")
+            )
+        else:
+            result = response.text
+        self.metrics.record_parse(endpoint, time.perf_counter() - started)
+        return result
 
+    def _send(self, endpoint, params, stream=False):
+        """
+        Send a request through the rate limiter, retrying throttled and transient failures.
+
+        Returns:
+            requests.Response: The successful (200) response.
+        """
         url = f"{self.base_url}/{endpoint}"
 
-        print(url)
-        response = requests.get(url, params=params)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GET %s", cache_key(endpoint, params))
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            started = time.perf_counter()
+            try:
+                response = self.transport.get(url, params=params, stream=stream)
+            except TransportError as error:
+                if not self.retry.should_retry(attempt, error=error):
+                    self.metrics.record_error(endpoint)
+                    raise
+                logger.warning("Retrying %s after transport error: %s", endpoint, error)
+                self.metrics.record_retry(endpoint)
+                time.sleep(self.retry.delay(attempt))
+                attempt += 1
+                continue
+            self.metrics.record_response(
+                endpoint, response.status_code, time.perf_counter() - started
+            )
 
-        if response.status_code == 200 and params["file_format"] == "json":
-            return response.json()
-        if response.status_code == 200 and params["file_format"] == "csv":
-            return response.text
-        else:
-            # Handle error cases here
-            print(
-                "Something went wrong with the request : Error "
-                + str(response.status_code)
-                + " : "
-                + response.text
+            if response.status_code == 200:
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if not self.retry.should_retry(attempt, response.status_code):
+                self.metrics.record_error(endpoint)
+                error = error_for_response(response, endpoint, retry_after)
+                response.close()
+                raise error
+            response.close()
+            delay = self.retry.delay(attempt, retry_after)
+            logger.warning(
+                "Retrying %s in %.1fs after status %s",
+                endpoint,
+                delay,
+                response.status_code,
             )
-            return None
+            self.metrics.record_retry(endpoint)
+            if response.status_code == 429 and self.rate_limiter is not None:
+                # Hold back every caller sharing the limiter, not just this one.
+                self.rate_limiter.pause(delay)
+            else:
+                time.sleep(delay)
+            attempt += 1
+
+    def stream_request(self, endpoint, params=None, record_key=None):
+        """
+        Make a request to the DataGolf API and yield its records as they are downloaded.
+
+        The response body is parsed incrementally, so memory stays bounded regardless of the
+        payload size and processing can start before the download finishes. Streamed
+        responses bypass the response cache.
+
+        Args:
+            endpoint (str): The API endpoint.
+            params (dict, optional): Query parameters; file_format json (default) or csv. Defaults to None.
+            record_key (str, optional): Top-level key of the JSON record array. Defaults to the endpoint's entry in STREAM_RECORD_KEYS.
+
+        Returns:
+            generator: A generator of records (dicts for CSV rows).
+
+        Raises:
+            ValueError: The file format or odds_format="all" cannot be streamed.
+            APIError: The API answered with an error status after all retries.
+            TransportError: The request could not be sent after all retries.
+        """
+        params = dict(params or {})
+        params.setdefault("file_format", "json")
+        file_format = params["file_format"]
+        if file_format not in ("json", "csv"):
+            raise ValueError(f"file_format {file_format!r} cannot be streamed")
+        if params.get("odds_format") == ALL_ODDS_FORMATS:
+            raise ValueError('odds_format="all" cannot be streamed')
+        response = self._send(endpoint, self._wire_params(endpoint, params), stream=True)
+
+        try:
+            chunks = self._count_bytes(
+                endpoint, response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            )
+            if file_format == "csv":
+                records = iter_csv_records(chunks)
+            else:
+                records = iter_json_records(
+                    chunks, record_key or STREAM_RECORD_KEYS.get(endpoint)
+                )
+        except BaseException:
+            response.close()
+            raise
+        return self._closing(records, response)
+
+    def download(self, endpoint, path, params=None, compress=False):
+        """
+        Stream a response straight to a file, chunk by chunk, without holding the payload in memory.
+
+        The file is written under a temporary name and renamed when complete, so readers
+        never see a partial export.
+
+        Args:
+            endpoint (str): The API endpoint.
+            path (str or file): Destination path, or a binary file object such as sys.stdout.buffer.
+            params (dict, optional): Query parameters. Defaults to None (JSON output).
+            compress (bool, optional): Gzip the file. Defaults to False.
+
+        Returns:
+            int: Bytes received (before compression).
+
+        Raises:
+            APIError: The API answered with an error status after all retries.
+            TransportError: The request could not be sent after all retries.
+        """
+        params = dict(params or {})
+        params.setdefault("file_format", "json")
+        if params.get("odds_format") == ALL_ODDS_FORMATS:
+            raise ValueError('odds_format="all" cannot be downloaded')
+        response = self._send(endpoint, self._wire_params(endpoint, params), stream=True)
+        chunks = self._count_bytes(
+            endpoint, response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+        )
+        size = 0
+        try:
+            if hasattr(path, "write"):
+                target = gzip.GzipFile(fileobj=path, mode="wb") if compress else path
+                for chunk in chunks:
+                    target.write(chunk)
+                    size += len(chunk)
+                if compress:
+                    target.close()
+                return size
+
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            try:
+                with (gzip.open if compress else open)(tmp_path, "wb") as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+                        size += len(chunk)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            return size
+        finally:
+            chunks.close()
+            response.close()
+
+    def _count_bytes(self, endpoint, chunks):
+        size = 0
+        try:
+            for chunk in chunks:
+                size += len(chunk)
+                yield chunk
+        except OSError as error:
+            # Reading a streamed body failed midway (requests errors are OSErrors).
+            raise TransportError(str(error)) from error
+        finally:
+            self.metrics.record_bytes(endpoint, size)
+
+    @staticmethod
+    def _closing(records, response):
+        try:
+            yield from records
+        finally:
+            response.close()
 
     def get_player_list(self, file_format=None):
         """
@@ -55,7 +464,7 @@ class DataGolfSDK:
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The player list or None if an error occurred.
+            dict: The player list.
         """
         endpoint = f"get-player-list"
         params = {"file_format": file_format or self.file_format}
@@ -70,7 +479,7 @@ class DataGolfSDK:
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The tour schedules or None if an error occurred.
+            dict: The tour schedules.
         """
         endpoint = f"get-schedule"
         params = {"tour": tour, "file_format": file_format or self.file_format}
@@ -85,7 +494,7 @@ class DataGolfSDK:
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"field-updates"
         params = {"tour": tour, "file_format": file_format or self.file_format}
@@ -99,7 +508,7 @@ class DataGolfSDK:
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"preds/get-dg-rankings"
         params = {"file_format": file_format or self.file_format}
@@ -120,11 +529,11 @@ class DataGolfSDK:
             tour (str, optional): The desired tour - pga (default), euro, kft, opp (opposite field PGA TOUR event), alt.
             add_position (str, optional): Comma-separated list of additional positions to include in output. Defaults are win, top 5, top 10, top 20, make cut. Options : 1, 2, 3 .... 48, 49, 50
             dead_heat (str, optional): Adjusts odds for dead-heat rules - yes (default), no.
-            odds_format (str, optional): The desired odds format - percent (default), american, decimal, fraction.
+            odds_format (str, optional): The desired odds format - percent (default), american, decimal, fraction, or all (every format, converted locally from one request).
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"preds/pre-tournament"
         params = {
@@ -149,11 +558,11 @@ class DataGolfSDK:
         Args:
             event_id (str): The desired event id.
             year (int): The desired year (format - YYYY)
-            odds_format (str): The desired odds format - american (default), decimal, fractional.
+            odds_format (str): The desired odds format - american (default), decimal, fractional, or all (every format, converted locally from one request).
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"preds/pre-tournament-archive"
         params = {
@@ -173,7 +582,7 @@ class DataGolfSDK:
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"preds/player-decompositions"
         params = {"tour": tour, "file_format": file_format or self.file_format}
@@ -188,7 +597,7 @@ class DataGolfSDK:
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"preds/skill-ratings"
         params = {"display": display, "file_format": file_format or self.file_format}
@@ -203,7 +612,7 @@ class DataGolfSDK:
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"preds/approach-skill"
         params = {"period": period, "file_format": file_format or self.file_format}
@@ -222,7 +631,7 @@ class DataGolfSDK:
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"preds/fantasy-projection-defaults"
         params = {
@@ -245,11 +654,11 @@ class DataGolfSDK:
         Args:
             tour (str): The desired tour - pga (default), euro, opp (opposite field PGA TOUR event), kft, alt.
             dead_heat (str): Adjusts odds for dead-heat rules - no (default), yes.
-            odds_format (str): The desired odds format - percent (default), american, decimal, fraction.
+            odds_format (str): The desired odds format - percent (default), american, decimal, fraction, or all (every format, converted locally from one request).
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"preds/in-play"
         params = {
@@ -270,7 +679,7 @@ class DataGolfSDK:
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The live strokes-gained data or None if an error occurred.
+            dict: The live strokes-gained data.
         """
         endpoint = f"preds/live-strokes-gained"
         params = {
@@ -293,7 +702,7 @@ class DataGolfSDK:
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"preds/live-tournament-stats"
         params = {
@@ -313,7 +722,7 @@ class DataGolfSDK:
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"preds/live-hole-stats"
         params = {
@@ -331,11 +740,11 @@ class DataGolfSDK:
         Args:
             tour (str): Specifies the tour - pga (default), euro, kft, opp (opposite field PGA TOUR event), alt.
             market (str): Specifies the match-up market - win, top_5, top_10, top_20, mc, make_cut, frl.
-            odds_format (str): Specifies the odds format - percent (default), american, decimal, fraction.
+            odds_format (str): Specifies the odds format - percent (default), american, decimal, fraction, or all (every format, converted locally from one request).
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"betting-tools/outrights"
         params = {
@@ -355,11 +764,11 @@ class DataGolfSDK:
         Args:
             tour (str): Specifies the tour - pga (default), euro, opp (opposite field PGA TOUR event), alt.
             market (str): Specifies the match-up market - tournament_matchups, round_matchups, 3_balls.
-            odds_format (str): Specifies the odds format - percent (default), american, decimal, fraction.
+            odds_format (str): Specifies the odds format - percent (default), american, decimal, fraction, or all (every format, converted locally from one request).
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"betting-tools/matchups"
         params = {
@@ -378,11 +787,11 @@ class DataGolfSDK:
 
         Args:
             tour (str, optional): Specifies the tour - pga (default), euro, opp, alt.
-            odds_format (str, optional): Specifies the odds format - percent, american, decimal (default), fraction.
+            odds_format (str, optional): Specifies the odds format - percent, american, decimal (default), fraction, or all (every format, converted locally from one request).
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"betting-tools/matchups-all-pairings"
         params = {
@@ -394,6 +803,47 @@ class DataGolfSDK:
             params["odds_format"] = odds_format
         return self.make_request(endpoint, params)
 
+    def get_odds_snapshot(
+        self,
+        tours=("pga",),
+        markets=SNAPSHOT_MARKETS,
+        odds_format="decimal",
+        file_format=None,
+        max_workers=10,
+        errors=None,
+    ):
+        """
+        Returns the current outright, match-up and all-pairings odds of several tours and markets in one long table, fetched concurrently over the pooled connections.
+
+        A feed that fails, e.g. a market a tour does not offer, is left out with a warning instead of failing the whole board.
+
+        Args:
+            tours (list, optional): Tours to include - pga, euro, kft, opp, alt. Defaults to ("pga",).
+            markets (list, optional): Outright markets (win, top_5, top_10, top_20, make_cut, frl), match-up markets (tournament_matchups, round_matchups, 3_balls) and/or all_pairings. Defaults to all of them.
+            odds_format (str, optional): Specifies the odds format - percent, american, decimal (default), fraction.
+            file_format (str, optional): json (a list of rows), pandas or arrow. Defaults to 'json'.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 10.
+            errors (dict, optional): Filled with the (tour, market) of each failed feed and its exception. Defaults to None.
+
+        Returns:
+            list: One row per tour, market, player, book (and match-up opponents) with tour, market, dg_id, player_name, book, odds, opponents, event_name and last_updated.
+        """
+        rows, failed = odds_snapshot(self, tours, markets, odds_format, max_workers)
+        if errors is not None:
+            errors.update(failed)
+        file_format = file_format or self.file_format
+        if file_format == "pandas":
+            import pandas as pd
+
+            return pd.DataFrame(rows, columns=list(SNAPSHOT_COLUMNS))
+        if file_format == "arrow":
+            import pyarrow as pa
+
+            return pa.table(
+                {name: [row[name] for row in rows] for name in SNAPSHOT_COLUMNS}
+            )
+        return rows
+
     def get_historical_raw_data_event_ids(self, file_format=None):
         """
         Returns the list of tournaments (and corresponding IDs) that are available through the historical raw data API endpoint. Use this endpoint to fill the event_id and year query parameters in the Round Scoring & Strokes Gained endpoint.
@@ -402,7 +852,7 @@ class DataGolfSDK:
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The event IDs or None if an error occurred.
+            dict: The event IDs.
         """
         endpoint = f"historical-raw-data/event-list"
         params = {
@@ -416,6 +866,7 @@ class DataGolfSDK:
         event_id: str,
         year: int,
         file_format=None,
+        stream=False,
     ):
         """
         Returns round-level scoring, traditional stats, strokes-gained, and tee time data across 22 global tours.
@@ -425,9 +876,10 @@ class DataGolfSDK:
             event_id (str): Specifies the event. Use "all" to return every event for the given year and tour.
             year (int): Specifies the calendar year (not season) of the event. 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
+            stream (bool, optional): Yield records one at a time from the response stream instead of returning the full payload. Defaults to False.
 
         Returns:
-            dict or None: The round scoring data or None if an error occurred.
+            dict: The round scoring data. A generator of records when stream is True.
         """
         endpoint = f"historical-raw-data/rounds"
         params = {
@@ -436,6 +888,8 @@ class DataGolfSDK:
             "year": year,
             "file_format": file_format or self.file_format,
         }
+        if stream:
+            return self.stream_request(endpoint, params)
         return self.make_request(endpoint, params)
 
     def get_historical_odds_data_event_ids(self, tour: str, file_format=None):
@@ -447,7 +901,7 @@ class DataGolfSDK:
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"historical-odds/event-list"
         params = {
@@ -465,6 +919,7 @@ class DataGolfSDK:
         book: str,
         odds_format: str = None,
         file_format=None,
+        stream=False,
     ):
         """
         Returns opening and closing lines in various markets (win, top 5, make cut, etc.) at 11 sportsbooks. Bet outcomes also included.
@@ -475,11 +930,12 @@ class DataGolfSDK:
             year (int): Specifies the calendar year (not season) of the event. 2019, 2020, 2021, 2022, 2023 (default)
             market (str): Specifies the market/finish position.
             book (str): Specifies the bookmaker.
-            odds_format (str): Specifies the odds format.
+            odds_format (str): Specifies the odds format - percent, american, decimal, fraction, or all (every format, converted locally from one request).
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
+            stream (bool, optional): Yield records one at a time from the response stream instead of returning the full payload. Defaults to False.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates. A generator of records when stream is True.
         """
         endpoint = f"historical-odds/outrights"
         params = {
@@ -491,6 +947,8 @@ class DataGolfSDK:
             "odds_format": odds_format,
             "file_format": file_format or self.file_format,
         }
+        if stream:
+            return self.stream_request(endpoint, params)
         return self.make_request(endpoint, params)
 
     def get_historical_matchups_3balls(
@@ -501,6 +959,7 @@ class DataGolfSDK:
         book: str,
         odds_format: str = None,
         file_format=None,
+        stream=False,
     ):
         """
         Returns opening and closing lines for tournament match-ups, round match-ups, and 3-balls at 12 sportsbooks. Bet outcomes also included.
@@ -510,11 +969,12 @@ class DataGolfSDK:
             event_id (str): Specifies the event.
             year (int): Specifies the calendar year (not season) of the event. 2019, 2020, 2021, 2022, 2023 (default)
             book (str): Specifies the bookmaker.
-            odds_format (str): Specifies the odds format.
+            odds_format (str): Specifies the odds format - percent, american, decimal, fraction, or all (every format, converted locally from one request).
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
+            stream (bool, optional): Yield records one at a time from the response stream instead of returning the full payload. Defaults to False.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates. A generator of records when stream is True.
         """
         endpoint = f"historical-odds/matchups"
         params = {
@@ -525,6 +985,8 @@ class DataGolfSDK:
             "odds_format": odds_format,
             "file_format": file_format or self.file_format,
         }
+        if stream:
+            return self.stream_request(endpoint, params)
         return self.make_request(endpoint, params)
 
     def get_historical_dfs_data_event_ids(self, file_format=None):
@@ -535,7 +997,7 @@ class DataGolfSDK:
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates.
         """
         endpoint = f"historical-dfs-data/event-list"
         params = {
@@ -550,6 +1012,7 @@ class DataGolfSDK:
         year: int,
         site: str = None,
         file_format=None,
+        stream=False,
     ):
         """
         Returns salaries and ownerships alongside event-level finish, hole, and bonus scoring for PGA and European Tour events.
@@ -560,9 +1023,10 @@ class DataGolfSDK:
             year (int): Specifies the calendar year (not season) of the event. 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025
             site (str, optional): Specifies the site. draftkings (default), fanduel
             file_format (str, optional): The desired file format of the response. Defaults to 'json' , csv.
+            stream (bool, optional): Yield records one at a time from the response stream instead of returning the full payload. Defaults to False.
 
         Returns:
-            dict or None: The field updates or None if an error occurred.
+            dict: The field updates. A generator of records when stream is True.
         """
         endpoint = f"historical-dfs-data/points"
         params = {
@@ -573,4 +1037,6 @@ class DataGolfSDK:
         }
         if site:
             params["site"] = site
+        if stream:
+            return self.stream_request(endpoint, params)
         return self.make_request(endpoint, params)
@@ -0,0 +1,301 @@
+import json
+import threading
+
+from sdk.tables import COLUMN_TYPES
+
+# Decoder names, in the order "auto" tries them.
+DECODERS = ("orjson", "msgspec", "json")
+
+_EVENT_FIELDS = {
+    "tour": "str",
+    "year": "int",
+    "season": "int",
+    "event_id": "int",
+    "event_name": "str",
+    "event_completed": "str",
+}
+_PLAYER_FIELDS = ("dg_id", "player_name", "fin_text")
+
+
+def _round_fields():
+    fields = {}
+    for name, kind in COLUMN_TYPES["historical-raw-data/rounds"].items():
+        if name in _EVENT_FIELDS or name in _PLAYER_FIELDS or name == "round_num":
+            continue
+        fields["score" if name == "round_score" else name] = kind
+    return fields
+
+
+def _odds_fields(endpoint):
+    fields = {
+        name: kind
+        for name, kind in COLUMN_TYPES[endpoint].items()
+        if name not in _EVENT_FIELDS and name not in ("book", "market")
+    }
+    fields.setdefault("open_time", "str")
+    fields.setdefault("close_time", "str")
+    return fields
+
+
+def _camel(name):
+    return "".join(part.capitalize() for part in name.replace("/", "_").split("_"))
+
+
+def _event(record_key, record_fields, event_fields):
+    return dict(event_fields, **{record_key: [record_fields]})
+
+
+# Endpoint to the declared shape of its JSON payload, used for typed msgspec decoding:
+# a dict of field name to kind ("int", "float", "str", "odds" or a nested shape), or a
+# list holding the shape of its items. Every field may be missing or null.
+SCHEMAS = {
+    "get-player-list": [
+        dict(COLUMN_TYPES["get-player-list"], amateur="int", country_code="str")
+    ],
+    "historical-raw-data/rounds": dict(
+        _EVENT_FIELDS,
+        scores=[
+            dict(
+                {"dg_id": "int", "player_name": "str", "fin_text": "str"},
+                **{f"round_{n}": _round_fields() for n in range(1, 5)},
+            )
+        ],
+    ),
+    "historical-odds/outrights": _event(
+        "odds",
+        _odds_fields("historical-odds/outrights"),
+        dict(_EVENT_FIELDS, book="str", market="str"),
+    ),
+    "historical-odds/matchups": _event(
+        "odds",
+        _odds_fields("historical-odds/matchups"),
+        dict(_EVENT_FIELDS, book="str"),
+    ),
+    "historical-dfs-data/points": _event(
+        "dfs_points",
+        dict(COLUMN_TYPES["historical-dfs-data/points"]),
+        dict(_EVENT_FIELDS, site="str"),
+    ),
+}
+
+
+# Struct classes built from SCHEMAS, by name. They are created once per process and
+# resolved as attributes of this module, so typed payloads can be pickled.
+_STRUCTS = {}
+_STRUCTS_LOCK = threading.Lock()
+
+
+def _struct_type(name, shape):
+    import msgspec
+    from typing import List, Optional, Union
+
+    if isinstance(shape, list):
+        return List[_struct_type(name, shape[0])]
+    if isinstance(shape, dict):
+        struct = _STRUCTS.get(name)
+        if struct is None:
+            fields = [
+                (field, Optional[_struct_type(name + _camel(field), kind)], None)
+                for field, kind in shape.items()
+            ]
+            struct = msgspec.defstruct(name, fields, kw_only=True, module=__name__)
+            _STRUCTS[name] = struct
+        return struct
+    return {"int": int, "float": float, "str": str}.get(shape, Union[float, str])
+
+
+def schema_type(endpoint):
+    """
+    The msgspec type of an endpoint's payload, built from its entry in SCHEMAS.
+
+    Args:
+        endpoint (str): An endpoint of SCHEMAS.
+
+    Returns:
+        type: A Struct class, or a list of them.
+    """
+    with _STRUCTS_LOCK:
+        return _struct_type(_camel(endpoint.replace("-", "_")), SCHEMAS[endpoint])
+
+
+def __getattr__(name):
+    # Unpickling looks Struct classes up here, possibly before any decoder built them.
+    for endpoint in SCHEMAS:
+        if name.startswith(_camel(endpoint.replace("-", "_"))):
+            schema_type(endpoint)
+            if name in _STRUCTS:
+                return _STRUCTS[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def is_typed(payload):
+    """
+    Whether a payload was decoded into Structs by a "msgspec-typed" decoder.
+
+    Args:
+        payload (object): A decoded payload.
+
+    Returns:
+        bool: True for a Struct or a list of Structs.
+    """
+    if isinstance(payload, list):
+        payload = payload[0] if payload else None
+    return type(payload).__module__ == __name__ and type(payload).__name__ in _STRUCTS
+
+
+def require_dicts(payload, consumer):
+    """
+    Reject payloads decoded into Structs, for consumers that read dicts.
+
+    Args:
+        payload (object): A decoded payload.
+        consumer (str): Name of the consumer, for the error message.
+
+    Returns:
+        object: payload, unchanged.
+
+    Raises:
+        TypeError: The payload was decoded by a "msgspec-typed" decoder.
+    """
+    if is_typed(payload):
+        raise TypeError(
+            f"{consumer} reads JSON payloads as dicts; use a client whose decoder is "
+            'not "msgspec-typed" (e.g. decoder="msgspec")'
+        )
+    return payload
+
+
+def _plain(value):
+    fields = getattr(type(value), "__struct_fields__", None)
+    if fields is not None:
+        items = ((name, getattr(value, name)) for name in fields)
+        return {name: _plain(item) for name, item in items if item is not None}
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+def to_dicts(payload):
+    """
+    Convert a payload decoded into Structs back to dicts and lists, leaving out the
+    fields that were missing or null. Other payloads are returned unchanged.
+
+    Args:
+        payload (object): A decoded payload.
+
+    Returns:
+        object: The payload as plain JSON values.
+    """
+    return _plain(payload) if is_typed(payload) else payload
+
+
+class StdlibDecoder:
+    """
+    Decode JSON with the standard library.
+    """
+
+    name = "json"
+
+    def decode(self, content, endpoint=None):
+        """
+        Decode a JSON response body.
+
+        Args:
+            content (bytes or memoryview): The response body.
+            endpoint (str, optional): The API endpoint. Unused. Defaults to None.
+
+        Returns:
+            object: The decoded payload.
+        """
+        if isinstance(content, memoryview):
+            content = content.tobytes()
+        return json.loads(content)
+
+
+class OrjsonDecoder:
+    """
+    Decode JSON with orjson, several times faster than the standard library.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._loads = orjson.loads
+
+    def decode(self, content, endpoint=None):
+        return self._loads(content)
+
+
+class MsgspecDecoder:
+    def __init__(self, typed=False):
+        """
+        Initialize a msgspec JSON decoder.
+
+        With typed=True, payloads of the endpoints in SCHEMAS are decoded straight into
+        msgspec Structs of their declared fields: values are type-checked while parsing,
+        records use a fraction of the memory of dicts, and undeclared fields are skipped
+        instead of being decoded. Other endpoints decode to plain dicts and lists. Structs
+        pickle, but the helpers reading payloads as dicts reject them (see require_dicts).
+
+        Args:
+            typed (bool, optional): Decode known endpoints into Structs. Defaults to False.
+        """
+        import msgspec
+
+        self._msgspec = msgspec
+        self.typed = typed
+        self.name = "msgspec-typed" if typed else "msgspec"
+        self._untyped = msgspec.json.Decoder()
+        self._decoders = {}
+
+    def decoder(self, endpoint=None):
+        """
+        The msgspec decoder used for an endpoint's payloads.
+
+        Args:
+            endpoint (str, optional): The API endpoint. Defaults to None (untyped).
+
+        Returns:
+            msgspec.json.Decoder: The decoder, built once per endpoint.
+        """
+        if not self.typed or endpoint not in SCHEMAS:
+            return self._untyped
+        decoder = self._decoders.get(endpoint)
+        if decoder is None:
+            decoder = self._msgspec.json.Decoder(schema_type(endpoint))
+            self._decoders[endpoint] = decoder
+        return decoder
+
+    def decode(self, content, endpoint=None):
+        return self.decoder(endpoint).decode(content)
+
+
+def get_decoder(decoder="auto"):
+    """
+    Resolve a JSON decoder.
+
+    Args:
+        decoder (str or object, optional): "auto" (the fastest installed of DECODERS), "orjson", "msgspec", "msgspec-typed", "json", or any object with a decode(content, endpoint) method. Defaults to "auto".
+
+    Returns:
+        object: The decoder.
+    """
+    if decoder is None or decoder == "auto":
+        for name in DECODERS:
+            try:
+                return get_decoder(name)
+            except ImportError:
+                continue
+    if not isinstance(decoder, str):
+        return decoder
+    if decoder == "orjson":
+        return OrjsonDecoder()
+    if decoder == "msgspec":
+        return MsgspecDecoder()
+    if decoder == "msgspec-typed":
+        return MsgspecDecoder(typed=True)
+    if decoder == "json":
+        return StdlibDecoder()
+    raise ValueError(f"Unknown decoder {decoder!r}; expected one of {DECODERS}")
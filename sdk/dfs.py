@@ -0,0 +1,566 @@
+import os
+
+from sdk.decoders import require_dicts
+
+# Site to (salary cap, golfers per lineup) of its classic PGA contests.
+SITES = {
+    "draftkings": (50000, 6),
+    "fanduel": (60000, 6),
+    "yahoo": (200, 6),
+}
+
+# Candidate lineups generated per vectorized pass.
+_BATCH = 1024
+
+# Width in points of the histogram bins used for simulated percentiles.
+HISTOGRAM_BIN = 0.5
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class DFSPool:
+    def __init__(
+        self,
+        dg_ids,
+        names,
+        salaries,
+        points,
+        std_devs=None,
+        ownership=None,
+        site="draftkings",
+        cap=None,
+        roster_size=None,
+    ):
+        """
+        Initialize a DFS player pool as dense arrays.
+
+        Args:
+            dg_ids (list): Player ids.
+            names (list): Player names.
+            salaries (list): Salaries.
+            points (list): Projected (or actual) fantasy points.
+            std_devs (list, optional): Standard deviations of the points. Defaults to None (no variance).
+            ownership (list, optional): Projected or actual ownership, in percent. Defaults to None.
+            site (str, optional): draftkings, fanduel or yahoo. Defaults to "draftkings".
+            cap (int, optional): Salary cap. Defaults to the site's entry in SITES.
+            roster_size (int, optional): Golfers per lineup. Defaults to the site's entry in SITES.
+        """
+        import numpy as np
+
+        site_cap, site_roster = SITES.get(site, (None, None))
+        self.site = site
+        self.cap = cap if cap is not None else site_cap
+        self.roster_size = roster_size if roster_size is not None else site_roster
+        if self.cap is None or self.roster_size is None:
+            raise ValueError(f"Unknown site {site!r}; pass cap and roster_size")
+        self.dg_ids = np.asarray(dg_ids, dtype=np.int64)
+        self.names = list(names)
+        self.salaries = np.asarray(salaries, dtype=np.int64)
+        self.points = np.nan_to_num(np.asarray(points, dtype=np.float64))
+        n = len(self.dg_ids)
+        self.std_devs = (
+            np.zeros(n)
+            if std_devs is None
+            else np.nan_to_num(np.asarray(std_devs, dtype=np.float64))
+        )
+        self.ownership = (
+            np.full(n, np.nan)
+            if ownership is None
+            else np.asarray(ownership, dtype=np.float64)
+        )
+        self._index = {dg_id: i for i, dg_id in enumerate(self.dg_ids.tolist())}
+
+    @classmethod
+    def from_projections(cls, payload, cap=None, roster_size=None):
+        """
+        Build a pool from a get_fantasy_projection_defaults payload.
+
+        Players without a salary are left out.
+
+        Args:
+            payload (dict): The JSON payload.
+            cap (int, optional): Salary cap. Defaults to the payload site's.
+            roster_size (int, optional): Golfers per lineup. Defaults to the payload site's.
+
+        Returns:
+            DFSPool: The pool.
+        """
+        payload = require_dicts(payload, "DFSPool")
+        rows = [
+            row for row in payload.get("projections") or [] if row.get("salary")
+        ]
+        return cls(
+            [row.get("dg_id") for row in rows],
+            [row.get("player_name") for row in rows],
+            [row.get("salary") for row in rows],
+            [_float(row.get("proj_points_total")) for row in rows],
+            [_float(row.get("std_dev")) for row in rows],
+            [_float(row.get("proj_ownership")) for row in rows],
+            payload.get("site") or "draftkings",
+            cap,
+            roster_size,
+        )
+
+    @classmethod
+    def from_points(cls, payload, cap=None, roster_size=None):
+        """
+        Build a pool of actual results from a get_dfs_points_salaries payload, e.g. to find
+        the best lineups in hindsight or score submitted ones.
+
+        Args:
+            payload (dict): The JSON payload.
+            cap (int, optional): Salary cap. Defaults to the payload site's.
+            roster_size (int, optional): Golfers per lineup. Defaults to the payload site's.
+
+        Returns:
+            DFSPool: The pool, with the actual total points as points.
+        """
+        payload = require_dicts(payload, "DFSPool")
+        rows = [row for row in payload.get("dfs_points") or [] if row.get("salary")]
+        return cls(
+            [row.get("dg_id") for row in rows],
+            [row.get("player_name") for row in rows],
+            [row.get("salary") for row in rows],
+            [_float(row.get("total_pts")) for row in rows],
+            None,
+            [_float(row.get("ownership")) for row in rows],
+            payload.get("site") or "draftkings",
+            cap,
+            roster_size,
+        )
+
+    @classmethod
+    def from_api(cls, dg, tour="pga", site="draftkings", slate="main"):
+        """
+        Build a pool from the current fantasy projections.
+
+        Args:
+            dg (DataGolfSDK): The client.
+            tour (str, optional): The tour. Defaults to "pga".
+            site (str, optional): draftkings, fanduel or yahoo. Defaults to "draftkings".
+            slate (str, optional): The slate. Defaults to "main".
+
+        Returns:
+            DFSPool: The pool.
+        """
+        payload = dg.get_fantasy_projection_defaults(tour, site, slate, "json")
+        return cls.from_projections(dict(payload, site=payload.get("site") or site))
+
+    def __len__(self):
+        return len(self.dg_ids)
+
+    def __repr__(self):
+        return (
+            f"DFSPool({len(self)} players, site={self.site!r}, cap={self.cap}, "
+            f"roster_size={self.roster_size})"
+        )
+
+    def indexes(self, dg_ids):
+        """
+        Pool indexes of players.
+
+        Args:
+            dg_ids (iterable): Player ids.
+
+        Returns:
+            list: Their indexes in the pool arrays.
+        """
+        try:
+            return [self._index[dg_id] for dg_id in dg_ids]
+        except KeyError as error:
+            raise KeyError(f"Player {error.args[0]} is not in the pool") from None
+
+    def _limits(self, count, max_exposure, lock):
+        import numpy as np
+
+        limits = np.full(len(self), count, dtype=np.int64)
+        if isinstance(max_exposure, dict):
+            for index, exposure in zip(
+                self.indexes(max_exposure), max_exposure.values()
+            ):
+                limits[index] = int(np.floor(exposure * count + 1e-9))
+        elif max_exposure is not None:
+            limits[:] = max(1, int(np.floor(max_exposure * count + 1e-9)))
+        limits[lock] = count
+        return limits
+
+    def _pick(self, lineups, count, limits):
+        """
+        Pick up to count of distinct lineups, best projected first, within the limits.
+
+        Args:
+            lineups (numpy.ndarray): (lineups, roster_size) sorted pool indexes.
+            count (int): Most lineups to pick.
+            limits (numpy.ndarray): Most lineups each player may be in.
+
+        Returns:
+            numpy.ndarray: The lineups picked, best projected first.
+        """
+        import numpy as np
+
+        lineups = np.unique(lineups, axis=0)
+        lineups = lineups[np.argsort(-self.points[lineups].sum(axis=1), kind="stable")]
+        used = np.zeros(len(self), dtype=np.int64)
+        chosen = []
+        for lineup in lineups:
+            if len(chosen) == count:
+                break
+            if (used[lineup] < limits[lineup]).all():
+                used[lineup] += 1
+                chosen.append(lineup)
+        return np.array(chosen, dtype=np.int64).reshape(-1, self.roster_size)
+
+    def _sample(self, rng, values, lock, allowed):
+        """
+        Sample one lineup of distinct players per row of values, favoring points per
+        salary (Gumbel top-k), then swap out the most expensive players of lineups over
+        the cap until they fit. Lineups with no allowed player left to swap in stay over
+        the cap, for the caller to drop.
+        """
+        import numpy as np
+
+        ratio = values / np.maximum(self.salaries, 1)
+        keys = ratio / (ratio.std() or 1.0) - np.log(-np.log(rng.random(values.shape)))
+        keys[:, ~allowed] = -np.inf
+        keys[:, lock] = np.inf
+        lineups = np.argpartition(-keys, self.roster_size - 1, axis=1)[
+            :, : self.roster_size
+        ]
+        locked = np.isin(lineups, lock)
+        for _ in range(self.roster_size):
+            salary = self.salaries[lineups]
+            over = np.flatnonzero(salary.sum(axis=1) > self.cap)
+            if not len(over):
+                break
+            salary = np.where(locked[over], -1, salary[over])
+            slot = salary.argmax(axis=1)
+            members = np.zeros((len(over), len(self)), dtype=bool)
+            members[np.arange(len(over))[:, None], lineups[over]] = True
+            cheapest = np.where(allowed & ~members, self.salaries, np.iinfo(np.int64).max)
+            player = cheapest.argmin(axis=1)
+            # Rows whose players are all locked, or with every candidate excluded or capped.
+            swap = (salary.max(axis=1) >= 0) & (
+                cheapest[np.arange(len(over)), player] < np.iinfo(np.int64).max
+            )
+            if not swap.any():
+                break
+            lineups[over[swap], slot[swap]] = player[swap]
+        return lineups
+
+    def _improve(self, lineups, values, lock, allowed, max_rounds=20):
+        """
+        Hill-climb lineups with the best single-player swap that fits the cap, all at once.
+
+        Args:
+            lineups (numpy.ndarray): (lineups, roster_size) pool indexes, under the cap.
+            values (numpy.ndarray): (lineups, players) points each lineup maximizes.
+
+        Returns:
+            numpy.ndarray: The improved lineups.
+        """
+        import numpy as np
+
+        rows = np.arange(len(lineups))
+        locked = np.isin(lineups, lock)
+        for _ in range(max_rounds):
+            members = np.zeros((len(lineups), len(self)), dtype=bool)
+            members[rows[:, None], lineups] = True
+            salary = self.salaries[lineups]
+            budget = self.cap - (salary.sum(axis=1, keepdims=True) - salary)
+            fits = (self.salaries[None, None, :] <= budget[:, :, None]) & (
+                allowed & ~members
+            )[:, None, :]
+            gain = np.where(fits, values[:, None, :], -np.inf) - np.take_along_axis(
+                values, lineups, axis=1
+            )[:, :, None]
+            gain[locked] = -np.inf
+            best = gain.reshape(len(lineups), -1).argmax(axis=1)
+            slot, player = np.divmod(best, len(self))
+            better = gain[rows, slot, player] > 1e-9
+            if not better.any():
+                break
+            lineups[rows[better], slot[better]] = player[better]
+        return lineups
+
+    def optimize(
+        self,
+        count=150,
+        max_exposure=None,
+        lock=(),
+        exclude=(),
+        min_salary=0,
+        randomness=0.5,
+        candidates=None,
+        seed=None,
+    ):
+        """
+        Build many distinct, salary-cap-valid lineups with high projected points.
+
+        Candidate lineups are sampled in vectorized batches, each from projections
+        perturbed by randomness standard deviations, and improved by vectorized best-swap
+        hill climbing. Distinct candidates are picked best-projected first within the
+        exposure limits; players at their limit are left out of later batches.
+
+        Args:
+            count (int, optional): Number of lineups. Defaults to 150.
+            max_exposure (float or dict, optional): Largest share of the lineups any player may be in, or dg_id to that share; a float always allows one lineup. Defaults to None (no limit).
+            lock (iterable, optional): dg_ids in every lineup. Defaults to none.
+            exclude (iterable, optional): dg_ids in no lineup. Defaults to none.
+            min_salary (int, optional): Smallest total salary of a lineup. Defaults to 0.
+            randomness (float, optional): Standard deviations of noise added to projections for diversity; 0 always climbs from the plain projections. Defaults to 0.5.
+            candidates (int, optional): Candidate lineups to generate. Defaults to 20 * count.
+            seed (int, optional): Random seed. Defaults to None.
+
+        Returns:
+            Lineups: The lineups, best projected first. Fewer than count when the limits allow no more; the exposure limits hold for the lineups returned.
+        """
+        import numpy as np
+
+        rng = np.random.default_rng(seed)
+        lock = np.asarray(self.indexes(lock), dtype=np.int64)
+        if len(lock) > self.roster_size:
+            raise ValueError("more locked players than roster spots")
+        allowed = np.ones(len(self), dtype=bool)
+        allowed[self.indexes(exclude)] = False
+        if len(self) - (~allowed).sum() < self.roster_size:
+            raise ValueError("not enough players for a lineup")
+        candidates = candidates or 20 * count
+        limits = self._limits(count, max_exposure, lock)
+        # Several batches, so players reaching their limit drop out of later candidates.
+        batch = min(_BATCH, max(64, -(-candidates // 16)))
+
+        used = np.zeros(len(self), dtype=np.int64)
+        chosen, seen, found = [], set(), []
+        generated = 0
+        while len(chosen) < count and generated < candidates:
+            # Players at their exposure limit are left out of later candidates.
+            available = allowed & (used < limits)
+            if available.sum() < self.roster_size:
+                break
+            size = min(batch, candidates - generated)
+            generated += size
+            values = self.points + randomness * self.std_devs * rng.standard_normal(
+                (size, len(self))
+            )
+            # Some rows climb the plain projections, so the best lineups are among the first.
+            values[: max(1, size // 32)] = self.points
+            lineups = self._sample(rng, values, lock, available)
+            valid = self.salaries[lineups].sum(axis=1) <= self.cap
+            if not valid.any():
+                continue
+            lineups = self._improve(lineups[valid], values[valid], lock, available)
+            lineups = np.unique(np.sort(lineups, axis=1), axis=0)
+            lineups = lineups[self.salaries[lineups].sum(axis=1) >= min_salary]
+            found.append(lineups)
+            points = self.points[lineups].sum(axis=1)
+            for lineup in lineups[np.argsort(-points, kind="stable")]:
+                key = lineup.tobytes()
+                if key in seen or not (used[lineup] < limits[lineup]).all():
+                    continue
+                seen.add(key)
+                used[lineup] += 1
+                chosen.append(lineup)
+                if len(chosen) == count:
+                    break
+
+        index = np.array(chosen, dtype=np.int64).reshape(-1, self.roster_size)
+        index = index[np.argsort(-self.points[index].sum(axis=1), kind="stable")]
+        if 0 < len(index) < count and max_exposure is not None:
+            # The limits were set for count lineups, which a share of fewer can exceed:
+            # pick again from every candidate with the limits of each smaller count.
+            found = np.concatenate(found)
+            while len(index) < count:
+                count = len(index)
+                index = self._pick(found, count, self._limits(count, max_exposure, lock))
+        return Lineups(self, index)
+
+
+def _simulate_chunk(args):
+    """
+    Simulate one chunk of contests in a worker process and return summed statistics.
+    """
+    import numpy as np
+
+    points, std_devs, members, sims, seed, cash_lines, bins = args
+    start, width = bins
+    lineups = members.shape[1]
+    rng = np.random.default_rng(seed)
+    scores = points + std_devs * rng.standard_normal((sims, len(points)))
+    # (sims, lineups) totals as one product with the player x lineup membership matrix.
+    totals = scores @ members
+    best = np.bincount(totals.argmax(axis=1), minlength=lineups)
+    above = (totals[None] >= cash_lines[:, None, None]).sum(axis=1)
+    positions = np.clip(((totals - start) / HISTOGRAM_BIN).astype(np.int64), 0, width - 1)
+    positions += np.arange(lineups) * width
+    histogram = np.bincount(positions.ravel(), minlength=lineups * width)
+    return (
+        totals.sum(axis=0),
+        (totals**2).sum(axis=0),
+        best,
+        above,
+        histogram.reshape(lineups, width),
+    )
+
+
+class Lineups:
+    def __init__(self, pool, index):
+        """
+        Lineups of a DFS pool.
+
+        Args:
+            pool (DFSPool): The pool.
+            index (numpy.ndarray): (lineups, roster_size) pool indexes.
+        """
+        self.pool = pool
+        self.index = index
+
+    def __len__(self):
+        return len(self.index)
+
+    def __repr__(self):
+        return f"Lineups({len(self)} lineups of {self.pool.roster_size})"
+
+    @property
+    def points(self):
+        return self.pool.points[self.index].sum(axis=1)
+
+    @property
+    def salaries(self):
+        return self.pool.salaries[self.index].sum(axis=1)
+
+    def dg_ids(self):
+        """
+        (lineups, roster_size) array of the lineups' dg_ids.
+        """
+        return self.pool.dg_ids[self.index]
+
+    def exposure(self):
+        """
+        Share of the lineups each player is in.
+
+        Returns:
+            dict: dg_id to share, for players in at least one lineup.
+        """
+        import numpy as np
+
+        counts = np.bincount(self.index.ravel(), minlength=len(self.pool))
+        return {
+            int(self.pool.dg_ids[i]): counts[i] / len(self)
+            for i in np.flatnonzero(counts)
+        }
+
+    def score(self, pool):
+        """
+        Score the lineups against another pool, e.g. the actual results of the event.
+
+        Args:
+            pool (DFSPool): Pool holding the points to score with, matched by dg_id. Missing players score 0.
+
+        Returns:
+            numpy.ndarray: Points of each lineup.
+        """
+        import numpy as np
+
+        points = np.array(
+            [
+                pool.points[pool._index[dg_id]] if dg_id in pool._index else 0.0
+                for dg_id in self.pool.dg_ids.tolist()
+            ]
+        )
+        return points[self.index].sum(axis=1)
+
+    def rows(self):
+        """
+        One row dict per lineup: its players, salary and projected points.
+        """
+        rows = []
+        for lineup, salary, points in zip(
+            self.index.tolist(), self.salaries.tolist(), self.points.tolist()
+        ):
+            rows.append(
+                {
+                    "dg_ids": [int(self.pool.dg_ids[i]) for i in lineup],
+                    "players": [self.pool.names[i] for i in lineup],
+                    "salary": salary,
+                    "points": points,
+                }
+            )
+        return rows
+
+    def to_pandas(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.rows())
+
+    def simulate(self, sims=100000, cash_lines=(), workers=None, seed=None, chunk=5000):
+        """
+        Monte Carlo simulation of the lineups' scores across worker processes.
+
+        Player scores are drawn independently from normal distributions with the pool's
+        projected points and standard deviations.
+
+        Args:
+            sims (int, optional): Number of simulated contests. Defaults to 100000.
+            cash_lines (iterable, optional): Scores to report the probability of reaching, e.g. a contest's cash line. Defaults to none.
+            workers (int, optional): Worker processes; 1 runs in this process. Defaults to the number of CPUs.
+            seed (int, optional): Random seed. Defaults to None.
+            chunk (int, optional): Simulations per task. Defaults to 5000.
+
+        Returns:
+            dict: Arrays with one value per lineup: mean, std, p10, p50, p90, top (share of simulations where the lineup scores best of the set), and cash (one row per cash line).
+        """
+        import numpy as np
+
+        pool = self.pool
+        cash_lines = np.asarray(cash_lines, dtype=np.float64)
+        high = pool.points + 6 * pool.std_devs
+        low = pool.points - 6 * pool.std_devs
+        start = np.floor(np.sort(low)[: pool.roster_size].sum())
+        stop = np.ceil(np.sort(high)[-pool.roster_size :].sum())
+        bins = (start, int((stop - start) / HISTOGRAM_BIN) + 1)
+        members = np.zeros((len(pool), len(self)))
+        members[self.index, np.arange(len(self))[:, None]] = 1
+        seeds = np.random.SeedSequence(seed).spawn(-(-sims // chunk))
+        tasks = [
+            (
+                pool.points,
+                pool.std_devs,
+                members,
+                min(chunk, sims - i * chunk),
+                child,
+                cash_lines,
+                bins,
+            )
+            for i, child in enumerate(seeds)
+        ]
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(tasks) == 1:
+            parts = list(map(_simulate_chunk, tasks))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parts = list(executor.map(_simulate_chunk, tasks))
+
+        total, squares, best, above, histogram = (sum(part) for part in zip(*parts))
+        mean = total / sims
+        cumulative = np.cumsum(histogram, axis=1) / sims
+        edges = start + HISTOGRAM_BIN * np.arange(1, bins[1] + 1)
+
+        def percentile(q):
+            return edges[(cumulative < q).sum(axis=1).clip(max=bins[1] - 1)]
+
+        return {
+            "mean": mean,
+            "std": np.sqrt(np.maximum(squares / sims - mean**2, 0)),
+            "p10": percentile(0.1),
+            "p50": percentile(0.5),
+            "p90": percentile(0.9),
+            "top": best / sims,
+            "cash": above / sims,
+        }
@@ -0,0 +1,89 @@
+class DataGolfError(Exception):
+    """
+    Base class of every error raised by the SDK.
+    """
+
+
+class TransportError(DataGolfError):
+    def __init__(self, message, transient=True):
+        """
+        The request could not be sent or its response could not be read (connection error,
+        timeout, broken body, too many redirects).
+
+        Args:
+            message (str): Description of the failure.
+            transient (bool, optional): Whether retrying may succeed (connection errors, timeouts, bodies cut off midway) rather than fail the same way (invalid URLs, redirect loops). Defaults to True.
+        """
+        super().__init__(message)
+        self.transient = transient
+
+
+class APIError(DataGolfError):
+    def __init__(self, status_code, message, endpoint=None):
+        """
+        The DataGolf API answered with a non-200 status code.
+
+        Args:
+            status_code (int): The HTTP status code.
+            message (str): The response body.
+            endpoint (str, optional): The API endpoint. Defaults to None.
+        """
+        super().__init__(
+            f"Error {status_code} from {endpoint or 'the DataGolf API'}: {message}"
+        )
+        self.status_code = status_code
+        self.message = message
+        self.endpoint = endpoint
+
+
+class AuthenticationError(APIError):
+    """
+    The API key is missing, invalid or lacks access to the endpoint (401, 403).
+    """
+
+
+class ClientError(APIError):
+    """
+    The request was rejected, usually because of invalid parameters (4xx).
+    """
+
+
+class RateLimitError(APIError):
+    def __init__(self, status_code, message, endpoint=None, retry_after=None):
+        """
+        The request was throttled (429).
+
+        Args:
+            retry_after (float, optional): Seconds to wait before retrying, from the Retry-After header. Defaults to None.
+        """
+        super().__init__(status_code, message, endpoint)
+        self.retry_after = retry_after
+
+
+class ServerError(APIError):
+    """
+    The DataGolf API failed to answer the request (5xx).
+    """
+
+
+def error_for_response(response, endpoint=None, retry_after=None):
+    """
+    Build the typed exception matching a failed response.
+
+    Args:
+        response (requests.Response): The failed response.
+        endpoint (str, optional): The API endpoint. Defaults to None.
+        retry_after (float, optional): Parsed Retry-After header. Defaults to None.
+
+    Returns:
+        APIError: The exception to raise.
+    """
+    status_code = response.status_code
+    message = response.text
+    if status_code == 429:
+        return RateLimitError(status_code, message, endpoint, retry_after)
+    if status_code in (401, 403):
+        return AuthenticationError(status_code, message, endpoint)
+    if status_code >= 500:
+        return ServerError(status_code, message, endpoint)
+    return ClientError(status_code, message, endpoint)
@@ -0,0 +1,299 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+
+from sdk.decoders import require_dicts
+
+logger = logging.getLogger(__name__)
+
+
+def _hole_records(payload):
+    records = []
+    for course in payload.get("courses") or []:
+        for round_ in course.get("rounds") or []:
+            for hole in round_.get("holes") or []:
+                record = {
+                    "course_code": course.get("course_code"),
+                    "round_num": round_.get("round_num"),
+                }
+                for name, value in hole.items():
+                    if isinstance(value, dict):
+                        for stat, stat_value in value.items():
+                            record[f"{name}_{stat}"] = stat_value
+                    else:
+                        record[name] = value
+                records.append(record)
+    return records
+
+
+def _hole_key(record):
+    return record.get("course_code"), record.get("round_num"), record.get("hole")
+
+
+# How to find the records and their identity in each live endpoint's payload.
+LIVE_FEEDS = {
+    "get_live_model_predictions": {"records": "data", "key": "dg_id"},
+    "get_live_tournament_stats": {"records": "live_stats", "key": "dg_id"},
+    "get_live_strokes_gained": {"records": "data", "key": "dg_id"},
+    "get_live_hole_scoring_distribution": {"records": _hole_records, "key": _hole_key},
+}
+
+_LAST_UPDATED_FIELDS = ("last_updated", "last_update")
+
+
+class ChangeEvent:
+    __slots__ = ("feed", "kind", "key", "name", "record", "changes", "error")
+
+    def __init__(self, feed, kind, key, name, record, changes, error=None):
+        """
+        A change to one record (usually one player) of a live feed.
+
+        Args:
+            feed (str): Name of the watched feed.
+            kind (str): "added", "changed", "removed", or "error" when polling the feed failed.
+            key (object): The record's identity, e.g. its dg_id. None for errors.
+            name (str): The player name, when the record has one.
+            record (dict): The current record (the last known one when removed). None for errors.
+            changes (dict): Field name to (old, new) for every changed field.
+            error (Exception, optional): Why polling the feed failed. Defaults to None.
+        """
+        self.feed = feed
+        self.kind = kind
+        self.key = key
+        self.name = name
+        self.record = record
+        self.changes = changes
+        self.error = error
+
+    def delta(self, field):
+        """
+        Numeric change of a field, e.g. delta("win") for a probability move or delta("thru") for holes completed.
+
+        Returns:
+            float or None: new - old, or None if the field did not change or is not numeric.
+        """
+        old, new = self.changes.get(field, (None, None))
+        if _is_number(old) and _is_number(new):
+            return new - old
+        return None
+
+    def __repr__(self):
+        if self.error is not None:
+            return f"ChangeEvent({self.feed!r}, {self.kind!r}, error={self.error!r})"
+        return (
+            f"ChangeEvent({self.feed!r}, {self.kind!r}, {self.key!r}, "
+            f"{self.name!r}, {self.changes!r})"
+        )
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class _Subscription:
+    def __init__(self, name, method, args, kwargs, records, key):
+        self.name = name
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+        self.records = records
+        self.key = key
+        self.marker = None
+        self.digest = None
+        self.state = {}
+
+
+class LiveFeed:
+    def __init__(self, dg, interval=60.0, tolerance=0.0, error_events=False):
+        """
+        Initialize a live-feed poller that turns live endpoints into a stream of changes.
+
+        Each poll skips payloads whose last-updated stamp and content hash are unchanged,
+        and diffs the rest record by record, so downstream work scales with what changed
+        rather than with the field size.
+
+        Args:
+            dg (DataGolfSDK): The client used to fetch data. Use one without a response cache, or with short live TTLs, to see updates as soon as they are published.
+            interval (float, optional): Seconds between polls. Defaults to 60.
+            tolerance (float, optional): Numeric moves smaller than this are ignored. Defaults to 0.
+            error_events (bool, optional): Also yield a ChangeEvent of kind "error" when polling a feed fails. Failures are always logged and counted in self.errors. Defaults to False.
+        """
+        self.dg = dg
+        self.interval = interval
+        self.tolerance = tolerance
+        self.subscriptions = []
+        self.error_events = error_events
+        self.polls = 0
+        self.unchanged = 0
+        self.errors = 0
+
+    def watch(self, method, *args, name=None, records=None, key=None, **kwargs):
+        """
+        Add a live endpoint to the set of polled feeds.
+
+        Args:
+            method (str): Name of the DataGolfSDK method, e.g. "get_live_model_predictions".
+            *args: Positional arguments of the method.
+            name (str, optional): Name of the feed in change events. Defaults to method.
+            records (str or callable, optional): Payload key of the record list, or a callable extracting records. Defaults to the LIVE_FEEDS entry.
+            key (str or callable, optional): Record field, or callable, giving each record's identity. Defaults to the LIVE_FEEDS entry.
+            **kwargs: Keyword arguments of the method.
+
+        Returns:
+            LiveFeed: self, so calls can be chained.
+        """
+        defaults = LIVE_FEEDS.get(method, {})
+        records = records or defaults.get("records")
+        key = key or defaults.get("key", "dg_id")
+        if records is None:
+            raise ValueError(f"No record layout known for {method}, pass records=")
+        self.subscriptions.append(
+            _Subscription(name or method, method, args, kwargs, records, key)
+        )
+        return self
+
+    def _changed(self, old, new):
+        if _is_number(old) and _is_number(new):
+            return abs(new - old) > self.tolerance
+        return old != new
+
+    def _diff(self, subscription, payload):
+        records = subscription.records
+        key = subscription.key
+        items = records(payload) if callable(records) else payload.get(records)
+        if not isinstance(items, list):
+            items = []
+
+        state = {}
+        for record in items:
+            state[key(record) if callable(key) else record.get(key)] = record
+
+        events = []
+        for record_key, record in state.items():
+            name = record.get("player_name")
+            old = subscription.state.get(record_key)
+            if old is None:
+                events.append(
+                    ChangeEvent(subscription.name, "added", record_key, name, record, {})
+                )
+                continue
+            changes = {
+                field: (old.get(field), record.get(field))
+                for field in record.keys() | old.keys()
+                if self._changed(old.get(field), record.get(field))
+            }
+            if changes:
+                events.append(
+                    ChangeEvent(
+                        subscription.name, "changed", record_key, name, record, changes
+                    )
+                )
+        for record_key, record in subscription.state.items():
+            if record_key not in state:
+                events.append(
+                    ChangeEvent(
+                        subscription.name,
+                        "removed",
+                        record_key,
+                        record.get("player_name"),
+                        record,
+                        {},
+                    )
+                )
+        subscription.state = state
+        return events
+
+    def _poll_subscription(self, subscription):
+        payload = getattr(self.dg, subscription.method)(
+            *subscription.args, **subscription.kwargs
+        )
+        if not isinstance(require_dicts(payload, "LiveFeed"), dict):
+            return []
+
+        info = payload.get("info") if isinstance(payload.get("info"), dict) else payload
+        marker = next(
+            (info[field] for field in _LAST_UPDATED_FIELDS if info.get(field)), None
+        )
+        if marker is not None and marker == subscription.marker:
+            self.unchanged += 1
+            return []
+
+        digest = hashlib.sha1(
+            json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        if digest == subscription.digest:
+            subscription.marker = marker
+            self.unchanged += 1
+            return []
+
+        # Only remember the payload once it is diffed, so a failed diff is retried.
+        events = self._diff(subscription, payload)
+        subscription.marker = marker
+        subscription.digest = digest
+        return events
+
+    def poll(self):
+        """
+        Poll every watched feed once.
+
+        A feed that fails, e.g. with a ServerError after retries, is logged and skipped
+        until the next poll; the other feeds are unaffected and its state is kept.
+
+        Returns:
+            list: ChangeEvents of every feed whose payload changed since the last poll. The first poll reports every record as added.
+        """
+        self.polls += 1
+        events = []
+        for subscription in self.subscriptions:
+            try:
+                events.extend(self._poll_subscription(subscription))
+            except Exception as error:
+                self.errors += 1
+                logger.warning("Polling %s failed: %s", subscription.name, error)
+                if self.error_events:
+                    events.append(
+                        ChangeEvent(
+                            subscription.name, "error", None, None, None, {}, error
+                        )
+                    )
+        return events
+
+    def events(self, max_polls=None):
+        """
+        Poll on the feed's interval and yield change events as they are detected.
+
+        Args:
+            max_polls (int, optional): Stop after this many polls. Defaults to None (run forever).
+
+        Yields:
+            ChangeEvent: Each detected change.
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            started = time.monotonic()
+            yield from self.poll()
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    async def stream(self, max_polls=None):
+        """
+        Async version of events(). Polls run on the default executor so the event loop is never blocked.
+
+        Args:
+            max_polls (int, optional): Stop after this many polls. Defaults to None (run forever).
+
+        Yields:
+            ChangeEvent: Each detected change.
+        """
+        loop = asyncio.get_running_loop()
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            started = loop.time()
+            for event in await loop.run_in_executor(None, self.poll):
+                yield event
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                await asyncio.sleep(max(0.0, self.interval - (loop.time() - started)))
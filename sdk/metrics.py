@@ -0,0 +1,195 @@
+import bisect
+import logging
+import threading
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the histogram buckets, in seconds and bytes.
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+SIZE_BUCKETS = tuple(1024 * 4**exponent for exponent in range(11))
+
+
+class Histogram:
+    def __init__(self, buckets):
+        """
+        Initialize a fixed-bucket histogram.
+
+        Args:
+            buckets (tuple): Increasing bucket upper bounds. Larger values fall in an overflow bucket.
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q):
+        """
+        Estimate a quantile as the upper bound of the bucket holding it.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float or None: The estimate (capped at the observed maximum), or None if empty.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                if index == len(self.buckets):
+                    return self.max
+                return min(self.buckets[index], self.max)
+        return self.max
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip(self.buckets + (float("inf"),), self.counts)),
+        }
+
+
+class EndpointMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.status_codes = Counter()
+        self.network_time = Histogram(LATENCY_BUCKETS)
+        self.parse_time = Histogram(LATENCY_BUCKETS)
+        self.bytes = Histogram(SIZE_BUCKETS)
+
+    def snapshot(self):
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "status_codes": dict(self.status_codes),
+            "network_time": self.network_time.snapshot(),
+            "parse_time": self.parse_time.snapshot(),
+            "bytes": self.bytes.snapshot(),
+        }
+
+
+class Metrics:
+    def __init__(self):
+        """
+        Initialize an in-process, per-endpoint metrics registry.
+
+        Records network time, bytes received, parse time, status codes, retries and cache
+        hits for every endpoint. Hooks receive each observation as it happens, which is
+        where Prometheus or StatsD exporters plug in.
+        """
+        self.hooks = []
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        """
+        Register a callback invoked for every observation.
+
+        Args:
+            hook (callable): Called as hook(metric, endpoint, value), where metric is one of network_time, bytes, parse_time, status_code, retry, error or cache_hit. Exceptions it raises are logged and never reach the request.
+        """
+        self.hooks.append(hook)
+
+    def _endpoint(self, endpoint):
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints.setdefault(endpoint, EndpointMetrics())
+        return metrics
+
+    def _emit(self, metric, endpoint, value):
+        for hook in self.hooks:
+            try:
+                hook(metric, endpoint, value)
+            except Exception:
+                logger.exception("Metrics hook %r failed on %s", hook, metric)
+
+    def record_response(self, endpoint, status_code, seconds):
+        with self._lock:
+            metrics = self._endpoint(endpoint)
+            metrics.requests += 1
+            metrics.status_codes[status_code] += 1
+            metrics.network_time.observe(seconds)
+        self._emit("status_code", endpoint, status_code)
+        self._emit("network_time", endpoint, seconds)
+
+    def record_bytes(self, endpoint, size):
+        with self._lock:
+            self._endpoint(endpoint).bytes.observe(size)
+        self._emit("bytes", endpoint, size)
+
+    def record_parse(self, endpoint, seconds):
+        with self._lock:
+            self._endpoint(endpoint).parse_time.observe(seconds)
+        self._emit("parse_time", endpoint, seconds)
+
+    def record_retry(self, endpoint):
+        with self._lock:
+            self._endpoint(endpoint).retries += 1
+        self._emit("retry", endpoint, 1)
+
+    def record_error(self, endpoint):
+        with self._lock:
+            self._endpoint(endpoint).errors += 1
+        self._emit("error", endpoint, 1)
+
+    def record_cache_hit(self, endpoint):
+        with self._lock:
+            self._endpoint(endpoint).cache_hits += 1
+        self._emit("cache_hit", endpoint, 1)
+
+    def snapshot(self):
+        """
+        Copy of the current metrics.
+
+        Returns:
+            dict: Endpoint to its counters and network_time, parse_time and bytes histograms (count, sum, min, max, mean, p50, p90, p99, buckets).
+        """
+        with self._lock:
+            return {
+                endpoint: metrics.snapshot()
+                for endpoint, metrics in sorted(self._endpoints.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
@@ -0,0 +1,396 @@
+import re
+from fractions import Fraction
+from numbers import Number
+
+from sdk.decoders import require_dicts
+
+ODDS_FORMATS = ("percent", "american", "decimal", "fraction")
+
+# Requesting this format fetches FETCH_ODDS_FORMAT once and converts it to every format.
+ALL_ODDS_FORMATS = "all"
+FETCH_ODDS_FORMAT = "decimal"
+
+_ALIASES = {"fractional": "fraction", "probability": "percent"}
+
+# Expected number of winners per market, i.e. what a fair book's probabilities sum to.
+# Other top_N markets total N; make_cut and mc have no fixed total, as it depends on
+# how many players make the cut.
+MARKET_TOTALS = {"win": 1, "frl": 1, "top_5": 5, "top_10": 10, "top_20": 20}
+_TOP_N = re.compile(r"top_(\d+)$")
+
+BOOKS = {
+    "bet365",
+    "betcris",
+    "betmgm",
+    "betonline",
+    "betway",
+    "bovada",
+    "caesars",
+    "circa",
+    "corale",
+    "datagolf",
+    "draftkings",
+    "fanduel",
+    "pinnacle",
+    "pointsbet",
+    "skybet",
+    "superbook",
+    "unibet",
+    "williamhill",
+}
+
+# Fields holding odds in the predictions, betting tools and historical odds payloads.
+ODDS_FIELD = re.compile(
+    r"^(win|top_\d+|make_cut|mc|frl|first_round_leader|tie|p[123]"
+    r"|open_odds|close_odds|p[123]_(open|close)|baseline|baseline_history_fit)$"
+)
+
+
+def _format(odds_format):
+    odds_format = _ALIASES.get(odds_format, odds_format)
+    if odds_format not in ODDS_FORMATS:
+        raise ValueError(f"Unknown odds format {odds_format!r}")
+    return odds_format
+
+
+def _parse(value):
+    if isinstance(value, Number):
+        return float(value)
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            if "/" in text:
+                numerator, _, denominator = text.partition("/")
+                return float(numerator) / float(denominator)
+            if text.endswith("%"):
+                # "45%" is a probability of 0.45.
+                return float(text[:-1]) / 100
+            return float(text)
+        except (ValueError, ZeroDivisionError):
+            pass
+    return float("nan")
+
+
+def _array(values):
+    import numpy as np
+
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        values = np.asarray(values, dtype=object)
+        return np.vectorize(_parse, otypes=[np.float64])(values).reshape(values.shape)
+
+
+def to_decimal(values, odds_format):
+    """
+    Convert odds to decimal odds.
+
+    Args:
+        values (array-like): Odds as numbers or API strings ("+450", "-110", "9/2", "45%").
+        odds_format (str): Format of the values - percent (implied probability, 0-1), american, decimal or fraction.
+
+    Returns:
+        numpy.ndarray: Decimal odds, NaN where a value is missing or invalid.
+    """
+    import numpy as np
+
+    odds_format = _format(odds_format)
+    values = _array(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if odds_format == "decimal":
+            decimal = values
+        elif odds_format == "percent":
+            decimal = 1 / values
+        elif odds_format == "american":
+            decimal = np.where(values > 0, 1 + values / 100, 1 - 100 / values)
+        else:
+            # Fractions were parsed to their value, e.g. "9/2" -> 4.5.
+            decimal = 1 + values
+    return np.where(decimal > 1, decimal, np.nan)
+
+
+def from_decimal(decimal, odds_format, max_denominator=100):
+    """
+    Convert decimal odds to another format.
+
+    Args:
+        decimal (array-like): Decimal odds.
+        odds_format (str): Target format - percent, american, decimal or fraction.
+        max_denominator (int, optional): Largest denominator of fractional odds. Defaults to 100.
+
+    Returns:
+        numpy.ndarray: float64 for percent, american and decimal; strings ("9/2") for fraction, None where missing.
+    """
+    import numpy as np
+
+    odds_format = _format(odds_format)
+    decimal = _array(decimal)
+    decimal = np.where(decimal > 1, decimal, np.nan)
+    if odds_format == "decimal":
+        return decimal
+    if odds_format == "percent":
+        return 1 / decimal
+    if odds_format == "american":
+        return np.where(decimal >= 2, (decimal - 1) * 100, -100 / (decimal - 1))
+
+    def fraction(value):
+        if value != value:
+            return None
+        ratio = Fraction(value - 1).limit_denominator(max_denominator)
+        return f"{ratio.numerator}/{ratio.denominator}"
+
+    with np.errstate(invalid="ignore"):
+        fractions = np.vectorize(fraction, otypes=[object])(decimal)
+    return fractions.reshape(decimal.shape)
+
+
+def convert(values, from_format, to_format):
+    """
+    Convert odds between formats, e.g. convert(["+450", "-110"], "american", "percent").
+
+    Args:
+        values (array-like): The odds.
+        from_format (str): Format of the values.
+        to_format (str): Target format.
+
+    Returns:
+        numpy.ndarray: The converted odds, as from_decimal returns them.
+    """
+    return from_decimal(to_decimal(values, from_format), to_format)
+
+
+def implied_probabilities(values, odds_format="decimal"):
+    """
+    Implied probabilities of odds, including the book's margin.
+
+    Returns:
+        numpy.ndarray: Probabilities, NaN where missing.
+    """
+    return 1 / to_decimal(values, odds_format)
+
+
+def overround(probabilities, total=1.0, axis=-1):
+    """
+    Book margin: how much the implied probabilities exceed the fair total.
+
+    Args:
+        probabilities (array-like): Implied probabilities of one book's field (or one row per book or matchup).
+        total (float, optional): What fair probabilities sum to, e.g. 5 for top_5. Defaults to 1.
+        axis (int, optional): Axis along which the field lies. Defaults to -1.
+
+    Returns:
+        numpy.ndarray or float: Sum of probabilities / total - 1.
+    """
+    import numpy as np
+
+    return np.nansum(_array(probabilities), axis=axis) / total - 1
+
+
+def remove_vig(probabilities, total=1.0, method="multiplicative", axis=-1):
+    """
+    Normalize a book's implied probabilities across its field so they sum to the fair total.
+
+    Args:
+        probabilities (array-like): Implied probabilities; 2-D input is normalized per row (e.g. one row per book or matchup).
+        total (float, optional): What fair probabilities sum to - 1 for win and matchups, n for top_n. Defaults to 1.
+        method (str, optional): "multiplicative" scales every probability by the same factor;
+            "power" raises them to a common exponent, taking more margin off longshots. Defaults to "multiplicative".
+        axis (int, optional): Axis along which the field lies. Defaults to -1.
+
+    Returns:
+        numpy.ndarray: Fair probabilities, NaN where missing.
+    """
+    import numpy as np
+
+    probabilities = np.moveaxis(_array(probabilities), axis, -1)
+    if method == "multiplicative":
+        sums = np.nansum(probabilities, axis=-1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fair = probabilities * (total / sums)
+    elif method == "power":
+        # sum(p ** k) decreases in k for 0 < p < 1; bisect for the k giving the total.
+        low = np.zeros(probabilities.shape[:-1] + (1,))
+        high = np.full_like(low, 16.0)
+        clipped = np.clip(probabilities, 1e-12, 1 - 1e-12)
+        for _ in range(60):
+            middle = (low + high) / 2
+            above = np.nansum(clipped**middle, axis=-1, keepdims=True) > total
+            low = np.where(above, middle, low)
+            high = np.where(above, high, middle)
+        fair = clipped ** ((low + high) / 2)
+    else:
+        raise ValueError(f"Unknown vig removal method {method!r}")
+    return np.moveaxis(fair, -1, axis)
+
+
+def market_total(market):
+    """
+    Expected number of winners of an outright market.
+
+    Args:
+        market (str): The market, e.g. "win" or "top_30".
+
+    Returns:
+        int or None: What fair probabilities sum to, or None when it is not fixed (make_cut, mc).
+    """
+    total = MARKET_TOTALS.get(market)
+    if total is None:
+        match = _TOP_N.match(market or "")
+        if match is not None:
+            total = int(match.group(1))
+    return total
+
+
+def fair_probabilities(payload, total=None, method="multiplicative"):
+    """
+    No-vig probabilities of every book in an outrights payload (get_outright_odds).
+
+    Args:
+        payload (dict): The outrights payload, in any odds format.
+        total (float, optional): What fair probabilities sum to. Required for markets without a fixed total (make_cut, mc), e.g. the expected number of players making the cut. Defaults to the market_total of the payload's market.
+        method (str, optional): Vig removal method, see remove_vig. Defaults to "multiplicative".
+
+    Returns:
+        dict: "dg_id" to an array of player ids, and each book to the players' fair probabilities (NaN where the book has no price).
+
+    Raises:
+        ValueError: total is not given and the market has no fixed total.
+        TypeError: The payload was decoded into Structs (decoder="msgspec-typed").
+    """
+    import numpy as np
+
+    records = require_dicts(payload, "fair_probabilities").get("odds") or []
+    odds_format = _odds_format_of(payload)
+    if total is None:
+        market = payload.get("market")
+        total = market_total(market)
+        if total is None:
+            raise ValueError(
+                f"Market {market!r} has no fixed total; pass total, e.g. the "
+                "expected number of players making the cut"
+            )
+    books = [book for book in payload.get("books_offering") or [] if book in BOOKS]
+    if not books:
+        books = sorted({name for record in records for name in record} & BOOKS)
+    result = {"dg_id": np.array([record.get("dg_id") for record in records])}
+    for book in books:
+        if book == "datagolf":
+            continue
+        implied = implied_probabilities(
+            [record.get(book) for record in records], odds_format
+        )
+        result[book] = remove_vig(implied, total, method)
+    return result
+
+
+def _odds_format_of(payload):
+    for record in payload.get("odds") or []:
+        for name, value in record.items():
+            if name in BOOKS and isinstance(value, str):
+                return "fraction" if "/" in value else "american"
+            if name in BOOKS and isinstance(value, Number):
+                return "percent" if 0 < value < 1 else "decimal"
+    return "decimal"
+
+
+def _is_odds(name, value, books):
+    return (name in books or ODDS_FIELD.match(name) is not None) and (
+        isinstance(value, (Number, str)) and not isinstance(value, bool)
+    )
+
+
+def _collect(node, books, out):
+    if isinstance(node, dict):
+        for name, value in node.items():
+            if isinstance(value, (dict, list)):
+                _collect(value, books, out)
+            elif _is_odds(name, value, books):
+                out.append(value)
+    elif isinstance(node, list):
+        for value in node:
+            if isinstance(value, (dict, list)):
+                _collect(value, books, out)
+
+
+def _replace(node, books, values):
+    if isinstance(node, dict):
+        copy = {}
+        for name, value in node.items():
+            if isinstance(value, (dict, list)):
+                value = _replace(value, books, values)
+            elif _is_odds(name, value, books):
+                converted = next(values)
+                # Keep placeholders like "n/a"; numbers that are not valid odds become None.
+                if converted is not None or not isinstance(value, str):
+                    value = converted
+            copy[name] = value
+        return copy
+    if isinstance(node, list):
+        return [
+            _replace(value, books, values) if isinstance(value, (dict, list)) else value
+            for value in node
+        ]
+    return node
+
+
+def convert_payload(payload, to_format, from_format=FETCH_ODDS_FORMAT):
+    """
+    Copy of an API payload with every odds value converted to another format.
+
+    Odds are the book columns and the win/top_n/make_cut/frl, p1/p2/p3/tie and
+    open/close fields; the other fields are copied unchanged. American odds are
+    rendered like the API renders them ("+450", "-110").
+
+    Args:
+        payload (dict or list): A JSON payload of an endpoint taking odds_format.
+        to_format (str): Target format.
+        from_format (str, optional): Format the payload was fetched in. Defaults to decimal.
+
+    Returns:
+        dict or list: The converted payload.
+
+    Raises:
+        TypeError: The payload was decoded into Structs (decoder="msgspec-typed").
+    """
+    import numpy as np
+
+    require_dicts(payload, "convert_payload")
+    to_format = _format(to_format)
+    books = set(BOOKS)
+    if isinstance(payload, dict):
+        books.update(payload.get("books_offering") or [])
+    values = []
+    _collect(payload, books, values)
+    converted = from_decimal(to_decimal(values, from_format), to_format)
+    if to_format == "american":
+        converted = [
+            None if value != value else f"{value:+.0f}" for value in converted.tolist()
+        ]
+    elif to_format != "fraction":
+        converted = [
+            None if value != value else value
+            for value in np.round(converted, 4).tolist()
+        ]
+    else:
+        converted = converted.tolist()
+    return _replace(payload, books, iter(converted))
+
+
+def all_formats(payload, from_format=FETCH_ODDS_FORMAT):
+    """
+    The same payload in every odds format, converted locally from one fetch.
+
+    Returns:
+        dict: Odds format (percent, american, decimal, fraction) to the converted payload.
+
+    Raises:
+        TypeError: The payload was decoded into Structs (decoder="msgspec-typed").
+    """
+    require_dicts(payload, 'odds_format="all"')
+    from_format = _format(from_format)
+    return {
+        odds_format: payload
+        if odds_format == from_format
+        else convert_payload(payload, odds_format, from_format)
+        for odds_format in ODDS_FORMATS
+    }
@@ -0,0 +1,50 @@
+from sdk.decoders import require_dicts
+
+# Round-level fields kept as integers; every other numeric stat is stored as float64
+# so partitions written from different events share one schema.
+INT_FIELDS = {
+    "dg_id",
+    "year",
+    "season",
+    "event_id",
+    "round_num",
+    "course_num",
+    "course_par",
+    "start_hole",
+}
+
+
+def iter_rounds(payload):
+    """
+    Yield the rows of a Round Scoring, Stats & Strokes Gained payload one player round at a time.
+
+    Args:
+        payload (dict): Response of get_round_scoring_stats_strokes_gained for a single event.
+
+    Returns:
+        generator: Row dicts holding the event fields, the player fields and the round stats.
+    """
+    require_dicts(payload, "iter_rounds")
+    event = {
+        "tour": payload.get("tour"),
+        "year": payload.get("year"),
+        "season": payload.get("season"),
+        "event_id": payload.get("event_id"),
+        "event_name": payload.get("event_name"),
+        "event_completed": payload.get("event_completed"),
+    }
+    for player in payload.get("scores") or []:
+        base = dict(event)
+        rounds = []
+        for name, value in player.items():
+            if name.startswith("round_") and isinstance(value, dict):
+                rounds.append((int(name[len("round_"):]), value))
+            else:
+                base[name] = value
+        for round_num, stats in sorted(rounds):
+            row = dict(base, round_num=round_num)
+            for name, value in stats.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    value = int(value) if name in INT_FIELDS else float(value)
+                row[name] = value
+            yield row
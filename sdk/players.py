@@ -0,0 +1,382 @@
+import re
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from numbers import Number
+
+from sdk.cache import HOUR
+from sdk.decoders import require_dicts
+
+# Source name to (SDK method, keyword arguments, key of the record list in the payload).
+SOURCES = {
+    "players": ("get_player_list", {}, None),
+    "rankings": ("get_dg_rankings", {}, "rankings"),
+    "skills": ("get_player_skill_ratings", {"display": "value"}, "players"),
+    "decompositions": ("get_player_skill_decompositions", {"tour": "pga"}, "players"),
+    "approach": ("get_detailed_approach_skill", {"period": "l24"}, "data"),
+}
+
+# Seconds before a source is considered stale.
+DEFAULT_TTLS = {
+    "players": 24 * HOUR,
+    "rankings": 6 * HOUR,
+    "skills": 6 * HOUR,
+    "decompositions": HOUR,
+    "approach": 24 * HOUR,
+}
+
+
+def normalize_name(name):
+    """
+    Normalize a player name for lookups, so "Åberg, Ludvig", "Ludvig Aberg" and
+    "ludvig  åberg" all map to "ludvig aberg".
+
+    Args:
+        name (str): A player name, as "Last, First" or "First Last".
+
+    Returns:
+        str: The lowercase, accent-free "first last" form.
+    """
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(char for char in name if not unicodedata.combining(char))
+    if "," in name:
+        last, _, first = name.partition(",")
+        name = f"{first} {last}"
+    return " ".join(re.sub(r"[^\w\s]", "", name.lower()).split())
+
+
+def _records(payload, key):
+    records = payload if key is None else payload.get(key)
+    return [record for record in records or [] if record.get("dg_id") is not None]
+
+
+def _is_number(value):
+    return isinstance(value, Number)
+
+
+def _missing(values):
+    if values.dtype == object:
+        return values == None  # noqa: E711, elementwise
+    return values != values
+
+
+class _Block:
+    """
+    One source's records as columns, aligned on its own dg_id order.
+    """
+
+    def __init__(self, records):
+        import numpy as np
+
+        self.ids = np.array([record["dg_id"] for record in records], dtype=np.int64)
+        self.columns = {}
+        names = dict.fromkeys(name for record in records for name in record)
+        names.pop("dg_id", None)
+        for name in names:
+            values = [record.get(name) for record in records]
+            present = [value for value in values if value is not None]
+            if present and all(_is_number(value) for value in present):
+                column = np.array(
+                    [np.nan if value is None else value for value in values],
+                    dtype=np.float64,
+                )
+            else:
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+            self.columns[name] = column
+
+
+class _Table:
+    """
+    The joined columns and their indexes. Refreshes build a new table and publish it
+    with one assignment, so readers dereferencing PlayerStore._table once always see a
+    consistent snapshot.
+    """
+
+    def __init__(self, index, columns, providers):
+        import numpy as np
+
+        self.index = index
+        self.columns = columns
+        self.providers = providers
+        self.ids = np.fromiter(index, dtype=np.int64, count=len(index))
+        self.names = {}
+        names = columns.get("player_name")
+        if names is not None:
+            for row, name in enumerate(names):
+                if isinstance(name, str):
+                    self.names.setdefault(normalize_name(name), row)
+
+    def row(self, key):
+        if isinstance(key, str):
+            return self.names[normalize_name(key)]
+        return self.index[int(key)]
+
+    def rows(self, players):
+        import numpy as np
+
+        rows = []
+        for player in players:
+            if isinstance(player, dict):
+                player = player.get("dg_id")
+            try:
+                rows.append(self.row(player))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return np.array(rows, dtype=np.intp)
+
+    def record(self, row):
+        record = {"dg_id": int(self.ids[row])}
+        for name, column in self.columns.items():
+            value = column[row]
+            if column.dtype != object:
+                value = None if value != value else value.item()
+            record[name] = value
+        return record
+
+
+class PlayerStore:
+    def __init__(self, dg, tour="pga", period="l24", ttls=None, sources=None):
+        """
+        Initialize an in-memory player store joining the player list, DG rankings,
+        skill ratings, skill decompositions and approach skill on dg_id.
+
+        Every field becomes a numpy column with one row per player (NaN or None where a
+        source has no record for the player), indexed by dg_id and by normalized name.
+        When sources share a field (player_name, country, ...), each player's value comes
+        from the first source in SOURCES order that has the player. Requires numpy.
+
+        Args:
+            dg (DataGolfSDK): The client used to fetch the sources.
+            tour (str, optional): Tour for the skill decompositions. Defaults to "pga".
+            period (str, optional): Period for the approach skill. Defaults to "l24".
+            ttls (dict, optional): Source name to seconds before it is re-fetched, overriding DEFAULT_TTLS.
+            sources (list, optional): Names of the SOURCES to load. Defaults to all.
+        """
+        self.dg = dg
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.sources = {}
+        for name in sources or SOURCES:
+            method, kwargs, key = SOURCES[name]
+            kwargs = dict(kwargs)
+            if name == "decompositions":
+                kwargs["tour"] = tour
+            elif name == "approach":
+                kwargs["period"] = period
+            self.sources[name] = (method, kwargs, key)
+        self.fetched_at = {}
+        self._blocks = {}
+        self._lock = threading.Lock()
+        self._table = _Table({}, {}, {})
+
+    @property
+    def ids(self):
+        """
+        dg_ids of the players, in row order.
+        """
+        return self._table.ids
+
+    def _fetch(self, name):
+        method, kwargs, key = self.sources[name]
+        payload = getattr(self.dg, method)(file_format="json", **kwargs)
+        return _Block(_records(require_dicts(payload, "PlayerStore"), key))
+
+    def stale(self):
+        """
+        Names of the sources that were never loaded or are older than their TTL.
+
+        Returns:
+            list: Source names.
+        """
+        now = time.monotonic()
+        return [
+            name
+            for name in self.sources
+            if name not in self.fetched_at
+            or now - self.fetched_at[name] >= self.ttls[name]
+        ]
+
+    def refresh(self, force=False):
+        """
+        Re-fetch the stale sources (all of them when force is set) concurrently and
+        update their columns. The other sources are not fetched again.
+
+        Args:
+            force (bool, optional): Re-fetch every source. Defaults to False.
+
+        Returns:
+            list: Names of the refreshed sources.
+        """
+        with self._lock:
+            names = list(self.sources) if force else self.stale()
+            if not names:
+                return []
+            with ThreadPoolExecutor(max_workers=len(names)) as executor:
+                blocks = dict(zip(names, executor.map(self._fetch, names)))
+            now = time.monotonic()
+            for name in names:
+                self.fetched_at[name] = now
+            self._blocks.update(blocks)
+            self._rebuild(names)
+            return names
+
+    def load(self):
+        """
+        Fetch every source.
+
+        Returns:
+            PlayerStore: self.
+        """
+        self.refresh(force=True)
+        return self
+
+    def _rebuild(self, changed):
+        import numpy as np
+
+        table = self._table
+        index = dict(table.index)
+        for name in self.sources:
+            block = self._blocks.get(name)
+            if block is not None:
+                for dg_id in block.ids.tolist():
+                    index.setdefault(dg_id, len(index))
+        # New players shift nothing, but every column must grow to cover them.
+        previous = table.columns if len(index) == len(table.index) else {}
+
+        providers = {}
+        for name in self.sources:
+            block = self._blocks.get(name)
+            if block is not None:
+                for column in block.columns:
+                    providers.setdefault(column, []).append(name)
+
+        rows = {}
+        columns = {}
+        for column, names in providers.items():
+            if column in previous and not set(names) & set(changed):
+                columns[column] = previous[column]
+                continue
+            blocks = [self._blocks[name] for name in names]
+            if any(block.columns[column].dtype == object for block in blocks):
+                target = np.empty(len(index), dtype=object)
+            else:
+                target = np.full(len(index), np.nan)
+            # Earlier sources win; later ones only fill players the earlier ones lack.
+            for name, block in zip(names, blocks):
+                if name not in rows:
+                    rows[name] = np.fromiter(
+                        (index[dg_id] for dg_id in block.ids.tolist()),
+                        dtype=np.intp,
+                        count=len(block.ids),
+                    )
+                fill = _missing(target[rows[name]])
+                target[rows[name][fill]] = block.columns[column][fill]
+            columns[column] = target
+        self._table = _Table(index, columns, providers)
+
+    def __len__(self):
+        return len(self._table.index)
+
+    def __contains__(self, key):
+        try:
+            self.row(key)
+        except KeyError:
+            return False
+        return True
+
+    @property
+    def columns(self):
+        return list(self._table.columns)
+
+    def row(self, key):
+        """
+        Row of a player, by dg_id or by name in any supported form.
+
+        Args:
+            key (int or str): A dg_id or a player name.
+
+        Returns:
+            int: The row in every column.
+
+        Raises:
+            KeyError: Unknown player.
+        """
+        return self._table.row(key)
+
+    def rows(self, players):
+        """
+        Rows of the known players among the given ones, skipping unknown players.
+
+        Args:
+            players (iterable): dg_ids, names, or records with a dg_id (e.g. a field from get_field_updates).
+
+        Returns:
+            numpy.ndarray: The rows.
+        """
+        return self._table.rows(players)
+
+    def column(self, name):
+        """
+        A column, with one value per player in the order of ids.
+
+        Args:
+            name (str): The field name, e.g. "sg_app" or "datagolf_rank".
+
+        Returns:
+            numpy.ndarray: float64 for numeric fields (NaN when missing), object otherwise. Do not modify.
+        """
+        return self._table.columns[name]
+
+    def source(self, column):
+        """
+        Name of the first source providing a column.
+        """
+        return self._table.providers[column][0]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __getitem__(self, key):
+        table = self._table
+        return table.record(table.row(key))
+
+    def record(self, row):
+        """
+        All fields of the player in a row, as a dict.
+        """
+        return self._table.record(row)
+
+    def top(self, column, n=10, among=None, ascending=False):
+        """
+        The n players with the highest (or lowest) value of a column, ignoring missing values.
+
+        Args:
+            column (str): The field to rank by, e.g. "sg_app".
+            n (int, optional): Number of players. Defaults to 10.
+            among (iterable, optional): Restrict to these players (dg_ids, names or records with a dg_id). Defaults to everyone.
+            ascending (bool, optional): Return the lowest values instead, e.g. for "datagolf_rank". Defaults to False.
+
+        Returns:
+            list: Player records, best first.
+        """
+        import numpy as np
+
+        table = self._table
+        values = table.columns[column]
+        rows = np.arange(len(values)) if among is None else table.rows(among)
+        subset = values[rows].astype(np.float64)
+        keep = ~np.isnan(subset)
+        rows, subset = rows[keep], subset[keep]
+        order = subset if ascending else -subset
+        if n <= 0:
+            return []
+        if n < len(rows):
+            best = np.argpartition(order, n - 1)[:n]
+        else:
+            best = np.arange(len(rows))
+        best = best[np.argsort(order[best], kind="stable")]
+        return [table.record(row) for row in rows[best].tolist()]
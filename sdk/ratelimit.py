@@ -0,0 +1,109 @@
+import json
+import os
+import threading
+import time
+
+# DataGolf allows 45 requests per minute per API key.
+DEFAULT_REQUESTS_PER_MINUTE = 45
+
+
+class TokenBucket:
+    def __init__(self, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, burst=1):
+        """
+        Initialize a thread-safe token-bucket rate limiter.
+
+        Each request takes one token; tokens refill at requests_per_minute / 60 per second
+        up to burst. Callers reserve their slot before sleeping, so waiting threads are
+        served in order without busy polling. Share one bucket between clients to share
+        the budget.
+
+        Args:
+            requests_per_minute (float, optional): Sustained request rate. Defaults to 45.
+            burst (int, optional): Requests allowed back to back after an idle period. Defaults to 1, which never exceeds the rate over any window.
+        """
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(burst)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _update(self, func):
+        with self._lock:
+            # Monotonic, so wall-clock adjustments cannot stall or burst the limiter.
+            now = time.monotonic()
+            tokens = self._refill(self._tokens, self._updated, now)
+            self._tokens, result = func(tokens)
+            self._updated = now
+            return result
+
+    def _refill(self, tokens, updated, now):
+        return min(self.capacity, tokens + max(0.0, now - updated) * self.rate)
+
+    def _reserve(self, tokens):
+        tokens -= 1
+        return tokens, max(0.0, -tokens / self.rate)
+
+    def acquire(self):
+        """
+        Block until a request may be sent.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        wait = self._update(self._reserve)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds):
+        """
+        Hold back every caller sharing the bucket, e.g. after the server asked to retry later.
+
+        Args:
+            seconds (float): Seconds before the next request may be sent.
+        """
+        self._update(lambda tokens: (min(tokens, -seconds * self.rate), None))
+
+
+class FileTokenBucket(TokenBucket):
+    def __init__(
+        self, path, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, burst=1
+    ):
+        """
+        Initialize a token-bucket rate limiter shared across processes.
+
+        The bucket state lives in a small file guarded by an exclusive flock, so every
+        process (and thread) pointing at the same path shares one request budget.
+        Requires a POSIX system.
+
+        Args:
+            path (str): Path of the state file. Created if missing.
+            requests_per_minute (float, optional): Sustained request rate. Defaults to 45.
+            burst (int, optional): Requests allowed back to back after an idle period. Defaults to 1.
+        """
+        super().__init__(requests_per_minute, burst)
+        self.path = path
+
+    def _update(self, func):
+        import fcntl
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            # The monotonic clock is shared by every process on the host. It restarts on
+            # reboot; a saved timestamp ahead of it just refills nothing once.
+            now = time.monotonic()
+            try:
+                state = json.loads(os.read(fd, 4096) or b"{}")
+                tokens = float(state["tokens"])
+                updated = float(state["updated"])
+            except (ValueError, KeyError, TypeError):
+                tokens, updated = self.capacity, now
+            tokens, result = func(self._refill(tokens, updated, now))
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, json.dumps({"tokens": tokens, "updated": now}).encode())
+            return result
+        finally:
+            # Closing the descriptor releases the lock.
+            os.close(fd)
@@ -0,0 +1,322 @@
+import math
+import sys
+from array import array
+from numbers import Number
+
+from sdk.decoders import to_dicts
+from sdk.payloads import INT_FIELDS, iter_rounds
+
+RECORDS_FORMAT = "records"
+
+# Stored in integer columns for missing values.
+INT_MISSING = -(2**63)
+
+# Declared column kinds; other fields are inferred from their values.
+_ODDS_FIELDS = {
+    "open_odds": "float",
+    "close_odds": "float",
+    "bet_outcome_numeric": "float",
+    "p1_open": "float",
+    "p1_close": "float",
+    "p2_open": "float",
+    "p2_close": "float",
+    "p3_open": "float",
+    "p3_close": "float",
+    "p1_outcome": "float",
+    "p2_outcome": "float",
+    "p3_outcome": "float",
+    "outcome": "str",
+}
+_DFS_FIELDS = {"salary": "int", "fin_text": "str"}
+
+
+def _event_rows(record_key, event_fields):
+    def rows(payload):
+        event = {name: payload.get(name) for name in event_fields if name in payload}
+        for record in payload.get(record_key) or []:
+            yield dict(event, **record)
+
+    return rows
+
+
+# Endpoint to (function yielding one row dict per record, declared column kinds).
+RECORD_SOURCES = {
+    "historical-raw-data/rounds": (
+        iter_rounds,
+        dict({name: "int" for name in INT_FIELDS}, fin_text="str", teetime="str"),
+    ),
+    "historical-odds/outrights": (
+        _event_rows(
+            "odds", ("book", "event_id", "event_name", "event_completed", "market")
+        ),
+        dict(_ODDS_FIELDS, dg_id="int", event_id="int"),
+    ),
+    "historical-odds/matchups": (
+        _event_rows("odds", ("book", "event_id", "event_name", "event_completed")),
+        dict(
+            _ODDS_FIELDS,
+            p1_dg_id="int",
+            p2_dg_id="int",
+            p3_dg_id="int",
+            round_num="int",
+            event_id="int",
+        ),
+    ),
+    "historical-dfs-data/points": (
+        _event_rows("dfs_points", ("tour", "year", "event_id", "event_name", "site")),
+        dict(_DFS_FIELDS, dg_id="int", year="int", event_id="int"),
+    ),
+}
+
+
+def _number(value):
+    return isinstance(value, Number) and not isinstance(value, bool)
+
+
+def _fits(kind, value):
+    if value is None or kind == "str":
+        return True
+    if kind == "float":
+        return _number(value)
+    return _number(value) and float(value).is_integer()
+
+
+class _Column:
+    """
+    One field of a RecordArray: int64 or float64 values in an array.array, or
+    dictionary-encoded values (int32 codes into a list of distinct interned values).
+    """
+
+    __slots__ = ("kind", "data", "values", "codes")
+
+    def __init__(self, kind, length=0):
+        self.kind = kind
+        if kind == "int":
+            self.data = array("q", [INT_MISSING]) * length
+        elif kind == "float":
+            self.data = array("d", [math.nan]) * length
+        else:
+            self.data = array("i", [-1]) * length
+            self.values = []
+            self.codes = {}
+
+    def _code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            if isinstance(value, str):
+                value = sys.intern(value)
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def fits(self, value):
+        return _fits(self.kind, value)
+
+    def append(self, value):
+        if value is None:
+            if self.kind == "int":
+                self.data.append(INT_MISSING)
+            elif self.kind == "float":
+                self.data.append(math.nan)
+            else:
+                self.data.append(-1)
+        elif self.kind == "int":
+            self.data.append(int(value))
+        elif self.kind == "float":
+            self.data.append(float(value))
+        else:
+            self.data.append(self._code(value))
+
+    def get(self, index):
+        value = self.data[index]
+        if self.kind == "int":
+            return None if value == INT_MISSING else value
+        if self.kind == "float":
+            return None if value != value else value
+        return None if value < 0 else self.values[value]
+
+    def converted(self, kind):
+        column = _Column(kind)
+        for index in range(len(self.data)):
+            column.append(self.get(index))
+        return column
+
+
+class Record:
+    """
+    One row of a RecordArray, with its fields as attributes.
+    """
+
+    __slots__ = ("_records", "_index")
+
+    def __init__(self, records, index):
+        self._records = records
+        self._index = index
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            column = self._records._columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return column.get(self._index)
+
+    def __getitem__(self, name):
+        return self._records._columns[name].get(self._index)
+
+    def get(self, name, default=None):
+        column = self._records._columns.get(name)
+        return default if column is None else column.get(self._index)
+
+    def as_dict(self):
+        return {
+            name: column.get(self._index)
+            for name, column in self._records._columns.items()
+        }
+
+    def __eq__(self, other):
+        return isinstance(other, Record) and self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        return f"Record({self.as_dict()!r})"
+
+
+class RecordArray:
+    def __init__(self, rows=(), kinds=None):
+        """
+        Initialize a struct-of-arrays container of records.
+
+        Numeric fields are stored as native int64/float64 values in array.array columns
+        and other fields are dictionary-encoded with interned values, so a row costs a few
+        bytes per field instead of a dict of Python objects. Rows read back as Record
+        objects with attribute access. Field kinds are inferred from the values unless
+        declared; an integer field that receives a fraction becomes a float field, and a
+        numeric field that receives text becomes a dictionary-encoded one.
+
+        Args:
+            rows (iterable, optional): Row dicts (or Records) to append. Defaults to none.
+            kinds (dict, optional): Field name to "int", "float" or "str". Defaults to None.
+        """
+        self.kinds = dict(kinds or {})
+        self._columns = {}
+        self._length = 0
+        self.extend(rows)
+
+    def _kind(self, name, value):
+        kind = self.kinds.get(name)
+        if kind is not None and _fits(kind, value):
+            return kind
+        if _number(value):
+            return "int" if isinstance(value, int) else "float"
+        return "str"
+
+    def append(self, row):
+        """
+        Append a row.
+
+        Args:
+            row (dict or Record): The row. Missing fields are stored as missing.
+        """
+        if isinstance(row, Record):
+            row = row.as_dict()
+        columns = self._columns
+        for name, value in row.items():
+            column = columns.get(name)
+            if column is None:
+                if value is None:
+                    continue
+                name = sys.intern(name)
+                column = columns[name] = _Column(self._kind(name, value), self._length)
+            elif not column.fits(value):
+                kind = "float" if column.kind == "int" and _number(value) else "str"
+                column = columns[name] = column.converted(kind)
+            column.append(value)
+        self._length += 1
+        for column in columns.values():
+            if len(column.data) < self._length:
+                column.append(None)
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RecordArray(
+                (self[i] for i in range(*index.indices(self._length))), self.kinds
+            )
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("record index out of range")
+        return Record(self, index)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield Record(self, index)
+
+    @property
+    def fields(self):
+        return list(self._columns)
+
+    def column(self, name):
+        """
+        All values of a field.
+
+        Args:
+            name (str): The field name.
+
+        Returns:
+            array.array or list: The int64 (missing as INT_MISSING) or float64 (missing as NaN) array for numeric fields, which numpy.frombuffer can wrap without copying; a list of values otherwise.
+        """
+        column = self._columns[name]
+        if column.kind == "str":
+            return [column.get(index) for index in range(self._length)]
+        return column.data
+
+    def to_dicts(self):
+        return [record.as_dict() for record in self]
+
+    def nbytes(self):
+        """
+        Approximate memory held by the columns, in bytes.
+        """
+        total = 0
+        for column in self._columns.values():
+            total += column.data.buffer_info()[1] * column.data.itemsize
+            if column.kind == "str":
+                total += sys.getsizeof(column.values) + sum(
+                    sys.getsizeof(value) for value in column.values
+                )
+        return total
+
+    def __repr__(self):
+        return f"RecordArray({self._length} records, fields={self.fields!r})"
+
+
+def to_records(endpoint, payload, records=None):
+    """
+    Convert a parsed payload of a round, historical odds or DFS points endpoint to records.
+
+    Args:
+        endpoint (str): The API endpoint, a key of RECORD_SOURCES.
+        payload (dict): The JSON payload, as dicts or decoded into Structs.
+        records (RecordArray, optional): Container to append to, e.g. to accumulate several seasons. Defaults to a new one.
+
+    Returns:
+        RecordArray: The records.
+    """
+    if endpoint not in RECORD_SOURCES:
+        raise ValueError(f"{RECORDS_FORMAT!r} output is not supported for {endpoint}")
+    rows, kinds = RECORD_SOURCES[endpoint]
+    if records is None:
+        records = RecordArray(kinds=kinds)
+    else:
+        for name, kind in kinds.items():
+            records.kinds.setdefault(name, kind)
+    records.extend(rows(to_dicts(payload)))
+    return records
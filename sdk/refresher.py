@@ -0,0 +1,267 @@
+import copy
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sdk.batch import call_key
+from sdk.cache import HOUR, MINUTE
+
+logger = logging.getLogger(__name__)
+
+# Seconds between refreshes of each method's payload; others use DEFAULT_INTERVAL.
+DEFAULT_INTERVALS = {
+    "get_field_updates": 5 * MINUTE,
+    "get_dg_rankings": HOUR,
+    "get_tour_schedules": 6 * HOUR,
+    "get_player_list": 12 * HOUR,
+}
+DEFAULT_INTERVAL = 5 * MINUTE
+
+# First delay before retrying a failed refresh; it doubles with each failure, up to the
+# entry's interval.
+RETRY_DELAY = 5.0
+
+# Calls a refresher keeps warm at most. Every registered call is polled until it is
+# unregistered, so keep_warm and get_warm are meant for a fixed set of calls.
+MAX_ENTRIES = 64
+
+
+class WarmValue:
+    __slots__ = ("value", "fetched_at", "interval", "error")
+
+    def __init__(self, value, fetched_at, interval, error=None):
+        """
+        The last good value of a kept-warm call.
+
+        Args:
+            value (object): What the method last returned.
+            fetched_at (float): When it was fetched, as a time.time() timestamp.
+            interval (float): Seconds between refreshes.
+            error (Exception, optional): Error of the latest refresh, if it failed. Defaults to None.
+        """
+        self.value = value
+        self.fetched_at = fetched_at
+        self.interval = interval
+        self.error = error
+
+    @property
+    def age(self):
+        """
+        Seconds since the value was fetched.
+        """
+        return time.time() - self.fetched_at
+
+    @property
+    def stale(self):
+        """
+        Whether the value is older than its refresh interval, e.g. because refreshes fail.
+        """
+        return self.age > self.interval
+
+    def __repr__(self):
+        error = f", error={self.error!r}" if self.error else ""
+        return f"WarmValue(age={self.age:.1f}s, stale={self.stale}{error})"
+
+
+class _Entry:
+    def __init__(self, method, args, kwargs, interval):
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+        self.interval = interval
+        self.value = None
+        self.fetched_at = None
+        self.error = None
+        self.failures = 0
+        self.due = 0.0
+        self.refreshing = False
+        self.ready = threading.Event()
+
+
+class Refresher:
+    def __init__(self, dg, max_workers=4, max_entries=MAX_ENTRIES):
+        """
+        Initialize a stale-while-revalidate refresher of client calls.
+
+        Registered calls are refreshed in the background on their interval, and reads are
+        served from memory immediately. When a refresh fails, the last good value keeps
+        being served (with its age and the error) and the refresh is retried with backoff.
+
+        Args:
+            dg (DataGolfSDK): The client. Refreshes run on a shallow copy of it without the response cache, so they share its transport, rate limiter, retry policy, decoder, metrics and in-flight calls, while file_format is the one set when the refresher starts.
+            max_workers (int, optional): Concurrent refreshes. Defaults to 4.
+            max_entries (int, optional): Calls kept warm at most; registering more raises. Defaults to 64.
+        """
+        # Only the cache attribute is replaced; everything else is the client's own object.
+        self.dg = copy.copy(dg)
+        self.dg.cache = None
+        self.max_workers = max_workers
+        self.max_entries = max_entries
+        self.entries = {}
+        self._cond = threading.Condition()
+        self._executor = None
+        self._thread = None
+        self._closed = False
+
+    def register(self, method, *args, interval=None, **kwargs):
+        """
+        Keep a call warm, e.g. register("get_field_updates", "pga").
+
+        The first fetch starts right away. Registering a call again only updates its interval.
+        The call is refreshed until it is unregistered.
+
+        Args:
+            method (str): Name of a client method.
+            *args: Positional arguments of the method.
+            interval (float, optional): Seconds between refreshes. Defaults to the DEFAULT_INTERVALS entry of the method.
+            **kwargs: Keyword arguments of the method.
+
+        Returns:
+            tuple: The call's key.
+
+        Raises:
+            RuntimeError: The refresher is closed, or already keeps max_entries calls warm.
+        """
+        return self._register(method, args, kwargs, interval)[0]
+
+    def _key(self, method, args, kwargs):
+        func = getattr(self.dg, method, None)
+        if not callable(func):
+            raise AttributeError(f"{type(self.dg).__name__} has no method {method!r}")
+        return call_key(func, method, args, kwargs)
+
+    def _register(self, method, args, kwargs, interval):
+        key = self._key(method, args, kwargs)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("the refresher is closed")
+            entry = self.entries.get(key)
+            if entry is None:
+                if len(self.entries) >= self.max_entries:
+                    raise RuntimeError(
+                        f"already keeping {len(self.entries)} calls warm; unregister "
+                        "some or raise max_entries"
+                    )
+                if interval is None:
+                    interval = DEFAULT_INTERVALS.get(method, DEFAULT_INTERVAL)
+                entry = self.entries[key] = _Entry(method, args, kwargs, interval)
+            elif interval is not None:
+                entry.interval = interval
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="datagolf-refresh"
+                )
+                self._thread = threading.Thread(target=self._schedule, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        return key, entry
+
+    def unregister(self, method, *args, **kwargs):
+        """
+        Stop keeping a call warm and drop its value.
+
+        A refresh already running finishes but is discarded. A read still waiting for the
+        first fetch raises.
+
+        Args:
+            method (str): Name of a client method.
+            *args: Positional arguments of the method.
+            **kwargs: Keyword arguments of the method.
+
+        Returns:
+            bool: True if the call was registered.
+        """
+        key = self._key(method, args, kwargs)
+        with self._cond:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                return False
+            if entry.fetched_at is None and entry.error is None:
+                entry.error = RuntimeError(f"{method} was unregistered")
+            entry.ready.set()
+            self._cond.notify_all()
+        return True
+
+    def get(self, method, *args, timeout=None, **kwargs):
+        """
+        Read the last good value of a call, registering it if needed.
+
+        Only the first read of a call waits for a fetch; later reads return at once while
+        refreshes run in the background.
+
+        Args:
+            method (str): Name of a client method.
+            *args: Positional arguments of the method.
+            timeout (float, optional): Seconds to wait for the first fetch. Defaults to None (no limit).
+            **kwargs: Keyword arguments of the method.
+
+        Returns:
+            WarmValue: The value, its age and the error of the latest refresh, if any.
+
+        Raises:
+            TimeoutError: The first fetch did not finish within timeout.
+            DataGolfError: The call has never succeeded; its latest error is raised.
+        """
+        entry = self._register(method, args, kwargs, None)[1]
+        if not entry.ready.wait(timeout):
+            raise TimeoutError(f"{method} was not fetched within {timeout}s")
+        with self._cond:
+            if entry.fetched_at is None:
+                raise entry.error
+            return WarmValue(entry.value, entry.fetched_at, entry.interval, entry.error)
+
+    def _schedule(self):
+        with self._cond:
+            while not self._closed:
+                now = time.monotonic()
+                wait = None
+                for entry in self.entries.values():
+                    if entry.refreshing:
+                        continue
+                    if entry.due <= now:
+                        entry.refreshing = True
+                        self._executor.submit(self._refresh, entry)
+                    elif wait is None or entry.due - now < wait:
+                        wait = entry.due - now
+                self._cond.wait(wait)
+
+    def _refresh(self, entry):
+        try:
+            value = getattr(self.dg, entry.method)(*entry.args, **entry.kwargs)
+        except Exception as error:
+            with self._cond:
+                entry.error = error
+                entry.failures += 1
+                delay = min(entry.interval, RETRY_DELAY * 2 ** (entry.failures - 1))
+                entry.due = time.monotonic() + delay
+            logger.warning(
+                "Refreshing %s failed (%d in a row), retrying in %.1fs: %s",
+                entry.method,
+                entry.failures,
+                delay,
+                error,
+            )
+        else:
+            with self._cond:
+                entry.value = value
+                entry.fetched_at = time.time()
+                entry.error = None
+                entry.failures = 0
+                entry.due = time.monotonic() + entry.interval
+        finally:
+            with self._cond:
+                entry.refreshing = False
+                entry.ready.set()
+                self._cond.notify_all()
+
+    def close(self):
+        """
+        Stop refreshing. Values already fetched can no longer be read.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._executor.shutdown(wait=True)
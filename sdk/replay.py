@@ -0,0 +1,195 @@
+import json
+import mmap
+import os
+import threading
+import zlib
+from urllib.parse import urlsplit
+
+from sdk.cache import cache_key
+from sdk.exceptions import DataGolfError
+
+DATA_FILE = "responses.bin"
+INDEX_FILE = "index.jsonl"
+
+
+class ReplayMissError(DataGolfError):
+    """
+    The replayed archive holds no response for the request.
+    """
+
+
+def _request_key(url, params):
+    return cache_key(urlsplit(url).path.strip("/"), params)
+
+
+class RecordedResponse:
+    def __init__(self, status_code, content, headers=None):
+        """
+        A response served from an archive, with the parts of requests.Response the SDK uses.
+
+        Args:
+            status_code (int): The HTTP status code.
+            content (bytes): The response body.
+            headers (dict, optional): Response headers. Defaults to None.
+        """
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=1):
+        view = memoryview(self.content)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start : start + chunk_size])
+
+    def close(self):
+        pass
+
+
+class RecordingTransport:
+    def __init__(self, path, transport=None, level=6):
+        """
+        Initialize a transport that records every successful response to an archive.
+
+        The archive is a directory holding an append-only file of zlib-compressed bodies
+        and a JSON-lines index of (request key, offset, length). Request keys are the
+        endpoint plus normalized params, without the API key.
+
+        Args:
+            path (str): Archive directory. Created if missing; existing recordings are kept.
+            transport (object, optional): Transport used to send requests. Defaults to a pooled HTTPTransport.
+            level (int, optional): zlib compression level. Defaults to 6.
+        """
+        if transport is None:
+            from sdk.transport import HTTPTransport
+
+            transport = HTTPTransport()
+        self.path = path
+        self.transport = transport
+        self.level = level
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        self._data = open(os.path.join(path, DATA_FILE), "ab")
+        self._index = open(os.path.join(path, INDEX_FILE), "a")
+
+    def get(self, url, params=None, stream=False):
+        response = self.transport.get(url, params=params)
+        if response.status_code == 200:
+            self.record(
+                _request_key(url, params),
+                response.content,
+                response.headers.get("Content-Type"),
+            )
+        return response
+
+    def record(self, key, content, content_type=None):
+        """
+        Append a response body to the archive.
+
+        Args:
+            key (str): The request key.
+            content (bytes): The response body.
+            content_type (str, optional): The response Content-Type. Defaults to None.
+        """
+        blob = zlib.compress(content, self.level)
+        with self._lock:
+            offset = self._data.tell()
+            self._data.write(blob)
+            self._data.flush()
+            entry = {
+                "key": key,
+                "offset": offset,
+                "length": len(blob),
+                "size": len(content),
+                "content_type": content_type,
+            }
+            self._index.write(json.dumps(entry) + "\n")
+            self._index.flush()
+
+    def close(self):
+        with self._lock:
+            self._data.close()
+            self._index.close()
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ReplayTransport:
+    def __init__(self, path, memoize=True):
+        """
+        Initialize a transport that serves responses from an archive, without any network access.
+
+        The compressed bodies are memory-mapped and only the requested ones are
+        decompressed. When a request was recorded more than once, the latest recording wins.
+
+        Args:
+            path (str): Archive directory written by RecordingTransport.
+            memoize (bool, optional): Keep decompressed bodies in memory so repeated replays skip decompression. Defaults to True.
+        """
+        self.path = path
+        self.memoize = memoize
+        self.index = {}
+        with open(os.path.join(path, INDEX_FILE)) as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self.index[entry["key"]] = entry
+        self._file = open(os.path.join(path, DATA_FILE), "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        )
+        self._bodies = {}
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def body(self, key):
+        """
+        Decompressed body of a recorded request.
+
+        Args:
+            key (str): The request key.
+
+        Returns:
+            bytes: The response body.
+        """
+        content = self._bodies.get(key)
+        if content is None:
+            entry = self.index.get(key)
+            if entry is None:
+                raise ReplayMissError(f"No recorded response for {key}")
+            offset = entry["offset"]
+            content = zlib.decompress(self._map[offset : offset + entry["length"]])
+            if self.memoize:
+                self._bodies[key] = content
+        return content
+
+    def get(self, url, params=None, stream=False):
+        key = _request_key(url, params)
+        content = self.body(key)
+        content_type = self.index[key].get("content_type")
+        return RecordedResponse(200, content, {"Content-Type": content_type})
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+        self._bodies.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
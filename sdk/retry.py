@@ -0,0 +1,88 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value (str): Delay in seconds or an HTTP date.
+
+    Returns:
+        float or None: Seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_retries=3,
+        backoff_factor=0.5,
+        max_backoff=60.0,
+        jitter=True,
+        status_codes=RETRY_STATUS_CODES,
+    ):
+        """
+        Initialize a retry policy with exponential backoff.
+
+        Args:
+            max_retries (int, optional): Retries after the first attempt. 0 disables retrying. Defaults to 3.
+            backoff_factor (float, optional): Base delay in seconds, doubled on every retry. Defaults to 0.5.
+            max_backoff (float, optional): Upper bound of the backoff delay in seconds. Defaults to 60.
+            jitter (bool, optional): Randomize delays ("full jitter") so clients do not retry in lockstep. Defaults to True.
+            status_codes (tuple, optional): Status codes worth retrying. Defaults to 429 and transient 5xx codes.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_codes = status_codes
+
+    def should_retry(self, attempt, status_code=None, error=None):
+        """
+        Whether a failed attempt should be retried.
+
+        Args:
+            attempt (int): Zero-based number of the failed attempt.
+            status_code (int, optional): Status code of the response, None for transport errors.
+            error (TransportError, optional): The transport error, if the request failed before a response. Only transient errors are retried.
+
+        Returns:
+            bool: True if another attempt is allowed.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if error is not None:
+            return getattr(error, "transient", True)
+        return status_code is None or status_code in self.status_codes
+
+    def delay(self, attempt, retry_after=None):
+        """
+        Seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): Zero-based number of the failed attempt.
+            retry_after (float, optional): Delay requested by the server. Always honored when given.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        if retry_after is not None:
+            jitter = random.uniform(0, self.backoff_factor) if self.jitter else 0.0
+            return retry_after + jitter
+        backoff = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return random.uniform(0, backoff) if self.jitter else backoff
@@ -0,0 +1,375 @@
+import os
+
+from sdk.backtest import prediction_table
+
+# Standard deviation of a round score around the player's predicted strokes gained.
+ROUND_SD = 2.8
+
+# Players making the cut (plus ties), and the rounds played before it.
+CUT = 65
+CUT_ROUND = 2
+ROUNDS = 4
+
+
+def _position_name(position):
+    return "win" if position == 1 else f"top_{position}"
+
+
+def _simulate_chunk(args):
+    """
+    Simulate one chunk of tournaments in a worker process and return summed statistics.
+    """
+    import numpy as np
+
+    skills, sd, sims, seed, groups, cut = args
+    n = len(skills)
+    rng = np.random.default_rng(seed)
+    # Whole strokes relative to an average field player, so ties happen as in real events.
+    noise = rng.standard_normal((sims, ROUNDS, n), dtype=np.float32)
+    strokes = np.rint(noise * sd.astype(np.float32) - skills.astype(np.float32))
+    strokes = strokes.astype(np.int32)
+    cut_total = strokes[:, :CUT_ROUND].sum(axis=1)
+    total = strokes.sum(axis=1)
+    if cut and cut < n:
+        line = np.partition(cut_total, cut - 1, axis=1)[:, cut - 1 : cut]
+        made = cut_total <= line
+    else:
+        made = np.ones((sims, n), dtype=bool)
+    # Ranking key from 0, lower is better: the 72-hole total of players who made the
+    # cut, then the 36-hole total of those who missed it.
+    total -= total.min()
+    cut_total -= cut_total.min()
+    key = np.where(made, total, total.max() + 1 + cut_total)
+
+    # Players finishing ahead of and level with each player, from per-simulation counts
+    # of every key.
+    width = int(key.max()) + 1
+    counts = np.bincount(
+        (key + np.arange(sims)[:, None] * width).ravel(), minlength=sims * width
+    ).reshape(sims, width)
+    ahead = np.take_along_axis(np.cumsum(counts, axis=1) - counts, key, axis=1)
+    tied = np.take_along_axis(counts, key, axis=1)
+
+    # A player tied with others over places ahead + 1 .. ahead + tied holds each of
+    # them with weight 1 / tied under dead-heat rules. Summed as difference arrays over
+    # places, per player, whose cumulative sums give every place at once.
+    player = np.arange(n) * (n + 2)
+    shared = np.bincount(
+        (player + ahead + 1).ravel(), (1 / tied).ravel(), minlength=n * (n + 2)
+    ) - np.bincount(
+        (player + ahead + tied + 1).ravel(), (1 / tied).ravel(), minlength=n * (n + 2)
+    )
+    # Without dead-heat rules, a tie counts in full from the first place it spans.
+    full = np.bincount((player + ahead + 1).ravel(), minlength=n * (n + 2))
+
+    group_stats = None
+    if len(groups):
+        members = np.where(groups >= 0, groups, 0)
+        keys = np.where(groups >= 0, key[:, members], np.iinfo(np.int64).max)
+        best = keys == keys.min(axis=2, keepdims=True)
+        count = best.sum(axis=2, keepdims=True)
+        group_stats = (
+            (best / count).sum(axis=0),
+            (best & (count == 1)).sum(axis=0),
+            (best & (count > 1)).sum(axis=0),
+        )
+    return (
+        shared.reshape(n, n + 2),
+        full.reshape(n, n + 2),
+        made.sum(axis=0),
+        group_stats,
+    )
+
+
+class TournamentSimulator:
+    def __init__(self, dg_ids, names, skills, sd=ROUND_SD, cut=CUT):
+        """
+        Initialize a Monte Carlo tournament simulator.
+
+        Each simulated round score is a whole number of strokes drawn from a normal
+        distribution around the player's predicted strokes gained. After two rounds the
+        top cut players and ties go on to play four; everyone else finishes behind them.
+
+        Args:
+            dg_ids (list): Player ids of the field.
+            names (list): Player names.
+            skills (list): Predicted strokes gained per round relative to an average field player (final_pred).
+            sd (float or list, optional): Standard deviation of round scores, for the field or per player. Defaults to ROUND_SD.
+            cut (int, optional): Players (plus ties) making the cut; 0 for no cut. Defaults to CUT.
+        """
+        import numpy as np
+
+        self.dg_ids = np.asarray(dg_ids, dtype=np.int64)
+        self.names = list(names)
+        self.skills = np.asarray(skills, dtype=np.float64)
+        self.sd = sd
+        self.cut = cut
+        self._index = {dg_id: i for i, dg_id in enumerate(self.dg_ids.tolist())}
+
+    @classmethod
+    def from_decompositions(cls, payload, sd=ROUND_SD, cut=CUT):
+        """
+        Build a simulator from a get_player_skill_decompositions payload.
+
+        Players without a final prediction are left out.
+
+        Args:
+            payload (dict): The JSON payload.
+            sd (float, optional): Standard deviation of round scores. Defaults to ROUND_SD.
+            cut (int, optional): Players (plus ties) making the cut. Defaults to CUT.
+
+        Returns:
+            TournamentSimulator: The simulator.
+        """
+        rows = [
+            row
+            for row in payload.get("players") or []
+            if isinstance(row.get("final_pred"), (int, float))
+        ]
+        return cls(
+            [row.get("dg_id") for row in rows],
+            [row.get("player_name") for row in rows],
+            [row["final_pred"] for row in rows],
+            sd,
+            cut,
+        )
+
+    @classmethod
+    def from_api(cls, dg, tour="pga", sd=ROUND_SD, cut=CUT):
+        """
+        Build a simulator from the current skill decompositions.
+
+        Args:
+            dg (DataGolfSDK): The client.
+            tour (str, optional): The tour. Defaults to "pga".
+            sd (float, optional): Standard deviation of round scores. Defaults to ROUND_SD.
+            cut (int, optional): Players (plus ties) making the cut. Defaults to CUT.
+
+        Returns:
+            TournamentSimulator: The simulator.
+        """
+        return cls.from_decompositions(
+            dg.get_player_skill_decompositions(tour, "json"), sd, cut
+        )
+
+    def __len__(self):
+        return len(self.dg_ids)
+
+    def __repr__(self):
+        return f"TournamentSimulator({len(self)} players, sd={self.sd!r}, cut={self.cut})"
+
+    def simulate(
+        self,
+        sims=100000,
+        positions=(1, 5, 10, 20),
+        groups=(),
+        dead_heat=True,
+        workers=None,
+        seed=None,
+        chunk=10000,
+    ):
+        """
+        Simulate tournaments in NumPy batches across worker processes.
+
+        Args:
+            sims (int, optional): Number of simulated tournaments. Defaults to 100000.
+            positions (iterable, optional): Finish positions N to report the probability of finishing in the top N of (1 is a win). Defaults to (1, 5, 10, 20).
+            groups (iterable, optional): Groups of dg_ids, e.g. matchups or 3-balls, to report the probability of each player finishing best in. Defaults to none.
+            dead_heat (bool, optional): Apply dead-heat rules to ties straddling a position; without them a tie counts in full. Defaults to True.
+            workers (int, optional): Worker processes; 1 runs in this process. Defaults to the number of CPUs.
+            seed (int, optional): Random seed. Defaults to None.
+            chunk (int, optional): Simulations per task. Defaults to 10000.
+
+        Returns:
+            SimulationResult: The probability tables.
+        """
+        import numpy as np
+
+        positions = [int(position) for position in positions]
+        groups = [tuple(group) for group in groups]
+        width = max((len(group) for group in groups), default=0)
+        padded = np.full((len(groups), width), -1, dtype=np.int64)
+        for row, group in enumerate(groups):
+            try:
+                padded[row, : len(group)] = [self._index[dg_id] for dg_id in group]
+            except KeyError as error:
+                raise KeyError(
+                    f"Player {error.args[0]} is not in the field"
+                ) from None
+
+        sd = np.asarray(self.sd, dtype=np.float64)
+        seeds = np.random.SeedSequence(seed).spawn(-(-sims // chunk))
+        tasks = [
+            (
+                self.skills,
+                sd,
+                min(chunk, sims - i * chunk),
+                child,
+                padded,
+                self.cut,
+            )
+            for i, child in enumerate(seeds)
+        ]
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(tasks) == 1:
+            parts = list(map(_simulate_chunk, tasks))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parts = list(executor.map(_simulate_chunk, tasks))
+
+        shared = sum(part[0] for part in parts)
+        full = sum(part[1] for part in parts)
+        # Probability of holding each place (1..n), then of finishing in the top N.
+        places = np.cumsum(shared, axis=1)[:, 1 : len(self) + 1] / sims
+        top_shared = np.cumsum(places, axis=1)
+        top_full = np.cumsum(full, axis=1)[:, 1 : len(self) + 1] / sims
+
+        result = SimulationResult(self, sims, positions, groups)
+        result.places = places
+        result.finish = np.column_stack(
+            [
+                # A tie for the win is settled by a playoff, dead heat or not.
+                (top_shared if dead_heat or position == 1 else top_full)[
+                    :, min(position, len(self)) - 1
+                ]
+                for position in positions
+            ]
+        ).reshape(len(self), len(positions))
+        result.make_cut = sum(part[2] for part in parts) / sims
+        if groups:
+            win, outright, tie = (
+                sum(stats) / sims for stats in zip(*(part[3] for part in parts))
+            )
+            result.group_win, result.group_outright, result.group_tie = (
+                win,
+                outright,
+                tie,
+            )
+        return result
+
+    def calibrate(
+        self, predictions, model="baseline_history_fit", sims=20000, seed=0, workers=1
+    ):
+        """
+        Fit the round standard deviation so the simulated finish probabilities match a model's.
+
+        The standard deviation is searched (golden section, on common random numbers)
+        between 1.5 and 4.5 strokes, minimizing the squared error of the win, top 5,
+        top 10, top 20 and make cut probabilities of the players in both fields.
+
+        Args:
+            predictions (dict): A get_pre_tournament_predictions payload with odds_format="percent" and dead_heat="yes".
+            model (str, optional): Prediction model to match. Defaults to "baseline_history_fit".
+            sims (int, optional): Simulations per evaluation. Defaults to 20000.
+            seed (int, optional): Random seed. Defaults to 0.
+            workers (int, optional): Worker processes. Defaults to 1.
+
+        Returns:
+            float: The fitted standard deviation, also set as self.sd.
+        """
+        import numpy as np
+
+        table = prediction_table(predictions, model)
+        fields = ("win", "top_5", "top_10", "top_20", "make_cut")
+        rows = [i for i, dg_id in enumerate(self.dg_ids.tolist()) if dg_id in table]
+        if not rows:
+            raise ValueError("no player of the field has a prediction")
+        target = np.array(
+            [[table[self.dg_ids[i]][field] for field in fields] for i in rows]
+        )
+
+        def error(sd):
+            self.sd = sd
+            result = self.simulate(sims, (1, 5, 10, 20), seed=seed, workers=workers)
+            simulated = np.column_stack([result.finish[rows], result.make_cut[rows]])
+            return np.nanmean((simulated - target) ** 2)
+
+        ratio = (np.sqrt(5) - 1) / 2
+        low, high = 1.5, 4.5
+        a, b = high - ratio * (high - low), low + ratio * (high - low)
+        error_a, error_b = error(a), error(b)
+        for _ in range(12):
+            if error_a < error_b:
+                high, b, error_b = b, a, error_a
+                a = high - ratio * (high - low)
+                error_a = error(a)
+            else:
+                low, a, error_a = a, b, error_b
+                b = low + ratio * (high - low)
+                error_b = error(b)
+        self.sd = float((low + high) / 2)
+        return self.sd
+
+
+class SimulationResult:
+    def __init__(self, simulator, sims, positions, groups):
+        """
+        Probability tables of a tournament simulation.
+
+        Attributes:
+            places: (players, places) probabilities of finishing in each place, ties sharing the places they span.
+            finish: (players, positions) probabilities of finishing in the top N, dead-heat adjusted if requested.
+            make_cut: Probability of each player making the cut.
+            group_win: (groups, size) probabilities of finishing best in the group, ties splitting the win.
+            group_outright: Probabilities of finishing best in the group alone.
+            group_tie: Probabilities of tying for best in the group.
+
+        Args:
+            simulator (TournamentSimulator): The simulator.
+            sims (int): Number of simulated tournaments.
+            positions (list): Reported finish positions.
+            groups (list): Reported groups of dg_ids.
+        """
+        self.dg_ids = simulator.dg_ids
+        self.names = simulator.names
+        self.sims = sims
+        self.positions = positions
+        self.groups = groups
+        self.places = None
+        self.finish = None
+        self.make_cut = None
+        self.group_win = self.group_outright = self.group_tie = None
+
+    def rows(self):
+        """
+        One row dict per player: dg_id, player_name, a column per position and make_cut.
+        """
+        rows = []
+        for i, dg_id in enumerate(self.dg_ids.tolist()):
+            row = {"dg_id": dg_id, "player_name": self.names[i]}
+            for p, position in enumerate(self.positions):
+                row[_position_name(position)] = float(self.finish[i, p])
+            row["make_cut"] = float(self.make_cut[i])
+            rows.append(row)
+        return rows
+
+    def group_rows(self):
+        """
+        One row dict per player of each group: group, dg_id, win, outright and tie.
+        """
+        rows = []
+        for g, group in enumerate(self.groups):
+            for m, dg_id in enumerate(group):
+                rows.append(
+                    {
+                        "group": g,
+                        "dg_id": dg_id,
+                        "win": float(self.group_win[g, m]),
+                        "outright": float(self.group_outright[g, m]),
+                        "tie": float(self.group_tie[g, m]),
+                    }
+                )
+        return rows
+
+    def to_pandas(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.rows())
+
+    def __repr__(self):
+        return (
+            f"SimulationResult({len(self.dg_ids)} players, {self.sims} sims, "
+            f"positions={self.positions!r}, {len(self.groups)} groups)"
+        )
@@ -0,0 +1,161 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from numbers import Number
+
+from sdk.decoders import require_dicts
+from sdk.odds import BOOKS
+
+logger = logging.getLogger(__name__)
+
+OUTRIGHT_MARKETS = ("win", "top_5", "top_10", "top_20", "make_cut", "frl")
+MATCHUP_MARKETS = ("tournament_matchups", "round_matchups", "3_balls")
+ALL_PAIRINGS = "all_pairings"
+SNAPSHOT_MARKETS = OUTRIGHT_MARKETS + MATCHUP_MARKETS + (ALL_PAIRINGS,)
+
+SNAPSHOT_COLUMNS = (
+    "tour",
+    "market",
+    "dg_id",
+    "player_name",
+    "book",
+    "odds",
+    "opponents",
+    "event_name",
+    "last_updated",
+)
+
+
+def _row(tour, market, payload, dg_id, player_name, book, odds, opponents=None):
+    return {
+        "tour": tour,
+        "market": market,
+        "dg_id": dg_id,
+        "player_name": player_name,
+        "book": book,
+        "odds": odds,
+        "opponents": opponents,
+        "event_name": payload.get("event_name"),
+        "last_updated": payload.get("last_updated") or payload.get("last_update"),
+    }
+
+
+def _is_odds(value):
+    return isinstance(value, (Number, str)) and not isinstance(value, bool)
+
+
+def outright_rows(tour, market, payload):
+    """
+    Long rows of a get_outright_odds payload: one per player and book. Model odds
+    nested under a book (datagolf baseline, baseline_history_fit) become books named
+    datagolf_baseline and datagolf_baseline_history_fit. The book columns are the
+    payload's books_offering plus datagolf, or the known BOOKS when it has none; other
+    fields are ignored.
+    """
+    books = require_dicts(payload, "odds_snapshot").get("books_offering")
+    books = set(books) | {"datagolf"} if books else BOOKS
+    rows = []
+    for record in payload.get("odds") or []:
+        dg_id, name = record.get("dg_id"), record.get("player_name")
+        for book, odds in record.items():
+            if book not in books:
+                continue
+            if isinstance(odds, dict):
+                for model, value in odds.items():
+                    if _is_odds(value):
+                        book_model = f"{book}_{model}"
+                        rows.append(
+                            _row(tour, market, payload, dg_id, name, book_model, value)
+                        )
+            elif _is_odds(odds):
+                rows.append(_row(tour, market, payload, dg_id, name, book, odds))
+    return rows
+
+
+def _players(record):
+    """
+    (slot, dg_id, player_name) of a matchup or pairing, slot being p1, p2 or p3.
+    """
+    players = []
+    for slot in ("p1", "p2", "p3"):
+        player = record.get(slot)
+        if isinstance(player, dict):
+            players.append((slot, player.get("dg_id"), player.get("player_name")))
+        elif record.get(f"{slot}_dg_id") is not None:
+            players.append(
+                (slot, record[f"{slot}_dg_id"], record.get(f"{slot}_player_name"))
+            )
+    return players
+
+
+def matchup_rows(tour, market, payload):
+    """
+    Long rows of a get_matchup_odds or get_matchup_odds_all_pairings payload: one per
+    player, matchup and book, with the other players of the matchup as opponents.
+    """
+    records = require_dicts(payload, "odds_snapshot").get("match_list")
+    if records is None:
+        records = payload.get("pairings")
+    if not isinstance(records, list):
+        # The API answers with a message instead of a list when the market is not offered.
+        return []
+    rows = []
+    for record in records:
+        players = _players(record)
+        for slot, dg_id, name in players:
+            opponents = tuple(other for _, other, _ in players if other != dg_id)
+            for book, odds in (record.get("odds") or {}).items():
+                value = odds.get(slot) if isinstance(odds, dict) else None
+                if _is_odds(value):
+                    rows.append(
+                        _row(tour, market, payload, dg_id, name, book, value, opponents)
+                    )
+    return rows
+
+
+def odds_snapshot(
+    dg, tours=("pga",), markets=SNAPSHOT_MARKETS, odds_format="decimal", max_workers=10
+):
+    """
+    Fetch every (tour, market) odds feed concurrently and merge them into long rows.
+
+    Args:
+        dg (DataGolfSDK): The client; its pooled transport, cache and rate limiter are shared by all calls.
+        tours (list, optional): Tours to fetch. Defaults to ("pga",).
+        markets (list, optional): Outright markets, matchup markets and/or "all_pairings". Defaults to SNAPSHOT_MARKETS.
+        odds_format (str, optional): Odds format of the odds column. Defaults to "decimal".
+        max_workers (int, optional): Maximum concurrent requests. Defaults to 10.
+
+    Returns:
+        tuple: (rows, errors). rows is a list of dicts with the SNAPSHOT_COLUMNS, unique by (tour, market, dg_id, book, opponents); errors maps the (tour, market) of each feed that failed, e.g. a market a tour does not offer, to its exception.
+    """
+    calls = []
+    for tour in tours:
+        for market in markets:
+            if market in OUTRIGHT_MARKETS:
+                call = (dg.get_outright_odds, (tour, market, odds_format), outright_rows)
+            elif market in MATCHUP_MARKETS:
+                call = (dg.get_matchup_odds, (tour, market, odds_format), matchup_rows)
+            elif market == ALL_PAIRINGS:
+                method = dg.get_matchup_odds_all_pairings
+                call = (method, (tour, odds_format), matchup_rows)
+            else:
+                raise ValueError(f"Unknown odds market {market!r}")
+            calls.append((tour, market) + call)
+    if not calls:
+        return [], {}
+
+    def fetch(call):
+        tour, market, method, args, to_rows = call
+        try:
+            return to_rows(tour, market, method(*args, file_format="json")), None
+        except Exception as error:
+            logger.warning("Skipping %s %s odds: %s", tour, market, error)
+            return [], error
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+        results = list(executor.map(fetch, calls))
+    rows = [row for feed_rows, _ in results for row in feed_rows]
+    errors = {
+        call[:2]: error for call, (_, error) in zip(calls, results) if error is not None
+    }
+    return rows, errors
@@ -0,0 +1,156 @@
+import codecs
+import csv
+import json
+import re
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Key of the record array inside each large endpoint's JSON payload.
+STREAM_RECORD_KEYS = {
+    "historical-raw-data/rounds": "scores",
+    "historical-odds/outrights": "odds",
+    "historical-odds/matchups": "odds",
+    "historical-dfs-data/points": "dfs_points",
+}
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+class _Reader:
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Append the next chunk to the buffer. Returns False once the stream is exhausted."""
+        if self.eof:
+            return False
+        for chunk in self._chunks:
+            text = chunk if isinstance(chunk, str) else self._decoder.decode(chunk)
+            if text:
+                # Drop consumed text so the buffer only holds the record being parsed.
+                if self.pos:
+                    self.buf = self.buf[self.pos :]
+                    self.pos = 0
+                self.buf += text
+                return True
+        self.buf += self._decoder.decode(b"", final=True)
+        self.eof = True
+        return False
+
+    def peek(self):
+        """Skip whitespace and return the next character, or '' at the end of the stream."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found!r} in JSON stream")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value, reading more chunks as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self.buf) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_array(reader):
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+    while True:
+        yield reader.value()
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' but found {separator!r} in JSON stream")
+
+
+def iter_json_records(chunks, record_key=None):
+    """
+    Incrementally parse a JSON payload and yield its records one at a time.
+
+    Only the record currently being decoded is held in memory, so peak memory does
+    not grow with the size of the payload.
+
+    Args:
+        chunks (iterable): Bytes or str chunks of the JSON document.
+        record_key (str, optional): Top-level key of the record array. Defaults to None (every top-level array). Ignored when the document itself is an array.
+
+    Yields:
+        object: Each element of the record array.
+    """
+    reader = _Reader(chunks)
+    first = reader.peek()
+    if first == "[":
+        yield from _iter_array(reader)
+        return
+    if first != "{":
+        raise ValueError(f"Expected a JSON object or array but found {first!r}")
+
+    reader.pos += 1
+    while True:
+        char = reader.peek()
+        if char == "}" or char == "":
+            return
+        if char == ",":
+            reader.pos += 1
+            continue
+        key = reader.value()
+        reader.expect(":")
+        if reader.peek() == "[" and (record_key is None or key == record_key):
+            yield from _iter_array(reader)
+            if record_key is not None:
+                return
+        else:
+            reader.value()
+
+
+def _iter_lines(chunks):
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    for chunk in chunks:
+        pending += chunk if isinstance(chunk, str) else decoder.decode(chunk)
+        lines = pending.split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def iter_csv_records(chunks):
+    """
+    Incrementally parse a CSV payload and yield one dict per row.
+
+    Args:
+        chunks (iterable): Bytes or str chunks of the CSV document.
+
+    Yields:
+        dict: Each row keyed by the header columns.
+    """
+    yield from csv.DictReader(_iter_lines(chunks))
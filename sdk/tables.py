@@ -0,0 +1,226 @@
+import csv
+import io
+
+TABLE_FORMATS = ("pandas", "arrow")
+
+# Odds formats whose values are numeric in CSV output.
+NUMERIC_ODDS_FORMATS = ("percent", "decimal")
+
+# Default odds format of endpoints whose default is not numeric.
+DEFAULT_ODDS_FORMATS = {"preds/pre-tournament-archive": "american"}
+
+_ROUND_STATS = {
+    "tour": "str",
+    "year": "int",
+    "season": "int",
+    "event_id": "int",
+    "event_name": "str",
+    "player_name": "str",
+    "dg_id": "int",
+    "fin_text": "str",
+    "round_num": "int",
+    "course_name": "str",
+    "course_num": "int",
+    "course_par": "int",
+    "start_hole": "int",
+    "teetime": "str",
+    "round_score": "float",
+    "sg_putt": "float",
+    "sg_arg": "float",
+    "sg_app": "float",
+    "sg_ott": "float",
+    "sg_t2g": "float",
+    "sg_total": "float",
+    "driving_dist": "float",
+    "driving_acc": "float",
+    "gir": "float",
+    "scrambling": "float",
+    "prox_rgh": "float",
+    "prox_fw": "float",
+    "great_shots": "float",
+    "poor_shots": "float",
+    "eagles_or_better": "float",
+    "birdies": "float",
+    "pars": "float",
+    "bogies": "float",
+    "doubles_or_worse": "float",
+}
+
+_PREDICTIONS = {
+    "dg_id": "int",
+    "player_name": "str",
+    "event_name": "str",
+    "win": "odds",
+    "top_5": "odds",
+    "top_10": "odds",
+    "top_20": "odds",
+    "make_cut": "odds",
+}
+
+_HISTORICAL_MATCHUPS = {
+    "book": "str",
+    "bet_type": "str",
+    "event_id": "int",
+    "event_name": "str",
+    "round_num": "int",
+    "tie_rule": "str",
+}
+for _p in ("p1", "p2", "p3"):
+    _HISTORICAL_MATCHUPS.update(
+        {
+            f"{_p}_dg_id": "int",
+            f"{_p}_player_name": "str",
+            f"{_p}_open": "odds",
+            f"{_p}_close": "odds",
+            f"{_p}_outcome": "float",
+        }
+    )
+
+# Declared column types of the known endpoints' CSV output. "odds" columns are numeric
+# when the requested odds format is; "*" applies to every column not listed.
+COLUMN_TYPES = {
+    "get-player-list": {"dg_id": "int", "player_name": "str", "country": "str"},
+    "preds/get-dg-rankings": {
+        "dg_id": "int",
+        "player_name": "str",
+        "datagolf_rank": "int",
+        "owgr_rank": "int",
+        "dg_skill_estimate": "float",
+    },
+    "preds/skill-ratings": {
+        "dg_id": "int",
+        "player_name": "str",
+        "sg_putt": "float",
+        "sg_arg": "float",
+        "sg_app": "float",
+        "sg_ott": "float",
+        "sg_total": "float",
+        "driving_acc": "float",
+        "driving_dist": "float",
+    },
+    "preds/pre-tournament": _PREDICTIONS,
+    "preds/pre-tournament-archive": _PREDICTIONS,
+    "preds/fantasy-projection-defaults": {
+        "dg_id": "int",
+        "player_name": "str",
+        "salary": "int",
+        "proj_points_total": "float",
+        "proj_points_finish": "float",
+        "proj_points_scoring": "float",
+        "proj_ownership": "float",
+        "std_dev": "float",
+        "value": "float",
+    },
+    "betting-tools/outrights": {
+        "event_name": "str",
+        "last_updated": "str",
+        "market": "str",
+        "player_name": "str",
+        "dg_id": "int",
+        "*": "odds",
+    },
+    "historical-raw-data/rounds": _ROUND_STATS,
+    "historical-odds/outrights": {
+        "book": "str",
+        "event_id": "int",
+        "event_name": "str",
+        "market": "str",
+        "dg_id": "int",
+        "player_name": "str",
+        "open_odds": "odds",
+        "close_odds": "odds",
+        "open_time": "str",
+        "close_time": "str",
+        "bet_outcome_numeric": "float",
+        "bet_outcome_text": "str",
+        "outcome": "str",
+    },
+    "historical-odds/matchups": _HISTORICAL_MATCHUPS,
+    "historical-dfs-data/points": {
+        "dg_id": "int",
+        "player_name": "str",
+        "fin_text": "str",
+        "salary": "int",
+        "ownership": "float",
+        "total_pts": "float",
+        "finish_pts": "float",
+        "hole_pts": "float",
+        "hole_in_one_pts": "float",
+        "bonus_pts": "float",
+        "streak_pts": "float",
+    },
+}
+
+_PANDAS_DTYPES = {"int": "Int64", "float": "float64", "str": "string"}
+
+
+def _header(content):
+    end = content.find(b"\n")
+    line = content if end == -1 else content[:end]
+    return next(csv.reader([line.decode("utf-8-sig").rstrip("\r")]), [])
+
+
+def column_types(endpoint, columns, odds_format=None):
+    """
+    Resolve the declared type of each column of an endpoint's CSV output.
+
+    Args:
+        endpoint (str): The API endpoint.
+        columns (list): Column names of the CSV header.
+        odds_format (str, optional): The requested odds format. Defaults to None (the endpoint's default).
+
+    Returns:
+        dict: Column name to "int", "float" or "str". Undeclared columns are left out.
+    """
+    declared = COLUMN_TYPES.get(endpoint, {})
+    odds_format = odds_format or DEFAULT_ODDS_FORMATS.get(endpoint, "percent")
+    types = {}
+    for column in columns:
+        kind = declared.get(column, declared.get("*"))
+        if kind == "odds":
+            kind = "float" if odds_format in NUMERIC_ODDS_FORMATS else None
+        if kind:
+            types[column] = kind
+    return types
+
+
+def read_table(content, endpoint, output, odds_format=None):
+    """
+    Parse CSV response bytes straight into a typed pandas DataFrame or Arrow table.
+
+    Args:
+        content (bytes): The CSV response body.
+        endpoint (str): The API endpoint, used to look up declared column types.
+        output (str): "pandas" or "arrow".
+        odds_format (str, optional): The requested odds format. Defaults to None.
+
+    Returns:
+        pandas.DataFrame or pyarrow.Table: The parsed table.
+    """
+    types = column_types(endpoint, _header(content), odds_format)
+    if output == "pandas":
+        try:
+            import pandas as pd
+        except ImportError as error:
+            raise ImportError(
+                "pandas is required for file_format='pandas': pip install pandas"
+            ) from error
+        dtypes = {column: _PANDAS_DTYPES[kind] for column, kind in types.items()}
+        # BytesIO shares the response buffer instead of copying it.
+        return pd.read_csv(io.BytesIO(content), dtype=dtypes)
+
+    if output == "arrow":
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError as error:
+            raise ImportError(
+                "pyarrow is required for file_format='arrow': pip install pyarrow"
+            ) from error
+        arrow_types = {"int": pa.int64(), "float": pa.float64(), "str": pa.string()}
+        options = pacsv.ConvertOptions(
+            column_types={column: arrow_types[kind] for column, kind in types.items()}
+        )
+        return pacsv.read_csv(pa.BufferReader(content), convert_options=options)
+
+    raise ValueError(f"Unknown table output {output!r}, expected one of {TABLE_FORMATS}")
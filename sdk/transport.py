@@ -0,0 +1,72 @@
+from sdk.exceptions import TransportError
+
+
+class HTTPTransport:
+    def __init__(self, pool_size=10, timeout=30.0, headers=None):
+        """
+        Initialize a pooled, keep-alive HTTP transport.
+
+        A single requests.Session is kept for the lifetime of the transport so
+        TCP and TLS connections to the DataGolf API are reused between calls.
+
+        Args:
+            pool_size (int, optional): Maximum number of connections kept alive per host. Defaults to 10.
+            timeout (float or tuple, optional): Request timeout in seconds, or a (connect, read) tuple. Defaults to 30.
+            headers (dict, optional): Extra headers sent with every request. Defaults to None.
+        """
+        # Imported here so that importing the SDK does not pay for requests.
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.pool_size = pool_size
+        self.timeout = timeout
+        # Every requests error: connection failures, timeouts, broken chunked or gzip
+        # bodies, redirect loops. Only the first three are worth retrying.
+        self._errors = requests.RequestException
+        self._transient_errors = (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        )
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate"})
+        if headers:
+            self.session.headers.update(headers)
+
+    def get(self, url, params=None, stream=False):
+        """
+        Send a GET request over the pooled session.
+
+        Args:
+            url (str): The full request URL.
+            params (dict, optional): Query parameters. Defaults to None.
+            stream (bool, optional): Defer downloading the body until it is read. Defaults to False.
+
+        Returns:
+            requests.Response: The response object.
+
+        Raises:
+            TransportError: The request failed: connection error, timeout, unreadable body, too many redirects. Its transient flag tells whether retrying may help.
+        """
+        try:
+            return self.session.get(
+                url, params=params, timeout=self.timeout, stream=stream
+            )
+        except self._errors as error:
+            transient = isinstance(error, self._transient_errors)
+            raise TransportError(str(error), transient) from error
+
+    def close(self):
+        """
+        Close the session and release all pooled connections.
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
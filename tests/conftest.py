@@ -0,0 +1,84 @@
+import json
+import threading
+
+import pytest
+
+from benchmarks.stub_server import StubServer
+from sdk.datagolf_sdk import DataGolfSDK
+from sdk.retry import RetryPolicy
+
+API_KEY = "test-key"
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=b"{}", headers=None):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        self.status_code = status_code
+        self.content = body
+        self.headers = headers or {}
+        self.closed = False
+
+    @property
+    def text(self):
+        return self.content.decode()
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeTransport:
+    """
+    Transport answering from a script: each get() pops the next response (or raises it,
+    if it is an exception); once the script is exhausted, default is returned.
+    """
+
+    def __init__(self, *script, default=None):
+        self.script = list(script)
+        self.default = default
+        self.calls = []
+        self.gate = None
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, stream=False):
+        with self._lock:
+            self.calls.append((url, dict(params or {})))
+            outcome = self.script.pop(0) if self.script else self.default
+        if self.gate is not None:
+            self.gate.wait()
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome or FakeResponse()
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """
+    Record the delays passed to time.sleep instead of sleeping.
+    """
+    delays = []
+    monkeypatch.setattr("time.sleep", delays.append)
+    return delays
+
+
+@pytest.fixture
+def client():
+    def make(transport, **options):
+        options.setdefault("retry", RetryPolicy(jitter=False))
+        options.setdefault("decoder", "json")
+        return DataGolfSDK(API_KEY, transport=transport, **options)
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def stub_server():
+    with StubServer(size=20) as server:
+        yield server
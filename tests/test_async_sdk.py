@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+
+from sdk.async_sdk import AsyncDataGolfSDK
+from tests.conftest import API_KEY, FakeResponse
+
+
+class EchoTransport:
+    """
+    Answers each request with its tour after a short delay, tracking the peak number of
+    requests in flight and the thread that closed it.
+    """
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.closed_by = None
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, stream=False):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return FakeResponse(body={"tour": params["tour"]})
+
+    def close(self):
+        self.closed_by = threading.get_ident()
+
+
+def test_gather_keeps_the_order_of_calls():
+    transport = EchoTransport()
+
+    async def main():
+        async with AsyncDataGolfSDK(API_KEY, transport=transport, decoder="json") as dg:
+            tours = [f"tour{n}" for n in range(12)]
+            return tours, await dg.gather(*(dg.get_field_updates(t) for t in tours))
+
+    tours, results = asyncio.run(main())
+    assert [result["tour"] for result in results] == tours
+
+
+def test_max_concurrency_limits_requests_in_flight():
+    transport = EchoTransport()
+
+    async def main():
+        dg = AsyncDataGolfSDK(
+            API_KEY, max_concurrency=3, transport=transport, decoder="json"
+        )
+        await dg.gather(*(dg.get_field_updates(f"t{n}") for n in range(12)))
+        await dg.aclose()
+
+    asyncio.run(main())
+    assert transport.peak == 3
+
+
+def test_gather_can_return_exceptions():
+    transport = EchoTransport(delay=0)
+
+    async def main():
+        async with AsyncDataGolfSDK(API_KEY, transport=transport, decoder="json") as dg:
+            return await dg.gather(
+                dg.get_field_updates("pga"),
+                # No tour: the transport raises KeyError.
+                dg.make_request("preds/in-play", {"file_format": "json"}),
+                return_exceptions=True,
+            )
+
+    results = asyncio.run(main())
+    assert results[0] == {"tour": "pga"}
+    assert isinstance(results[1], KeyError)
+
+
+def test_aclose_runs_off_the_event_loop():
+    transport = EchoTransport(delay=0.2)
+    ticks = []
+
+    async def tick():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def main():
+        dg = AsyncDataGolfSDK(API_KEY, transport=transport, decoder="json")
+        call = asyncio.ensure_future(dg.get_field_updates("pga"))
+        await asyncio.sleep(0.05)
+        ticker = asyncio.ensure_future(tick())
+        # Closing waits for the running call; the loop keeps ticking meanwhile.
+        await dg.aclose()
+        ticker.cancel()
+        return await call
+
+    assert asyncio.run(main()) == {"tour": "pga"}
+    assert transport.closed_by not in (None, threading.get_ident())
+    assert len(ticks) >= 5
+
+
+def test_only_endpoints_are_wrapped():
+    assert asyncio.iscoroutinefunction(AsyncDataGolfSDK.get_player_list)
+    assert not hasattr(AsyncDataGolfSDK, "get_warm")
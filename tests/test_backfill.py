@@ -0,0 +1,63 @@
+import pytest
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from sdk.backfill import write_parquet  # noqa: E402
+
+
+def test_write_parquet_keeps_fields_missing_from_the_first_row(tmp_path):
+    path = str(tmp_path / "tour=pga" / "part.parquet")
+    write_parquet([{"a": 1}, {"a": 2, "b": 3.0}, {"c": "x"}], path)
+    table = pq.read_table(path)
+    assert table.column_names == ["a", "b", "c"]
+    assert table.to_pylist() == [
+        {"a": 1, "b": None, "c": None},
+        {"a": 2, "b": 3.0, "c": None},
+        {"a": None, "b": None, "c": "x"},
+    ]
+
+
+class FakeClient:
+    def __init__(self, events):
+        self.events = events
+        self.fetched = []
+
+    def get_historical_raw_data_event_ids(self):
+        return self.events
+
+    def get_round_scoring_stats_strokes_gained(self, tour, event_id, year):
+        self.fetched.append((tour, event_id))
+        return {
+            "tour": tour,
+            "year": year,
+            "event_id": event_id,
+            "event_completed": True,
+            "scores": [{"dg_id": 1, "round_1": {"score": 70, "sg_total": 1.5}}],
+        }
+
+
+def event(tour, event_id, day):
+    return {
+        "tour": tour,
+        "event_id": event_id,
+        "calendar_year": 2099,
+        "date": f"2099-01-{day:02d}",
+    }
+
+
+def test_incremental_cut_off_is_kept_per_tour(tmp_path):
+    from sdk.backfill import Backfill
+
+    dg = FakeClient([event("pga", 1, 1), event("pga", 2, 20), event("euro", 3, 10)])
+    Backfill(dg, str(tmp_path), tours=["pga"]).run()
+    assert sorted(dg.fetched) == [("pga", 1), ("pga", 2)]
+
+    dg.fetched.clear()
+    dg.events.append(event("pga", 4, 25))
+    summary = Backfill(dg, str(tmp_path), tours=["euro", "pga"]).sync()
+    # The euro event predates the last pga event but was never fetched.
+    assert sorted(dg.fetched) == [("euro", 3), ("pga", 4)]
+    assert summary["failed"] == {}
+    assert pq.read_table(
+        str(tmp_path / "tour=euro" / "year=2099" / "event_id=3.parquet")
+    ).num_rows == 1
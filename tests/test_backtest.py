@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from sdk.backtest import Backtest, plackett_luce
+
+
+def backtest(open_odds, prob, outcome, fair_close, event):
+    n = len(open_odds)
+    bets = {
+        "event": np.array(event),
+        "event_id": np.array(event),
+        "year": np.full(n, 2023),
+        "book": np.zeros(n, dtype=np.int64),
+        "market": np.zeros(n, dtype=np.int64),
+        "dg_id": np.arange(n),
+        "open": np.array(open_odds, dtype=float),
+        "close": np.array(open_odds, dtype=float),
+        "outcome": np.array(outcome, dtype=float),
+        "push": np.zeros(n, dtype=bool),
+        "prob": np.array(prob, dtype=float),
+        "fair_close": np.array(fair_close, dtype=float),
+    }
+    return Backtest(bets, ["pinnacle"], ["win"])
+
+
+def test_kelly_bankroll_roi_and_drawdown():
+    # Event 0: edge 0.5, Kelly 0.25, wins at 3.0 -> bankroll 1.5.
+    # Event 1: edge 0.2, Kelly 0.2, loses -> bankroll 1.2, a 20% drawdown.
+    bt = backtest([3.0, 2.0], [0.5, 0.6], [1, 0], [0.4, 0.55], [0, 1])
+    result = bt.run([0.0, 0.3], kelly_fractions=[1.0, 0.5])
+    assert result.groups == [("pinnacle", "win")]
+    assert result.bets[0].tolist() == [2, 1]
+    assert result.staked[0] == pytest.approx([0.45, 0.25])
+    assert result.roi[0] == pytest.approx([(0.5 - 0.2) / 0.45, 2.0])
+    assert result.flat_roi[0] == pytest.approx([0.5, 2.0])
+    assert result.clv[0] == pytest.approx([0.15, 0.2])
+    assert result.final_bankroll[0, 0] == pytest.approx([1.2, 1.25 * 0.9])
+    assert result.final_bankroll[0, 1] == pytest.approx([1.5, 1.25])
+    assert result.max_drawdown[0, 0] == pytest.approx([0.2, 0.1])
+    assert result.max_drawdown[0, 1] == pytest.approx([0.0, 0.0])
+
+
+def test_stakes_of_one_event_are_scaled_to_the_bankroll():
+    # Two full-Kelly stakes of 0.8 in one event: scaled to the whole bankroll.
+    bt = backtest([11.0, 11.0], [0.82, 0.82], [0, 0], [0.1, 0.1], [0, 0])
+    result = bt.run([0.0])
+    assert result.final_bankroll[0, 0, 0] == pytest.approx(1e-300, abs=1e-200)
+    assert result.max_drawdown[0, 0, 0] == pytest.approx(1.0)
+
+
+def test_negative_edges_are_never_bet():
+    bt = backtest([2.0], [0.4], [1], [0.5], [0])
+    result = bt.run([-1.0])
+    assert result.groups == []
+
+
+def test_best_picks_the_highest_metric():
+    bt = backtest([3.0, 2.0], [0.5, 0.6], [1, 0], [0.4, 0.55], [0, 1])
+    best = bt.run([0.0, 0.3]).best()
+    assert best[0]["threshold"] == 0.3
+
+
+def test_plackett_luce_shares():
+    probs = plackett_luce(np.array([[0.1, 0.3], [0.2, np.nan]]))
+    assert probs[0] == pytest.approx([0.25, 0.75])
+    assert np.isnan(probs[1]).all()
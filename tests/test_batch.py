@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+from sdk.batch import BULK, LIVE, NORMAL, Batch
+
+
+class Client:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_outright_odds(self, tour="pga", market="win", file_format=None):
+        with self.lock:
+            self.calls.append((tour, market))
+        if market == "bad":
+            raise ValueError("bad market")
+        return (tour, market)
+
+
+def test_identical_calls_run_once():
+    dg = Client()
+    batch = Batch(dg, max_workers=2)
+    first = batch.add("get_outright_odds", "pga", "win")
+    second = batch.add("get_outright_odds", tour="pga")
+    assert first is second
+    assert batch.duplicates == 1
+    results = batch.results()
+    assert dg.calls == [("pga", "win")]
+    assert results[first].result() == ("pga", "win")
+
+
+def test_failures_do_not_stop_the_batch():
+    dg = Client()
+    batch = Batch(dg, max_workers=2)
+    good = batch.add("get_outright_odds", market="top_5")
+    bad = batch.add("get_outright_odds", market="bad")
+    results = batch.results()
+    assert results[good].ok
+    assert isinstance(results[bad].error, ValueError)
+
+
+def test_calls_run_by_priority():
+    dg = Client()
+    batch = Batch(dg, max_workers=1, reserved=0)
+    batch.add("get_outright_odds", market="bulk", priority=BULK)
+    batch.add("get_outright_odds", market="normal", priority=NORMAL)
+    batch.add("get_outright_odds", market="live", priority=LIVE)
+    list(batch.run())
+    assert [market for _, market in dg.calls] == ["live", "normal", "bulk"]
+
+
+def test_duplicate_raises_pending_priority():
+    dg = Client()
+    batch = Batch(dg, max_workers=1, reserved=0)
+    batch.add("get_outright_odds", market="a")
+    item = batch.add("get_outright_odds", market="b", priority=BULK)
+    batch.add("get_outright_odds", market="b", priority=LIVE)
+    assert item.priority == LIVE
+    list(batch.run())
+    assert [market for _, market in dg.calls] == ["b", "a"]
+
+
+def test_a_batch_runs_once():
+    dg = Client()
+    batch = Batch(dg, max_workers=1, reserved=0)
+    for market in ("a", "b", "c"):
+        batch.add("get_outright_odds", market=market)
+    runner = batch.run()
+    next(runner)
+    runner.close()
+    with pytest.raises(RuntimeError):
+        next(batch.run())
+    with pytest.raises(RuntimeError):
+        batch.add("get_outright_odds", market="d")
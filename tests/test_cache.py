@@ -0,0 +1,101 @@
+from datetime import date
+
+import pytest
+
+from sdk.cache import (
+    FOREVER,
+    HOUR,
+    MINUTE,
+    MemoryCache,
+    ResponseCache,
+    cache_key,
+    normalize_params,
+)
+from tests.conftest import FakeResponse, FakeTransport
+
+
+def test_cache_key_ignores_key_order_none_and_api_key():
+    a = cache_key("preds/in-play", {"tour": "pga", "odds_format": "percent", "key": "x"})
+    b = cache_key("preds/in-play", {"odds_format": "percent", "tour": "pga", "x": None})
+    assert a == b == "preds/in-play?odds_format=percent&tour=pga"
+
+
+def test_normalize_params_joins_lists_and_stringifies():
+    assert normalize_params({"year": 2023, "books": ["a", "b"]}) == (
+        ("books", "a,b"),
+        ("year", "2023"),
+    )
+
+
+@pytest.mark.parametrize(
+    "endpoint, params, ttl",
+    [
+        ("historical-raw-data/rounds", {"year": 2017}, FOREVER),
+        ("historical-raw-data/rounds", {"year": date.today().year}, HOUR),
+        ("historical-raw-data/event-list", {}, 6 * HOUR),
+        ("preds/in-play", {}, 5 * MINUTE),
+        ("preds/get-dg-rankings", {}, HOUR),
+        ("get-player-list", {}, 12 * HOUR),
+        ("unknown-endpoint", {}, 5 * MINUTE),
+    ],
+)
+def test_default_ttl_policies(endpoint, params, ttl):
+    assert ResponseCache().ttl(endpoint, params) == ttl
+
+
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("time.time", lambda: now[0])
+    cache = ResponseCache(ttl_policies=[("preds/", 60)])
+    cache.set("preds/in-play", {"tour": "pga"}, "value")
+    assert cache.get("preds/in-play", {"tour": "pga"}) == (True, "value")
+    now[0] += 61
+    assert cache.get("preds/in-play", {"tour": "pga"}) == (False, None)
+
+
+def test_zero_ttl_is_not_cached():
+    cache = ResponseCache(ttl_policies=[("preds/", 0)])
+    cache.set("preds/in-play", {}, "value")
+    assert cache.get("preds/in-play", {}) == (False, None)
+
+
+def test_memory_tier_evicts_least_recently_used():
+    memory = MemoryCache(max_entries=2)
+    memory.set("a", 1, FOREVER)
+    memory.set("b", 2, FOREVER)
+    memory.get("a")
+    memory.set("c", 3, FOREVER)
+    assert memory.get("b") is None
+    assert memory.get("a") is not None and memory.get("c") is not None
+    assert memory.evictions == 1
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    ResponseCache(directory=str(tmp_path)).set("get-player-list", {}, [1, 2])
+    cache = ResponseCache(directory=str(tmp_path))
+    assert cache.get("get-player-list", {}) == (True, [1, 2])
+    assert cache.stats["disk_hits"] == 1
+
+
+def test_disk_tier_errors_are_not_fatal(tmp_path):
+    cache = ResponseCache(directory=str(tmp_path))
+    cache.set("get-player-list", {}, lambda: None)
+    assert cache.get("get-player-list", {})[0]
+
+
+def test_client_serves_repeat_calls_from_the_cache(client):
+    transport = FakeTransport(default=FakeResponse(body={"ok": True}))
+    dg = client(transport, cache=True)
+    assert dg.get_dg_rankings() == dg.get_dg_rankings()
+    assert len(transport.calls) == 1
+    assert dg.cache.stats["hits"] == 1
+
+
+def test_cache_keys_leave_out_the_api_key(client):
+    transport = FakeTransport(default=FakeResponse(body={"ok": True}))
+    cache = ResponseCache()
+    client(transport, cache=cache).get_dg_rankings()
+    other = client(transport, cache=cache)
+    other.api_token = "other-key"
+    other.get_dg_rankings()
+    assert len(transport.calls) == 1
@@ -0,0 +1,79 @@
+import gzip
+import json
+import subprocess
+import sys
+
+from sdk.cli import main
+from tests.conftest import API_KEY
+
+
+def run(stub_server, capsys, *args):
+    code = main([*args, "--api-key", API_KEY, "--base-url", stub_server.base_url])
+    return code, json.loads(capsys.readouterr().out)
+
+
+def test_import_sdk_is_lazy():
+    code = (
+        "import sys, sdk; sdk.__all__; "
+        "print(sorted(m for m in ('requests', 'numpy', 'asyncio', 'sdk.datagolf_sdk') "
+        "if m in sys.modules))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "[]"
+
+
+def test_lazy_attributes_resolve():
+    import sdk
+
+    assert sdk.DataGolfSDK.__module__ == "sdk.datagolf_sdk"
+    assert "RetryPolicy" in dir(sdk)
+
+
+def test_export_with_gzip(stub_server, capsys, tmp_path):
+    path = tmp_path / "players.json.gz"
+    code, summary = run(
+        stub_server, capsys, "get-player-list", "-o", str(path), "--gzip"
+    )
+    assert code == 0 and summary["exports"] == 1 and summary["failed"] == []
+    players = json.loads(gzip.decompress(path.read_bytes()))
+    assert len(players) == 20
+
+
+def test_export_several_endpoints_to_a_directory(stub_server, capsys, tmp_path):
+    code, summary = run(
+        stub_server,
+        capsys,
+        "get-player-list",
+        "preds/get-dg-rankings",
+        "-f",
+        "csv",
+        "-o",
+        f"{tmp_path}/",
+    )
+    assert code == 0 and summary["exports"] == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "get-player-list.csv",
+        "preds_get-dg-rankings.csv",
+    ]
+
+
+def test_sweep(stub_server, capsys, tmp_path):
+    code, summary = run(
+        stub_server,
+        capsys,
+        "historical-raw-data/rounds",
+        "--sweep",
+        "-p",
+        "tour=euro",
+        "--years",
+        "2020",
+        "-o",
+        str(tmp_path),
+        "--gzip",
+    )
+    assert code == 0 and summary["failed"] == []
+    files = sorted((tmp_path / "tour=euro" / "year=2020").iterdir())
+    assert len(files) == summary["exports"] == 20
+    assert files[0].name.endswith(".json.gz")
+    payload = json.loads(gzip.decompress(files[0].read_bytes()))
+    assert payload["scores"]
@@ -0,0 +1,72 @@
+import threading
+import time
+
+import pytest
+
+from sdk.coalesce import SingleFlight
+from sdk.exceptions import AuthenticationError
+from tests.conftest import FakeResponse, FakeTransport
+
+
+def call_concurrently(dg, transport, callers, func):
+    """
+    Run func on callers threads while the transport holds the first fetch, release it once
+    every other caller joined that flight, and return each caller's result or exception.
+    """
+    transport.gate = threading.Event()
+    outcomes = [None] * callers
+
+    def call(index):
+        try:
+            outcomes[index] = func()
+        except Exception as error:
+            outcomes[index] = error
+
+    threads = [threading.Thread(target=call, args=(n,)) for n in range(callers)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while dg.inflight.coalesced < callers - 1 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    transport.gate.set()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_concurrent_identical_calls_are_coalesced(client):
+    transport = FakeTransport(default=FakeResponse(body={"ok": True}))
+    dg = client(transport)
+    results = call_concurrently(dg, transport, 8, dg.get_dg_rankings)
+    assert len(transport.calls) == 1
+    assert dg.inflight.coalesced == 7
+    assert results == [{"ok": True}] * 8
+    assert dg.inflight.in_flight == 0
+
+
+def test_coalesced_callers_share_the_error(client):
+    transport = FakeTransport(default=FakeResponse(401, b"bad key"))
+    dg = client(transport)
+    errors = call_concurrently(dg, transport, 2, dg.get_dg_rankings)
+    assert len(transport.calls) == 1
+    assert dg.inflight.coalesced == 1
+    assert all(isinstance(error, AuthenticationError) for error in errors)
+    assert dg.inflight.in_flight == 0
+
+
+def test_different_calls_are_not_coalesced(client):
+    transport = FakeTransport(default=FakeResponse(body={"ok": True}))
+    dg = client(transport)
+    dg.get_field_updates("pga")
+    dg.get_field_updates("euro")
+    assert len(transport.calls) == 2
+    assert dg.inflight.coalesced == 0
+
+
+def test_single_flight_runs_again_after_a_flight_lands():
+    flight = SingleFlight()
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+    with pytest.raises(KeyError):
+        flight.do("key", lambda: {}["missing"])
+    assert flight.in_flight == 0
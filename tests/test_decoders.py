@@ -0,0 +1,139 @@
+import pickle
+
+import pytest
+
+from sdk.cache import ResponseCache
+from sdk.decoders import get_decoder, is_typed, require_dicts, to_dicts
+from sdk.odds import all_formats, convert_payload
+from tests.conftest import FakeResponse, FakeTransport
+
+ROUNDS = "historical-raw-data/rounds"
+OUTRIGHTS = "historical-odds/outrights"
+ROUNDS_BODY = (
+    b'{"event_name": "x", "year": 2023, "event_id": 14, "unknown": 1, "scores": '
+    b'[{"dg_id": 7, "round_1": {"score": 70, "sg_total": 1.5}}]}'
+)
+ODDS_BODY = b'{"event_name": "x", "odds": [{"dg_id": 1, "close_odds": 2.5}]}'
+
+
+def typed(content, endpoint):
+    pytest.importorskip("msgspec")
+    return get_decoder("msgspec-typed").decode(content, endpoint)
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_plain_decoders_agree(name):
+    try:
+        decoder = get_decoder(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+    assert decoder.decode(ROUNDS_BODY, ROUNDS) == get_decoder("json").decode(
+        memoryview(ROUNDS_BODY)
+    )
+
+
+def test_unknown_decoder_is_rejected():
+    with pytest.raises(ValueError):
+        get_decoder("simdjson")
+
+
+def test_typed_decoder_builds_structs_for_known_endpoints():
+    payload = typed(ROUNDS_BODY, ROUNDS)
+    assert is_typed(payload)
+    assert payload.scores[0].round_1.sg_total == 1.5
+    assert not hasattr(payload, "unknown")
+    assert not is_typed(typed(b'[{"dg_id": 1}]', "preds/get-dg-rankings"))
+
+
+def test_to_dicts_leaves_out_missing_fields():
+    payload = to_dicts(typed(ROUNDS_BODY, ROUNDS))
+    assert payload == {
+        "event_name": "x",
+        "year": 2023,
+        "event_id": 14,
+        "scores": [{"dg_id": 7, "round_1": {"score": 70, "sg_total": 1.5}}],
+    }
+
+
+def test_typed_payloads_pickle_through_the_disk_cache(tmp_path):
+    payload = typed(ROUNDS_BODY, ROUNDS)
+    assert pickle.loads(pickle.dumps(payload)) == payload
+    ResponseCache(directory=str(tmp_path)).set(ROUNDS, {"year": 2017}, payload)
+    hit, value = ResponseCache(directory=str(tmp_path)).get(ROUNDS, {"year": 2017})
+    assert hit and value == payload and is_typed(value)
+
+
+def test_dict_consumers_reject_typed_payloads():
+    from sdk.live import LiveFeed
+    from sdk.payloads import iter_rounds
+    from sdk.snapshot import outright_rows
+
+    odds = typed(ODDS_BODY, OUTRIGHTS)
+    with pytest.raises(TypeError, match="msgspec-typed"):
+        all_formats(odds)
+    with pytest.raises(TypeError, match="msgspec-typed"):
+        convert_payload(odds, "percent")
+    with pytest.raises(TypeError, match="odds_snapshot"):
+        outright_rows("pga", "win", odds)
+    with pytest.raises(TypeError, match="iter_rounds"):
+        list(iter_rounds(typed(ROUNDS_BODY, ROUNDS)))
+
+    class Client:
+        def get_live_model_predictions(self):
+            return odds
+
+    live = LiveFeed(Client(), error_events=True).watch("get_live_model_predictions")
+    (event,) = live.poll()
+    assert isinstance(event.error, TypeError)
+    assert require_dicts({"a": 1}, "x") == {"a": 1}
+
+
+def test_typed_client_rejects_odds_format_all(client):
+    pytest.importorskip("msgspec")
+    transport = FakeTransport(default=FakeResponse(body=ODDS_BODY))
+    dg = client(transport, decoder="msgspec-typed")
+    with pytest.raises(TypeError):
+        dg.make_request(OUTRIGHTS, {"odds_format": "all"})
+
+
+def test_records_path_passes_the_endpoint(client):
+    class Decoder:
+        def __init__(self):
+            self.endpoints = []
+
+        def decode(self, content, endpoint=None):
+            self.endpoints.append(endpoint)
+            return get_decoder("json").decode(content)
+
+    decoder = Decoder()
+    dg = client(FakeTransport(default=FakeResponse(body=ROUNDS_BODY)))
+    dg.decoder = decoder
+    records = dg.make_request(ROUNDS, {"file_format": "records"})
+    assert decoder.endpoints == [ROUNDS]
+    assert [record.sg_total for record in records] == [1.5]
+
+
+def test_records_from_a_typed_client(client):
+    pytest.importorskip("msgspec")
+    transport = FakeTransport(default=FakeResponse(body=ROUNDS_BODY))
+    dg = client(transport, decoder="msgspec-typed")
+    records = dg.make_request(ROUNDS, {"file_format": "records"})
+    assert records[0].as_dict()["score"] == 70
+    assert records[0].dg_id == 7 and records[0].round_num == 1
+
+
+@pytest.mark.parametrize("raw, kind", [(True, bytes), ("memoryview", memoryview)])
+def test_raw_returns_the_undecoded_body(client, raw, kind):
+    transport = FakeTransport(default=FakeResponse(body=ROUNDS_BODY))
+    dg = client(transport, cache=True)
+    body = dg.make_request(ROUNDS, {"file_format": "json"}, raw=raw)
+    assert isinstance(body, kind) and bytes(body) == ROUNDS_BODY
+    # Raw requests bypass the cache.
+    dg.make_request(ROUNDS, {"file_format": "json"}, raw=raw)
+    assert len(transport.calls) == 2 and dg.cache.stats["entries"] == 0
+
+
+def test_raw_cannot_be_combined_with_all_odds_formats(client):
+    dg = client(FakeTransport())
+    with pytest.raises(ValueError):
+        dg.make_request(OUTRIGHTS, {"odds_format": "all"}, raw=True)
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from sdk.dfs import DFSPool
+
+
+def make_pool(n=40, std=5.0, seed=0):
+    rng = np.random.default_rng(seed)
+    salaries = rng.integers(60, 120, n) * 100
+    points = salaries / 100 * 0.6 + rng.normal(0, 5, n)
+    return DFSPool(
+        np.arange(1, n + 1), [f"P{i}" for i in range(n)], salaries, points, np.full(n, std)
+    )
+
+
+def test_lineups_fit_the_cap_and_are_distinct():
+    pool = make_pool()
+    lineups = pool.optimize(50, seed=1)
+    assert len(lineups) == 50
+    assert (lineups.salaries <= pool.cap).all()
+    assert all(len(set(row)) == pool.roster_size for row in lineups.index.tolist())
+    assert len({tuple(sorted(row)) for row in lineups.index.tolist()}) == 50
+    assert (np.diff(lineups.points) <= 1e-9).all()
+
+
+def test_locks_and_excludes():
+    pool = make_pool()
+    lineups = pool.optimize(30, lock=[3, 7], exclude=[1, 2], seed=1)
+    ids = lineups.dg_ids()
+    assert len(lineups) == 30
+    assert (ids == 3).any(axis=1).all() and (ids == 7).any(axis=1).all()
+    assert not np.isin(ids, [1, 2]).any()
+
+
+def test_exposure_limits():
+    pool = make_pool()
+    lineups = pool.optimize(40, max_exposure=0.3, seed=1)
+    assert len(lineups) == 40
+    assert max(lineups.exposure().values()) <= 0.3
+    lineups = pool.optimize(40, max_exposure={5: 0.1}, seed=1)
+    assert lineups.exposure().get(5, 0) <= 0.1
+
+
+def test_exposure_holds_for_fewer_lineups_than_requested():
+    pool = make_pool(n=12)
+    lineups = pool.optimize(30, max_exposure=0.5, seed=1)
+    counts = np.bincount(lineups.index.ravel(), minlength=len(pool))
+    assert 0 < len(lineups) < 30
+    assert counts.max() <= max(1, len(lineups) // 2)
+
+
+def test_lineups_with_no_player_to_swap_in_are_dropped():
+    # Only the excluded player makes a lineup fit, so there are none.
+    pool = DFSPool([1, 2, 3], ["C", "A", "B"], [1, 6, 6], [1, 5, 5], cap=10, roster_size=2)
+    assert len(pool.optimize(5, exclude=[1], seed=1)) == 0
+
+
+def test_too_many_locks_or_excludes():
+    pool = make_pool(n=8)
+    with pytest.raises(ValueError):
+        pool.optimize(5, lock=range(1, 8))
+    with pytest.raises(ValueError):
+        pool.optimize(5, exclude=[1, 2, 3])
+    with pytest.raises(KeyError, match="not in the pool"):
+        pool.optimize(5, lock=[99])
+
+
+def test_simulate_without_variance_is_exact():
+    pool = make_pool(std=0.0)
+    lineups = pool.optimize(5, seed=1)
+    line = lineups.points[2] - 1e-6
+    result = lineups.simulate(1000, cash_lines=[line], workers=1, seed=1, chunk=300)
+    np.testing.assert_allclose(result["mean"], lineups.points)
+    np.testing.assert_allclose(result["std"], 0, atol=1e-3)
+    assert result["top"].tolist() == [1, 0, 0, 0, 0]
+    assert result["cash"][0].tolist() == [1, 1, 1, 0, 0]
+
+
+def test_simulate_is_seeded_and_sums_top_to_one():
+    lineups = make_pool().optimize(10, seed=1)
+    first = lineups.simulate(4000, workers=1, seed=3, chunk=1000)
+    second = lineups.simulate(4000, workers=1, seed=3, chunk=1000)
+    np.testing.assert_array_equal(first["mean"], second["mean"])
+    assert first["top"].sum() == pytest.approx(1)
+    assert (first["p10"] <= first["p50"]).all() and (first["p50"] <= first["p90"]).all()
+    np.testing.assert_allclose(first["mean"], lineups.points, atol=1)
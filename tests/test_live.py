@@ -0,0 +1,118 @@
+from sdk.exceptions import ServerError
+from sdk.live import LiveFeed
+
+
+class Client:
+    def __init__(self, *payloads):
+        self.payloads = list(payloads)
+        self.calls = 0
+
+    def get_live_model_predictions(self, tour="pga"):
+        self.calls += 1
+        payload = self.payloads.pop(0) if len(self.payloads) > 1 else self.payloads[0]
+        if isinstance(payload, Exception):
+            raise payload
+        return payload
+
+
+def payload(updated, *players):
+    return {
+        "info": {"last_update": updated},
+        "data": [
+            {"dg_id": dg_id, "player_name": f"P{dg_id}", "win": win, "thru": thru}
+            for dg_id, win, thru in players
+        ],
+    }
+
+
+def feed(*payloads, **options):
+    dg = Client(*payloads)
+    return dg, LiveFeed(dg, **options).watch("get_live_model_predictions", "pga")
+
+
+def kinds(events):
+    return sorted((event.kind, event.key) for event in events)
+
+
+def test_first_poll_adds_every_record():
+    _, live = feed(payload("t1", (1, 0.2, 3), (2, 0.1, 4)))
+    events = live.poll()
+    assert kinds(events) == [("added", 1), ("added", 2)]
+    assert events[0].name == "P1"
+
+
+def test_added_changed_and_removed():
+    _, live = feed(
+        payload("t1", (1, 0.2, 3), (2, 0.1, 4)),
+        payload("t2", (1, 0.25, 4), (3, 0.05, 0)),
+    )
+    live.poll()
+    events = live.poll()
+    assert kinds(events) == [("added", 3), ("changed", 1), ("removed", 2)]
+    changed = next(event for event in events if event.kind == "changed")
+    assert changed.changes == {"win": (0.2, 0.25), "thru": (3, 4)}
+    assert changed.delta("thru") == 1
+    assert changed.delta("player_name") is None
+    removed = next(event for event in events if event.kind == "removed")
+    assert removed.record["win"] == 0.1
+
+
+def test_moves_within_tolerance_are_ignored():
+    _, live = feed(
+        payload("t1", (1, 0.200, 3)), payload("t2", (1, 0.204, 3)), tolerance=0.01
+    )
+    live.poll()
+    assert live.poll() == []
+
+
+def test_unchanged_marker_skips_the_payload():
+    first = payload("t1", (1, 0.2, 3))
+    _, live = feed(first, payload("t1", (1, 0.9, 3)))
+    live.poll()
+    assert live.poll() == []
+    assert live.unchanged == 1
+
+
+def test_unchanged_digest_skips_the_payload():
+    _, live = feed(payload(None, (1, 0.2, 3)), payload(None, (1, 0.2, 3)))
+    live.poll()
+    assert live.poll() == []
+    assert live.unchanged == 1
+
+
+def test_errors_are_counted_and_optionally_emitted():
+    error = ServerError(500, "down")
+    _, quiet = feed(error, payload("t1", (1, 0.2, 3)))
+    assert quiet.poll() == []
+    assert quiet.errors == 1
+    assert kinds(quiet.poll()) == [("added", 1)]
+
+    _, loud = feed(error, payload("t1", (1, 0.2, 3)), error_events=True)
+    (event,) = loud.poll()
+    assert event.kind == "error" and event.error is error and event.feed == (
+        "get_live_model_predictions"
+    )
+
+
+def test_a_failed_diff_is_retried_on_the_next_poll():
+    dg = Client(payload("t1", (1, 0.2, 3)))
+    failures = [RuntimeError("diff failed")]
+
+    def records(payload):
+        if failures:
+            raise failures.pop()
+        return payload["data"]
+
+    live = LiveFeed(dg).watch("get_live_model_predictions", "pga", records=records)
+    assert live.poll() == []
+    assert live.errors == 1
+    # The same payload (same marker and digest) is diffed again, not skipped.
+    assert kinds(live.poll()) == [("added", 1)]
+    assert live.unchanged == 0
+
+
+def test_events_stops_after_max_polls():
+    dg, live = feed(payload("t1", (1, 0.2, 3)))
+    live.interval = 0
+    assert len(list(live.events(max_polls=3))) == 1
+    assert dg.calls == 3
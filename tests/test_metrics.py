@@ -0,0 +1,89 @@
+import logging
+
+import pytest
+
+from sdk.metrics import Histogram, Metrics
+from sdk.retry import RetryPolicy
+from tests.conftest import FakeResponse, FakeTransport
+
+
+def test_client_records_network_time_bytes_status_and_parse_time(client, no_sleep):
+    transport = FakeTransport(
+        FakeResponse(503, b"busy"), default=FakeResponse(body=b'{"ok": true}')
+    )
+    observed = []
+    dg = client(transport, cache=True)
+    dg.metrics.add_hook(lambda *observation: observed.append(observation[0]))
+    dg.get_dg_rankings()
+    dg.get_dg_rankings()
+
+    metrics = dg.metrics.snapshot()["preds/get-dg-rankings"]
+    assert metrics["requests"] == 2
+    assert metrics["status_codes"] == {503: 1, 200: 1}
+    assert metrics["retries"] == 1
+    assert metrics["cache_hits"] == 1
+    assert metrics["network_time"]["count"] == 2
+    assert metrics["network_time"]["p50"] is not None
+    assert metrics["bytes"]["sum"] == len(b'{"ok": true}')
+    assert metrics["parse_time"]["count"] == 1
+    assert observed == [
+        "status_code",
+        "network_time",
+        "retry",
+        "status_code",
+        "network_time",
+        "bytes",
+        "parse_time",
+        "cache_hit",
+    ]
+
+
+def test_errors_are_counted(client, no_sleep):
+    transport = FakeTransport(default=FakeResponse(500, b"down"))
+    dg = client(transport, retry=RetryPolicy(max_retries=1, jitter=False))
+    with pytest.raises(Exception):
+        dg.get_dg_rankings()
+    metrics = dg.metrics.snapshot()["preds/get-dg-rankings"]
+    assert metrics["errors"] == 1 and metrics["retries"] == 1
+
+
+def test_histogram_percentiles():
+    histogram = Histogram((1, 2, 5, 10))
+    for value in [0.5] * 50 + [1.5] * 40 + [4] * 9 + [30]:
+        histogram.observe(value)
+    snapshot = histogram.snapshot()
+    assert (snapshot["p50"], snapshot["p90"], snapshot["p99"]) == (1, 2, 5)
+    assert histogram.quantile(1.0) == 30
+    assert snapshot["min"] == 0.5 and snapshot["max"] == 30
+    assert snapshot["buckets"][float("inf")] == 1
+    assert Histogram((1,)).quantile(0.5) is None
+
+
+def test_failing_hooks_never_reach_the_request(client, caplog):
+    transport = FakeTransport(default=FakeResponse(body={"ok": True}))
+    dg = client(transport, metrics=Metrics())
+    dg.metrics.add_hook(lambda *observation: 1 / 0)
+    with caplog.at_level(logging.ERROR, logger="sdk.metrics"):
+        assert dg.get_dg_rankings() == {"ok": True}
+    assert "Metrics hook" in caplog.text
+
+
+def test_debug_log_is_only_built_when_enabled(client, monkeypatch, caplog):
+    calls = []
+    import sdk.datagolf_sdk as module
+
+    def counting_cache_key(endpoint, params):
+        calls.append(endpoint)
+        return f"{endpoint}?"
+
+    monkeypatch.setattr(module, "cache_key", counting_cache_key)
+    transport = FakeTransport(default=FakeResponse(body={"ok": True}))
+    dg = client(transport)
+    dg.get_player_list()
+    # Only the coalescing key is built while DEBUG is off.
+    assert len(calls) == 1
+    before = len(calls)
+    with caplog.at_level(logging.DEBUG, logger="sdk.datagolf_sdk"):
+        dg.get_dg_rankings()
+    assert len(calls) == before + 2
+    assert "GET preds/get-dg-rankings?" in caplog.text
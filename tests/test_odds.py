@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+from sdk.odds import (
+    ODDS_FORMATS,
+    all_formats,
+    convert,
+    convert_payload,
+    fair_probabilities,
+    from_decimal,
+    market_total,
+    overround,
+    remove_vig,
+    to_decimal,
+)
+
+DECIMAL = np.array([1.5, 1.909090909, 2.0, 5.5, 101.0])
+
+
+@pytest.mark.parametrize("odds_format", ["percent", "american", "decimal"])
+def test_numeric_formats_round_trip(odds_format):
+    back = to_decimal(from_decimal(DECIMAL, odds_format), odds_format)
+    np.testing.assert_allclose(back, DECIMAL)
+
+
+def test_fraction_round_trip():
+    fractions = from_decimal([5.5, 1.5, 2.0], "fraction")
+    assert fractions.tolist() == ["9/2", "1/2", "1/1"]
+    np.testing.assert_allclose(to_decimal(fractions, "fraction"), [5.5, 1.5, 2.0])
+
+
+def test_american_strings():
+    np.testing.assert_allclose(
+        to_decimal(["+450", "-110", "+100"], "american"), [5.5, 1 + 100 / 110, 2.0]
+    )
+    np.testing.assert_allclose(convert(["+450"], "american", "percent"), [1 / 5.5])
+
+
+def test_invalid_values_become_nan():
+    decimal = to_decimal(["n/a", None, 0.9, "x/0"], "decimal")
+    assert np.isnan(decimal).all()
+    assert from_decimal([None], "fraction").tolist() == [None]
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        to_decimal([2.0], "moneyline")
+
+
+def test_remove_vig_normalizes_to_the_market_total():
+    implied = np.array([0.55, 0.52])
+    assert overround(implied) == pytest.approx(0.07)
+    for method in ("multiplicative", "power"):
+        fair = remove_vig(implied, method=method)
+        assert fair.sum() == pytest.approx(1.0)
+    top_5 = remove_vig(np.full(10, 0.55), total=5)
+    np.testing.assert_allclose(top_5, 0.5)
+
+
+def test_power_method_takes_more_margin_off_longshots():
+    implied = np.array([0.6, 0.3, 0.15])
+    multiplicative = remove_vig(implied)
+    power = remove_vig(implied, method="power")
+    assert power[0] > multiplicative[0]
+    assert power[2] < multiplicative[2]
+
+
+def test_remove_vig_per_row():
+    fair = remove_vig(np.array([[0.55, 0.52], [0.6, 0.6]]))
+    np.testing.assert_allclose(fair.sum(axis=1), [1, 1])
+
+
+def test_market_totals():
+    assert market_total("win") == 1
+    assert market_total("top_30") == 30
+    assert market_total("make_cut") is None
+
+
+def test_fair_probabilities_requires_a_total_for_make_cut():
+    payload = {"market": "make_cut", "odds": [{"dg_id": 1, "pinnacle": 1.5}]}
+    with pytest.raises(ValueError):
+        fair_probabilities(payload)
+    assert fair_probabilities(payload, total=1)["pinnacle"] == pytest.approx([1.0])
+
+
+def test_fair_probabilities_per_book():
+    payload = {
+        "market": "win",
+        "books_offering": ["pinnacle", "bet365"],
+        "odds": [
+            {"dg_id": 1, "pinnacle": "+100", "bet365": "-110"},
+            {"dg_id": 2, "pinnacle": "+100", "bet365": "n/a"},
+        ],
+    }
+    fair = fair_probabilities(payload)
+    assert fair["dg_id"].tolist() == [1, 2]
+    np.testing.assert_allclose(fair["pinnacle"], [0.5, 0.5])
+    assert fair["bet365"][0] == pytest.approx(1.0)
+    assert np.isnan(fair["bet365"][1])
+
+
+def test_convert_payload_converts_only_odds_fields():
+    payload = {
+        "market": "win",
+        "books_offering": ["pinnacle"],
+        "odds": [
+            {
+                "dg_id": 12,
+                "player_name": "A",
+                "pinnacle": 5.5,
+                "datagolf": {"baseline": 2.0},
+            }
+        ],
+    }
+    american = convert_payload(payload, "american")
+    record = american["odds"][0]
+    assert record["dg_id"] == 12 and record["player_name"] == "A"
+    assert record["pinnacle"] == "+450"
+    assert record["datagolf"]["baseline"] == "+100"
+    assert payload["odds"][0]["pinnacle"] == 5.5
+
+
+def test_all_formats_shares_the_fetched_payload():
+    payload = {"odds": [{"pinnacle": 2.5}]}
+    formats = all_formats(payload)
+    assert set(formats) == set(ODDS_FORMATS)
+    assert formats["decimal"] is payload
+    assert formats["percent"]["odds"][0]["pinnacle"] == 0.4
+    assert formats["fraction"]["odds"][0]["pinnacle"] == "3/2"
+
+
+def test_percent_strings_are_probabilities():
+    decimal = to_decimal(["45%", 0.45, "0.45"], "percent")
+    np.testing.assert_allclose(decimal, [1 / 0.45] * 3)
+    np.testing.assert_allclose(convert(["50 %"], "percent", "american"), [100.0])
+
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from sdk.players import PlayerStore, normalize_name
+
+
+class Client:
+    def __init__(self):
+        self.calls = []
+
+    def get_player_list(self, file_format=None):
+        self.calls.append("players")
+        return [
+            {"dg_id": 1, "player_name": "Åberg, Ludvig", "country": "SWE"},
+            {"dg_id": 2, "player_name": "Scheffler, Scottie", "country": "USA"},
+            {"dg_id": 3, "player_name": "McIlroy, Rory", "country": "NIR"},
+        ]
+
+    def get_dg_rankings(self, file_format=None):
+        self.calls.append("rankings")
+        return {
+            "rankings": [
+                {"dg_id": 2, "datagolf_rank": 1, "player_name": "Scheffler, S."},
+                {"dg_id": 3, "datagolf_rank": 2},
+                {"dg_id": 4, "datagolf_rank": 9, "player_name": "New, Player"},
+            ]
+        }
+
+    def get_player_skill_ratings(self, display, file_format=None):
+        self.calls.append("skills")
+        return {
+            "players": [
+                {"dg_id": 1, "sg_app": 0.6},
+                {"dg_id": 2, "sg_app": 1.4},
+                {"dg_id": 3, "sg_app": 0.9},
+                {"dg_id": 4, "sg_app": None},
+            ]
+        }
+
+
+@pytest.fixture
+def store():
+    return PlayerStore(Client(), sources=["players", "rankings", "skills"]).load()
+
+
+def test_sources_are_joined_on_dg_id(store):
+    assert len(store) == 4
+    assert store[2] == {
+        "dg_id": 2,
+        "player_name": "Scheffler, Scottie",
+        "country": "USA",
+        "datagolf_rank": 1.0,
+        "sg_app": 1.4,
+    }
+    # Players missing from a source get NaN or None.
+    assert store[1]["datagolf_rank"] is None
+    assert store[4]["country"] is None and store[4]["player_name"] == "New, Player"
+    assert store.source("player_name") == "players"
+    ranks = store.column("datagolf_rank")
+    assert ranks.dtype == np.float64 and np.isnan(ranks[store.row(1)])
+
+
+@pytest.mark.parametrize(
+    "name", ["Åberg, Ludvig", "Ludvig Aberg", "ludvig  åberg", "ABERG, LUDVIG"]
+)
+def test_name_lookup_in_either_form(store, name):
+    assert store.row(name) == store.row(1)
+    assert name in store
+
+
+def test_unknown_players(store):
+    assert "Tiger Woods" not in store
+    assert store.get(99) is None
+    with pytest.raises(KeyError):
+        store["Tiger Woods"]
+    assert normalize_name("McIlroy, Rory") == "rory mcilroy"
+
+
+def test_top(store):
+    assert [p["dg_id"] for p in store.top("sg_app", 2)] == [2, 3]
+    among = ["Ludvig Aberg", {"dg_id": 3}, "Unknown Player"]
+    assert [p["dg_id"] for p in store.top("sg_app", 5, among=among)] == [3, 1]
+    best = store.top("datagolf_rank", 2, ascending=True)
+    assert [p["dg_id"] for p in best] == [2, 3]
+
+
+def test_refresh_only_fetches_stale_sources(store):
+    dg = store.dg
+    dg.calls.clear()
+    assert store.refresh() == []
+    store.ttls["rankings"] = 0
+    assert store.refresh() == ["rankings"]
+    assert dg.calls == ["rankings"]
+    assert sorted(store.refresh(force=True)) == ["players", "rankings", "skills"]
@@ -0,0 +1,73 @@
+import threading
+
+import pytest
+
+from sdk.ratelimit import FileTokenBucket, TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    A fake clock advanced by time.sleep.
+    """
+    now = [1000.0]
+    monkeypatch.setattr("time.time", lambda: now[0])
+    monkeypatch.setattr("time.monotonic", lambda: now[0])
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    monkeypatch.setattr("time.sleep", sleep)
+    return now
+
+
+@pytest.mark.parametrize("bucket_type", ["memory", "file"])
+def test_requests_are_spaced_at_the_rate(clock, tmp_path, bucket_type):
+    if bucket_type == "file":
+        bucket = FileTokenBucket(str(tmp_path / "bucket.json"), 60, burst=2)
+    else:
+        bucket = TokenBucket(60, burst=2)
+    waits = [bucket.acquire() for _ in range(5)]
+    assert waits == pytest.approx([0, 0, 1, 1, 1])
+    clock[0] += 10
+    assert bucket.acquire() == 0
+
+
+def test_file_buckets_share_one_budget(clock, tmp_path):
+    path = str(tmp_path / "bucket.json")
+    first = FileTokenBucket(path, 60)
+    second = FileTokenBucket(path, 60)
+    assert first.acquire() == 0
+    assert second.acquire() == pytest.approx(1)
+
+
+def test_pause_holds_back_every_caller(clock):
+    bucket = TokenBucket(60, burst=5)
+    bucket.pause(30)
+    assert bucket.acquire() == pytest.approx(31)
+
+
+def test_waiting_threads_reserve_distinct_slots():
+    bucket = TokenBucket(6000, burst=1)
+    waits = []
+    lock = threading.Lock()
+
+    def acquire():
+        wait = bucket.acquire()
+        with lock:
+            waits.append(wait)
+
+    threads = [threading.Thread(target=acquire) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # One token every 10ms: the reservations are spread, never two for the same slot.
+    assert sorted(round(wait, 2) for wait in waits)[-1] >= 0.03
+
+
+def test_wall_clock_jumps_do_not_affect_the_bucket(clock, monkeypatch):
+    bucket = TokenBucket(60, burst=1)
+    bucket.acquire()
+    monkeypatch.setattr("time.time", lambda: 0.0)
+    assert bucket.acquire() == pytest.approx(1)
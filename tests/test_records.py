@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+from sdk.records import to_records
+
+
+def test_records_do_not_import_backfill():
+    code = "import sys, sdk.records; print('sdk.backfill' in sys.modules)"
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "False"
+
+
+def test_round_records():
+    payload = {
+        "tour": "pga",
+        "year": 2023,
+        "event_id": 14,
+        "scores": [
+            {
+                "dg_id": 7,
+                "fin_text": "T3",
+                "round_2": {"score": 68, "sg_total": 2.5},
+                "round_1": {"score": 71, "sg_total": None},
+            }
+        ],
+    }
+    records = to_records("historical-raw-data/rounds", payload)
+    assert [record.round_num for record in records] == [1, 2]
+    assert records[1].as_dict()["sg_total"] == 2.5
+    assert records[0].sg_total is None
+    assert records[0].dg_id == 7 and records[0].fin_text == "T3"
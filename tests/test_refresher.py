@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+
+from sdk.refresher import Refresher
+
+
+class Client:
+    cache = None
+
+    def __init__(self):
+        self.calls = []
+        self.called = threading.Event()
+
+    def get_field_updates(self, tour="pga"):
+        self.calls.append(tour)
+        self.called.set()
+        return {"tour": tour, "n": len(self.calls)}
+
+
+class Gated(Client):
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+
+    def get_field_updates(self, tour="pga"):
+        self.called.set()
+        self.gate.wait(5)
+        return super().get_field_updates(tour)
+
+
+@pytest.fixture
+def refresher():
+    refresher = Refresher(Client(), max_entries=2)
+    yield refresher
+    refresher.close()
+
+
+def test_get_serves_the_warm_value(refresher):
+    warm = refresher.get("get_field_updates", "euro", timeout=5)
+    assert warm.value == {"tour": "euro", "n": 1}
+    assert warm.error is None and not warm.stale
+    assert refresher.get("get_field_updates", tour="euro").value["n"] == 1
+
+
+def test_unregister_stops_refreshing(refresher):
+    refresher.register("get_field_updates", "pga", interval=0.01)
+    assert refresher.dg.called.wait(5)
+    assert refresher.unregister("get_field_updates", tour="pga")
+    assert not refresher.unregister("get_field_updates", "pga")
+    assert refresher.entries == {}
+    calls = len(refresher.dg.calls)
+    threading.Event().wait(0.1)
+    assert len(refresher.dg.calls) <= calls + 1
+
+
+def test_registrations_are_capped(refresher):
+    refresher.register("get_field_updates", "pga")
+    refresher.register("get_field_updates", "euro")
+    refresher.register("get_field_updates", "pga", interval=60)
+    with pytest.raises(RuntimeError, match="unregister"):
+        refresher.register("get_field_updates", "kft")
+    with pytest.raises(RuntimeError, match="unregister"):
+        refresher.get("get_field_updates", "kft", timeout=5)
+    assert len(refresher.entries) == 2
+    refresher.unregister("get_field_updates", "euro")
+    refresher.register("get_field_updates", "kft")
+
+
+def test_unregister_wakes_a_pending_get():
+    refresher = Refresher(Gated())
+    errors = []
+
+    def get():
+        try:
+            refresher.get("get_field_updates", "pga", timeout=5)
+        except RuntimeError as error:
+            errors.append(error)
+
+    thread = threading.Thread(target=get)
+    thread.start()
+    assert refresher.dg.called.wait(5)
+    assert refresher.unregister("get_field_updates", "pga")
+    thread.join(5)
+    assert not thread.is_alive()
+    assert "unregistered" in str(errors[0])
+    refresher.dg.gate.set()
+    refresher.close()
+
+
+def test_client_cool(client):
+    from tests.conftest import FakeResponse, FakeTransport
+
+    dg = client(FakeTransport(default=FakeResponse(body={"ok": True})))
+    assert not dg.cool("get_field_updates", "pga")
+    assert dg.get_warm("get_field_updates", "pga", timeout=5).value == {"ok": True}
+    assert dg.cool("get_field_updates", "pga")
+    assert dg.refresher.entries == {}
+    dg.close()
+
+
+def test_refreshes_share_the_client_but_not_its_cache(client):
+    from tests.conftest import FakeResponse, FakeTransport
+
+    dg = client(FakeTransport(default=FakeResponse(body={"ok": True})), cache=True)
+    copy = dg.refresher.dg
+    assert copy is not dg and copy.cache is None
+    for name in ("transport", "rate_limiter", "retry", "decoder", "metrics", "inflight"):
+        assert getattr(copy, name) is getattr(dg, name)
+    assert dg.get_warm("get_field_updates", "pga", timeout=5).value == {"ok": True}
+    assert len(dg.cache.memory) == 0
+    assert dg.metrics.snapshot()["field-updates"]["requests"] == 1
+    dg.close()
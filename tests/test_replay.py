@@ -0,0 +1,57 @@
+import pytest
+
+from sdk.replay import RecordingTransport, ReplayMissError, ReplayTransport
+from sdk.retry import RetryPolicy
+from tests.conftest import API_KEY, FakeResponse, FakeTransport
+
+
+def record(path, client, *responses):
+    transport = FakeTransport(*responses)
+    with RecordingTransport(str(path), transport) as recorder:
+        dg = client(recorder)
+        results = [
+            dg.get_field_updates("pga"),
+            dg.get_field_updates("euro"),
+        ]
+    return transport, results
+
+
+def test_record_then_replay(tmp_path, client):
+    _, recorded = record(
+        tmp_path,
+        client,
+        FakeResponse(body={"tour": "pga"}),
+        FakeResponse(body={"tour": "euro"}),
+    )
+    with ReplayTransport(str(tmp_path)) as replay:
+        dg = client(replay)
+        assert dg.get_field_updates("euro") == recorded[1]
+        assert dg.get_field_updates("pga") == recorded[0]
+        assert "field-updates?file_format=json&tour=pga" in replay
+
+
+def test_the_api_key_never_reaches_the_archive(tmp_path, client):
+    record(tmp_path, client, FakeResponse(body={}), FakeResponse(body={}))
+    for name in ("index.jsonl", "responses.bin"):
+        assert API_KEY.encode() not in (tmp_path / name).read_bytes()
+
+
+def test_failed_responses_are_not_recorded(tmp_path, client, no_sleep):
+    transport = FakeTransport(FakeResponse(503, b"busy"), FakeResponse(body={}))
+    with RecordingTransport(str(tmp_path), transport) as recorder:
+        client(recorder, retry=RetryPolicy(jitter=False)).get_dg_rankings()
+    assert len((tmp_path / "index.jsonl").read_text().splitlines()) == 1
+
+
+def test_latest_recording_wins(tmp_path, client):
+    record(tmp_path, client, FakeResponse(body={"v": 1}), FakeResponse(body={}))
+    record(tmp_path, client, FakeResponse(body={"v": 2}), FakeResponse(body={}))
+    with ReplayTransport(str(tmp_path)) as replay:
+        assert client(replay).get_field_updates("pga") == {"v": 2}
+
+
+def test_a_miss_raises(tmp_path, client):
+    record(tmp_path, client, FakeResponse(body={}), FakeResponse(body={}))
+    with ReplayTransport(str(tmp_path)) as replay:
+        with pytest.raises(ReplayMissError):
+            client(replay).get_field_updates("kft")
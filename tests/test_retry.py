@@ -0,0 +1,110 @@
+import pytest
+
+from sdk.exceptions import (
+    AuthenticationError,
+    RateLimitError,
+    ServerError,
+    TransportError,
+)
+from sdk.retry import RetryPolicy, parse_retry_after
+from tests.conftest import FakeResponse, FakeTransport
+
+
+def test_retries_transient_status_then_succeeds(client, no_sleep):
+    transport = FakeTransport(
+        FakeResponse(503, b"busy"),
+        FakeResponse(502, b"busy"),
+        FakeResponse(body={"ok": True}),
+    )
+    dg = client(transport, retry=RetryPolicy(backoff_factor=1, jitter=False))
+    assert dg.get_dg_rankings() == {"ok": True}
+    assert len(transport.calls) == 3
+    assert no_sleep == [1, 2]
+
+
+def test_gives_up_after_max_retries(client, no_sleep):
+    transport = FakeTransport(default=FakeResponse(500, b"down"))
+    dg = client(transport, retry=RetryPolicy(max_retries=2, jitter=False))
+    with pytest.raises(ServerError) as info:
+        dg.get_dg_rankings()
+    assert info.value.status_code == 500
+    assert len(transport.calls) == 3
+
+
+def test_client_errors_are_not_retried(client, no_sleep):
+    transport = FakeTransport(default=FakeResponse(403, b"forbidden"))
+    dg = client(transport)
+    with pytest.raises(AuthenticationError):
+        dg.get_dg_rankings()
+    assert len(transport.calls) == 1
+    assert no_sleep == []
+
+
+def test_retry_after_is_honored(client, no_sleep):
+    transport = FakeTransport(
+        FakeResponse(429, b"slow down", {"Retry-After": "7"}),
+        FakeResponse(body={"ok": True}),
+    )
+    dg = client(transport)
+    assert dg.get_dg_rankings() == {"ok": True}
+    assert no_sleep == [7.0]
+
+
+def test_rate_limit_error_carries_retry_after(client, no_sleep):
+    transport = FakeTransport(
+        default=FakeResponse(429, b"slow down", {"Retry-After": "3"})
+    )
+    dg = client(transport, retry=RetryPolicy(max_retries=0))
+    with pytest.raises(RateLimitError) as info:
+        dg.get_dg_rankings()
+    assert info.value.retry_after == 3.0
+
+
+def test_transport_errors_are_retried(client, no_sleep):
+    transport = FakeTransport(
+        TransportError("connection reset"), FakeResponse(body={"ok": True})
+    )
+    dg = client(transport)
+    assert dg.get_dg_rankings() == {"ok": True}
+    assert len(transport.calls) == 2
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_retry_delay_backs_off_exponentially():
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+    assert [policy.delay(attempt) for attempt in range(4)] == [0.5, 1, 2, 3]
+    assert policy.delay(0, retry_after=10) == 10
+
+
+
+def test_permanent_transport_errors_are_not_retried(client, no_sleep):
+    transport = FakeTransport(TransportError("Invalid URL", transient=False))
+    dg = client(transport)
+    with pytest.raises(TransportError):
+        dg.get_dg_rankings()
+    assert len(transport.calls) == 1
+    assert no_sleep == []
+
+
+@pytest.mark.parametrize(
+    "url, transient",
+    [
+        ("http://127.0.0.1:1/closed-port", True),
+        ("not a url", False),
+        ("http://", False),
+    ],
+)
+def test_http_transport_tags_transient_errors(url, transient):
+    from sdk.transport import HTTPTransport
+
+    with HTTPTransport(timeout=2) as transport:
+        with pytest.raises(TransportError) as info:
+            transport.get(url)
+    assert info.value.transient is transient
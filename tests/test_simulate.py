@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from sdk.simulate import TournamentSimulator
+
+
+def field(skills, sd=2.8, cut=65):
+    n = len(skills)
+    return TournamentSimulator(
+        np.arange(1, n + 1), [f"P{i}" for i in range(n)], skills, sd, cut
+    )
+
+
+def test_top_n_probabilities_sum_to_n():
+    sim = field(np.linspace(2, -2, 120))
+    result = sim.simulate(4000, positions=(1, 5, 10, 20), workers=1, seed=1, chunk=1000)
+    np.testing.assert_allclose(result.finish.sum(axis=0), [1, 5, 10, 20])
+    np.testing.assert_allclose(result.places.sum(axis=0), 1)
+    # Counting ties in full can only add.
+    full = sim.simulate(4000, positions=(5, 10), dead_heat=False, workers=1, seed=1)
+    assert (full.finish.sum(axis=0) >= [5, 10]).all()
+
+
+def test_cut_keeps_the_top_65_and_ties():
+    # Whole-stroke skills without noise: players 63 to 69 tie for 64th.
+    skills = -np.arange(100, dtype=float)
+    skills[63:70] = -63
+    result = field(skills, sd=0).simulate(10, workers=1, seed=1)
+    assert result.make_cut.tolist() == [1.0] * 70 + [0.0] * 30
+    assert field(skills, sd=0, cut=0).simulate(10, workers=1).make_cut.min() == 1
+
+
+def test_ties_split_under_dead_heat_rules():
+    # Players 0 and 1 tie for the win, players 5 and 6 for 6th.
+    skills = np.array([10, 10, 8, 7, 6, 5, 5, 4, 3, 2], dtype=float)
+    sim = field(skills, sd=0, cut=0)
+    result = sim.simulate(10, positions=(1, 5, 6), workers=1, seed=1)
+    assert result.finish[:2, 0].tolist() == [0.5, 0.5]
+    assert result.finish[5:7, 1].tolist() == [0.0, 0.0]
+    assert result.finish[5:7, 2].tolist() == [0.5, 0.5]
+    full = sim.simulate(10, positions=(1, 6), dead_heat=False, workers=1)
+    # A tie for the win still goes to a playoff.
+    assert full.finish[:2, 0].tolist() == [0.5, 0.5]
+    assert full.finish[5:7, 1].tolist() == [1.0, 1.0]
+
+
+def test_group_probabilities_sum_to_one():
+    sim = field(np.linspace(1, -1, 80))
+    groups = [(1, 2), (3, 40, 80)]
+    result = sim.simulate(3000, groups=groups, workers=1, seed=2, chunk=1000)
+    for g, group in enumerate(groups):
+        win = result.group_win[g, : len(group)]
+        assert win.sum() == pytest.approx(1)
+        outright = result.group_outright[g, : len(group)].sum()
+        # Every simulation has one outright winner or a tie, counted once per tied player.
+        assert outright <= 1 <= outright + result.group_tie[g, : len(group)].sum()
+    assert result.group_win[1, 0] > result.group_win[1, 2]
+    with pytest.raises(KeyError, match="not in the field"):
+        sim.simulate(10, groups=[(1, 999)], workers=1)
+
+
+def predictions(sim, sd):
+    sim.sd = sd
+    result = sim.simulate(20000, positions=(1, 5, 10, 20), workers=1, seed=9)
+    rows = [
+        dict(zip(("win", "top_5", "top_10", "top_20"), finish), dg_id=dg_id, make_cut=cut)
+        for dg_id, finish, cut in zip(
+            sim.dg_ids.tolist(), result.finish.tolist(), result.make_cut.tolist()
+        )
+    ]
+    return {"baseline_history_fit": rows}
+
+
+@pytest.mark.parametrize("start, target", [(2.0, 3.6), (4.0, 2.2)])
+def test_calibrate_moves_the_spread_towards_the_model(start, target):
+    sim = field(np.linspace(2.5, -2.5, 90))
+    payload = predictions(sim, target)
+    sim.sd = start
+    fitted = sim.calibrate(payload, sims=4000)
+    assert fitted == sim.sd
+    assert fitted == pytest.approx(target, abs=0.3)
+
+
+def test_calibrate_needs_a_matching_field():
+    sim = field(np.zeros(10))
+    with pytest.raises(ValueError, match="no player"):
+        sim.calibrate({"baseline_history_fit": [{"dg_id": 999, "win": 0.1}]})
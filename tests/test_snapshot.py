@@ -0,0 +1,87 @@
+import pytest
+
+from sdk.exceptions import ClientError
+from sdk.snapshot import outright_rows
+from tests.conftest import FakeResponse
+
+OUTRIGHTS = {
+    "event_name": "The Masters",
+    "last_updated": "2024-04-10 12:00:00 UTC",
+    "market": "win",
+    "books_offering": ["pinnacle", "newbook"],
+    "odds": [
+        {
+            "dg_id": 1,
+            "player_name": "Scheffler, Scottie",
+            "pinnacle": 4.5,
+            "newbook": 4.8,
+            "datagolf": {"baseline": 4.2, "baseline_history_fit": 4.0},
+        },
+    ],
+}
+MATCHUPS = {
+    "event_name": "The Masters",
+    "last_updated": "2024-04-10 12:00:00 UTC",
+    "match_list": [
+        {
+            "p1_dg_id": 1,
+            "p1_player_name": "Scheffler, Scottie",
+            "p2_dg_id": 2,
+            "p2_player_name": "McIlroy, Rory",
+            "odds": {"pinnacle": {"p1": 1.6, "p2": 2.4}},
+        }
+    ],
+}
+
+
+class SnapshotTransport:
+    """
+    Answers outrights and tournament matchups; other markets are not offered.
+    """
+
+    def get(self, url, params=None, stream=False):
+        if url.endswith("outrights"):
+            return FakeResponse(body=OUTRIGHTS)
+        if url.endswith("matchups") and params["market"] == "tournament_matchups":
+            return FakeResponse(body=MATCHUPS)
+        return FakeResponse(400, b"market not offered")
+
+    def close(self):
+        pass
+
+
+def test_snapshot_merges_feeds_and_reports_failures(client):
+    dg = client(SnapshotTransport())
+    errors = {}
+    rows = dg.get_odds_snapshot(
+        tours=["pga"], markets=["win", "tournament_matchups", "3_balls"], errors=errors
+    )
+    keys = {(r["market"], r["dg_id"], r["book"], r["opponents"]) for r in rows}
+    assert keys == {
+        ("win", 1, "pinnacle", None),
+        ("win", 1, "newbook", None),
+        ("win", 1, "datagolf_baseline", None),
+        ("win", 1, "datagolf_baseline_history_fit", None),
+        ("tournament_matchups", 1, "pinnacle", (2,)),
+        ("tournament_matchups", 2, "pinnacle", (1,)),
+    }
+    assert all(row["event_name"] == "The Masters" for row in rows)
+    assert all(row["last_updated"] == OUTRIGHTS["last_updated"] for row in rows)
+    assert list(errors) == [("pga", "3_balls")]
+    assert isinstance(errors["pga", "3_balls"], ClientError)
+
+
+def test_unknown_books_offered_are_kept():
+    books = {row["book"]: row["odds"] for row in outright_rows("pga", "win", OUTRIGHTS)}
+    assert books["newbook"] == 4.8
+
+
+def test_known_books_are_used_without_books_offering():
+    payload = dict(OUTRIGHTS, books_offering=None)
+    books = {row["book"] for row in outright_rows("pga", "win", payload)}
+    assert books == {"pinnacle", "datagolf_baseline", "datagolf_baseline_history_fit"}
+
+
+def test_unknown_market_is_rejected(client):
+    with pytest.raises(ValueError):
+        client(SnapshotTransport()).get_odds_snapshot(markets=["eagle"])
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from sdk.streaming import iter_csv_records, iter_json_records
+from tests.conftest import API_KEY, FakeResponse, FakeTransport
+
+
+def chunked(text, size):
+    data = text.encode("utf-8")
+    return [data[start : start + size] for start in range(0, len(data), size)]
+
+
+PAYLOAD = {
+    "event_name": "The Open – Royal Troon",
+    "year": 2024,
+    "scores": [
+        {"dg_id": n, "player_name": f"Player {n} ü", "round_1": {"sg_total": n / 3}}
+        for n in range(25)
+    ],
+    "tail": [1, 2],
+}
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 1 << 16])
+def test_json_records_match_a_full_parse_at_any_chunk_size(size):
+    records = list(iter_json_records(chunked(json.dumps(PAYLOAD), size), "scores"))
+    assert records == PAYLOAD["scores"]
+
+
+def test_numbers_split_across_chunks():
+    text = json.dumps({"odds": [12345.678, 9, -1e10]})
+    assert list(iter_json_records(chunked(text, 3), "odds")) == [12345.678, 9, -1e10]
+
+
+def test_without_record_key_every_top_level_array_is_yielded():
+    records = list(iter_json_records(chunked(json.dumps(PAYLOAD), 5)))
+    assert records == PAYLOAD["scores"] + PAYLOAD["tail"]
+
+
+def test_top_level_array_and_empty_arrays():
+    assert list(iter_json_records([b"[1, ", b"2]"])) == [1, 2]
+    assert list(iter_json_records([b"[ ]"])) == []
+    assert list(iter_json_records([b'{"odds": []}'], "odds")) == []
+
+
+def test_malformed_stream_raises():
+    with pytest.raises(ValueError):
+        list(iter_json_records([b'{"odds": [1 2]}'], "odds"))
+    with pytest.raises(ValueError):
+        list(iter_json_records([b'"text"']))
+
+
+def test_csv_records_across_chunks():
+    text = 'dg_id,player_name\n1,"Smith, J"\n2,Ünal\n'
+    assert list(iter_csv_records(chunked(text, 4))) == [
+        {"dg_id": "1", "player_name": "Smith, J"},
+        {"dg_id": "2", "player_name": "Ünal"},
+    ]
+
+
+def test_stream_request_yields_records_and_closes_the_response(client):
+    response = FakeResponse(body=PAYLOAD)
+    dg = client(FakeTransport(response))
+    records = list(dg.stream_request("historical-raw-data/rounds"))
+    assert records == PAYLOAD["scores"]
+    assert response.closed
+
+
+def test_stream_request_rejects_unstreamable_formats(client):
+    dg = client(FakeTransport())
+    with pytest.raises(ValueError):
+        dg.stream_request("historical-raw-data/rounds", {"file_format": "pandas"})
+
+
+def test_make_request_defaults_to_json(client):
+    transport = FakeTransport(default=FakeResponse(body={"odds": [{"pinnacle": 2.0}]}))
+    dg = client(transport)
+    assert dg.make_request("get-player-list") == {"odds": [{"pinnacle": 2.0}]}
+    assert transport.calls[0][1] == {"key": API_KEY}
+    formats = dg.make_request("betting-tools/outrights", {"odds_format": "all"})
+    assert formats["percent"]["odds"][0]["pinnacle"] == 0.5
@@ -0,0 +1,24 @@
+from sdk.datagolf_sdk import DataGolfSDK
+from sdk.transport import HTTPTransport
+from tests.conftest import API_KEY, FakeResponse, FakeTransport
+
+
+def test_make_request_sends_key_and_decodes_json(client):
+    transport = FakeTransport(FakeResponse(body={"players": [1, 2]}))
+    dg = client(transport)
+    assert dg.get_player_list() == {"players": [1, 2]}
+    url, params = transport.calls[0]
+    assert url == "https://feeds.datagolf.com/get-player-list"
+    assert params == {"file_format": "json", "key": API_KEY}
+
+
+def test_pooled_client_reuses_its_session(stub_server):
+    with DataGolfSDK(API_KEY, base_url=stub_server.base_url, decoder="json") as dg:
+        assert isinstance(dg.transport, HTTPTransport)
+        players = dg.get_player_list()
+        rankings = dg.get_dg_rankings(file_format="csv")
+        session = dg.transport.session
+        dg.get_player_list()
+        assert dg.transport.session is session
+    assert len(players) == 20
+    assert len(rankings.splitlines()) == 21